@@ -32,6 +32,7 @@ requires = [
 ]
 testing_extras = [
     "pytest",
+    "pytest-benchmark",
     "mypy",
     "pyramid_mako",
     "webob",
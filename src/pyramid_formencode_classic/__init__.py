@@ -3,18 +3,24 @@ import logging
 from typing import TYPE_CHECKING
 
 # pypi
+from pyramid.settings import asbool
 import webob.compat
 
 # local
 from .api import form_reprint  # noqa: F401 ; maintain API
 from .api import form_validate  # noqa: F401 ; maintain API
+from .api import form_validate_async  # noqa: F401 ; maintain API
 from .exceptions import BaseException  # noqa: F401 ; maintain API
 from .exceptions import CsrfInvalid  # noqa: F401 ; maintain API
 from .exceptions import FormFieldInvalid  # noqa: F401 ; maintain API
 from .exceptions import FormInvalid  # noqa: F401 ; maintain API
 from .exceptions import ValidationStop  # noqa: F401 ; maintain API
+from .limits import SubmissionLimits  # noqa: F401 ; maintain API
+from .objects import _EmptyFormStash
 from .objects import FormStash  # noqa: F401 ; maintain API
 from .objects import FormStashList  # noqa: F401 ; maintain API
+from .objects import FormStashSlotted  # noqa: F401 ; maintain API
+from .objects import ReprintProfile  # noqa: F401 ; maintain API
 
 if TYPE_CHECKING:
     from pyramid.config import Configurator
@@ -51,6 +57,10 @@ def _form_cleanup(request: "Request") -> None:
     make sure we close all fieldstorage objects
     """
     for _form in set(request.pyramid_formencode_classic.values()):
+        if isinstance(_form, _EmptyFormStash):
+            # never validated, so there are no results; reading them would
+            # promote the placeholder
+            continue
         for k, v in list(_form.results.items()):
             try:
                 # don't compare to Boolean, as some Form objects can't handle that
@@ -74,7 +84,16 @@ def _new_request_FormStashList(request: "Request") -> FormStashList:
 def includeme(config: "Configurator") -> None:
     """
     pyramid hook for setting up a form method via the configurator
+
+    ``pyramid_formencode_classic.*`` settings configure `_defaults`; see
+    `config.apply_settings`.  ``pyramid_formencode_classic.automatic_cleanup``
+    sets `AUTOMATIC_CLEANUP`.
     """
+    global AUTOMATIC_CLEANUP
+    _cleanup = config.get_settings().get("pyramid_formencode_classic.automatic_cleanup")
+    if _cleanup is not None:
+        AUTOMATIC_CLEANUP = asbool(_cleanup)
+    config.include(".config")
     config.add_request_method(
         _new_request_FormStashList, "pyramid_formencode_classic", reify=True
     )
@@ -1,4 +1,10 @@
 import os
+from typing import Callable
+from typing import Optional
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .limits import SubmissionLimits
 
 # ==============================================================================
 
@@ -8,3 +14,52 @@ DEFAULT_ERROR_MAIN_KEY = "Error_Main"
 DEFAULT_ERROR_MAIN_TEXT = "There was an error with your form."
 DEFAULT_ERROR_FIELD_TEXT = "This field has an error."
 DEFAULT_ERROR_NOTHING_SUBMITTED = "Nothing submitted."
+DEFAULT_ERROR_LIMITS_TEXT = "The submission is too large."
+
+# compiled validation plans; see `compiled.CompiledSchema`
+USE_COMPILED_SCHEMAS = True
+COMPILED_SCHEMA_CACHE_SIZE = 256
+
+# pre-parsed htmlfill documents; see `fillplans.FillPlan`
+USE_FILL_PLANS = False
+FILL_PLAN_CACHE_SIZE = 64
+
+# skip htmlfill on markup without fillable tags; see `fillplans.is_fillable`
+SKIP_UNFILLABLE_REPRINTS = True
+
+# distinct errors cached per formatter; see `formatters.memoize_formatter`
+FORMATTER_CACHE_SIZE = 1024
+
+# compact form stashes; see `objects.FormStashSlotted`
+USE_SLOTTED_FORMSTASH = False
+
+# placeholder stashes from `get_form`; see `objects._EmptyFormStash`
+USE_LAZY_FORMSTASH = False
+
+# limits checked before validating; see `limits.SubmissionLimits`
+SUBMISSION_LIMITS: Optional["SubmissionLimits"] = None
+
+# drop fields the schema would filter; see `CompiledSchema.prefilter_field_names`
+PREFILTER_FIELDS = False
+
+# read params through a lazy view; see `params.MixedParamsView`
+USE_PARAMS_VIEW = False
+
+# collect errors without raising; see `compiled.CompiledSchema.validate`
+USE_VALIDATION_RESULTS = False
+
+# check the csrf token before validating; see `form_validate(csrf_early=...)`
+CSRF_EARLY = False
+
+# streaming multipart validation; see `streaming.stream_multipart`
+USE_STREAMING_MULTIPART = False
+STREAMING_CHUNK_SIZE = 65536
+
+# rows per chunk sent to a worker; see `bulk.validate_many(processes=...)`
+BULK_CHUNK_SIZE = 500
+# chunks pending on an executor; see `bulk.validate_many(max_in_flight=...)`
+BULK_MAX_IN_FLIGHT = 4
+
+# per-phase timings; see `instrumentation.PhaseTimer`
+COLLECT_TIMINGS = False
+TIMINGS_COLLECTOR: Optional[Callable] = None  # see `instrumentation.TYPE_COLLECTOR`
@@ -1,11 +1,14 @@
 # stdlib
+import asyncio
 import logging
 from typing import Any
 from typing import Callable
 from typing import Dict
+from typing import Mapping
 from typing import Optional
 from typing import Tuple
 from typing import TYPE_CHECKING
+from typing import Union
 
 # pypi
 import formencode
@@ -17,14 +20,35 @@ from webob.multidict import MultiDict
 
 # local
 from . import _defaults
+from . import fillplans
+from . import variabledecode
+from .compiled import CompiledSchema
+from .compiled import get_compiled_schema
+from .compiled import ValidationResult
 from .exceptions import FormInvalid
 from .exceptions import ValidationStop
 from .formatters import formatter_nobr  # default formatter
+from .instrumentation import ENVIRON_COLLECT_TIMINGS
+from .instrumentation import PhaseTimer
+from .instrumentation import TYPE_COLLECTOR
+from .limits import LimitExceeded
+from .limits import SubmissionLimits
+from .objects import ErrorsDict
 from .objects import FormStash
+from .objects import FormStashSlotted
+from .objects import ReprintProfile
+from .params import MixedParamsView
+from .registry import get_form_schema
+from .streaming import is_streamable
+from .streaming import stream_multipart
+from .utils import csrf_token_matches
 from .utils import determine_response_charset
 from .utils import encode_formencode_errors
+from .validators import AsyncValidator
 
 if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
     from formencode import Schema
     from pyramid.request import Request
     from pyramid.response import Response
@@ -38,7 +62,7 @@ log = logging.getLogger("pyramid_formencode_classic")
 
 def _form_validate_core(
     request: "Request",
-    schema: "Schema",
+    schema: Union["Schema", str],
     form_stash: Optional[str] = None,  # name of stash
     formStash: Optional[FormStash] = None,  # a subclassed object; WHY?
     validate_post: bool = True,
@@ -52,13 +76,25 @@ def _form_validate_core(
     error_main_key: Optional[str] = None,
     error_string_key: str = "Error_String",
     error_no_submission_text: Optional[str] = None,
+    error_limits_text: Optional[str] = None,
     raise_FormInvalid: bool = False,
     csrf_name: str = "csrf_",
     csrf_token: Optional[str] = None,
+    csrf_early: Optional[bool] = None,
     is_unicode_params: bool = False,
     foreach_defense: bool = True,
     debug_fails: Optional[bool] = None,
     allow_empty: Optional[bool] = None,
+    use_compiled_schema: Optional[bool] = None,
+    use_slotted_formstash: Optional[bool] = None,
+    use_streaming_multipart: Optional[bool] = None,
+    executor: Optional["Executor"] = None,
+    limits: Optional[SubmissionLimits] = None,
+    prefilter_fields: Optional[bool] = None,
+    use_params_view: Optional[bool] = None,
+    use_validation_results: Optional[bool] = None,
+    collect_timings: Optional[bool] = None,
+    timings_collector: Optional[TYPE_COLLECTOR] = None,
 ) -> Tuple[bool, FormStash]:
     """form validation only: returns True/False ; sets up Errors ;
 
@@ -82,7 +118,8 @@ def _form_validate_core(
         A pyramid.request.Request object
 
     ``schema`` required
-        Refers to a FormEncode Schema object to use during validation.
+        Refers to a FormEncode Schema object to use during validation, or the
+        name it was registered as with ``config.add_form_schema``.
 
     ``form_stash`` (pyramid_formencode_classic._defaults.DEFAULT_FORM_STASH = '_default')
         Name of the attribute the FormStash will be saved into.
@@ -122,6 +159,16 @@ def _form_validate_core(
     ``error_main_key`` ('Error_Main')
         If there are any errors that occur, this will be the key they are dropped into.
 
+    ``csrf_name`` ('csrf_'), ``csrf_token`` (None)
+        If ``csrf_token`` is provided, the submitted ``csrf_name`` must match
+        it. The tokens are compared in constant time.
+
+    ``csrf_early`` (None)
+        Boolean. If true, the csrf token is checked before the schema runs,
+        and is read from the validated params (``validate_params``, or the
+        GET/POST selection) instead of ``request.params``. A mismatch stops
+        validation immediately. Defaults to ``_defaults.CSRF_EARLY``.
+
     ``error_main_text`` ('There was an error with your form submittion.')
         If there are any errors that occur, this will drop an error in the key that
         corresponds to ``error_main_key``.
@@ -145,6 +192,87 @@ def _form_validate_core(
         Boolean. If true, will not raise an special `*nothing_submitted` error if
         no params are presented.  This allows for the package to process empty POSTs
         which will use formencode's `if_mising` to supply a default value.
+
+    ``use_compiled_schema`` (None)
+        Boolean. If true, the schema is validated through a cached
+        ``compiled.CompiledSchema`` plan instead of ``schema.to_python``.
+        Defaults to ``_defaults.USE_COMPILED_SCHEMAS``.
+
+    ``use_slotted_formstash`` (None)
+        Boolean. If true, a compact ``objects.FormStashSlotted`` is created
+        instead of a ``FormStash``. Ignored if ``formStash`` is provided.
+        Defaults to ``_defaults.USE_SLOTTED_FORMSTASH``.
+
+    ``use_streaming_multipart`` (None)
+        Boolean. If true, an unparsed ``multipart/form-data`` POST body is read
+        through ``streaming.stream_multipart``, which rejects the submission as
+        soon as the csrf token or a scalar field fails, before any remaining
+        uploads are read.
+        An accepted body costs more than it would without streaming: it is
+        copied into a ``tempfile.SpooledTemporaryFile`` as it is scanned
+        (spooling to disk past ``request.request_body_tempfile_limit``), then
+        parsed again by webob from that copy, which spools the uploads once
+        more. Only enable this where rejected submissions are common enough to
+        outweigh that second pass.
+        Defaults to ``_defaults.USE_STREAMING_MULTIPART``.
+
+    ``executor`` (None)
+        A ``concurrent.futures.Executor``, such as a bounded
+        ``ThreadPoolExecutor``. If provided, the schema is validated through
+        its ``compiled.CompiledSchema`` plan, with each field validator
+        submitted to the executor; chained validators run once every field has
+        resolved. Useful for independent, I/O bound field validators.
+        Fields are validated serially if a ``state`` is provided, as the
+        validators would share it.
+
+    ``limits`` (None)
+        A ``limits.SubmissionLimits``. The submission is checked against it
+        before the body is parsed (``Content-Length``) and before the schema
+        runs; a submission exceeding it is rejected with ``error_limits_text``
+        as the main error, and its values are not kept as the form defaults.
+        Defaults to the limits registered with a named schema, then
+        ``_defaults.SUBMISSION_LIMITS``.
+
+    ``error_limits_text`` (None)
+        The main error for a submission exceeding ``limits``.
+        Defaults to ``_defaults.DEFAULT_ERROR_LIMITS_TEXT``.
+
+    ``prefilter_fields`` (None)
+        Boolean. If true, and the schema would discard extra fields itself
+        (``allow_extra_fields`` and ``filter_extra_fields``, without
+        ``pre_validators``), only the params of the schema's fields are
+        passed to it; see ``CompiledSchema.prefilter``. The form defaults are
+        always the entire submission.
+        Defaults to ``_defaults.PREFILTER_FIELDS``.
+
+    ``use_params_view`` (None)
+        Boolean. If true, the params are read through a lazy
+        ``params.MixedParamsView`` instead of a ``MultiDict.mixed()`` copy.
+        The form defaults are then the view. With ``prefilter_fields``, the
+        schema's fields are resolved in a single pass, and the extra fields
+        are only copied if the defaults are read, e.g. by a reprint.
+        Ignored with ``variable_decode``.
+        Defaults to ``_defaults.USE_PARAMS_VIEW``.
+
+    ``use_validation_results`` (None)
+        Boolean. If true, a compiled schema is validated with
+        ``CompiledSchema.validate``, which collects the field errors into a
+        ``compiled.ValidationResult`` instead of raising a compound
+        ``Invalid``; the errors are then unpacked once, iteratively
+        (``utils.unpack_errors``).
+        Defaults to ``_defaults.USE_VALIDATION_RESULTS``.
+
+    ``collect_timings`` (None)
+        Boolean. If true, the ``time.perf_counter_ns`` duration of each phase
+        (``limits``, ``streaming``, ``params``, ``variable_decode``, ``to_python``,
+        ``unpack_errors``, ``foreach_defense``, ``csrf``, ``total``) is
+        recorded onto ``formStash.timings["validate"]``.
+        Defaults to ``_defaults.COLLECT_TIMINGS``.
+
+    ``timings_collector`` (None)
+        A callable invoked as ``timings_collector(formStash, "validate",
+        timings)``; see ``instrumentation``. Providing a collector enables
+        ``collect_timings``. Defaults to ``_defaults.TIMINGS_COLLECTOR``.
     """
     if __debug__:
         log.debug("form_validate - starting...")
@@ -152,6 +280,14 @@ def _form_validate_core(
         raise ValueError("`request` is required")
     if not schema:
         raise ValueError("`schema` is required")
+    # a registered schema carries its own compiled plan
+    compiled: Optional[CompiledSchema] = None
+    if isinstance(schema, str):
+        registered = get_form_schema(request.registry, schema)
+        schema = registered.schema
+        compiled = registered.compiled
+        if limits is None:
+            limits = registered.limits
 
     # delayed defaults
     if form_stash is None:
@@ -162,10 +298,42 @@ def _form_validate_core(
         error_main_key = _defaults.DEFAULT_ERROR_MAIN_KEY
     if error_no_submission_text is None:
         error_no_submission_text = _defaults.DEFAULT_ERROR_NOTHING_SUBMITTED
+    if error_limits_text is None:
+        error_limits_text = _defaults.DEFAULT_ERROR_LIMITS_TEXT
+    if limits is None:
+        limits = _defaults.SUBMISSION_LIMITS
+    if prefilter_fields is None:
+        prefilter_fields = _defaults.PREFILTER_FIELDS
+    if use_params_view is None:
+        use_params_view = _defaults.USE_PARAMS_VIEW
+    if use_validation_results is None:
+        use_validation_results = _defaults.USE_VALIDATION_RESULTS
+    if variable_decode:
+        # decoding reads every key
+        use_params_view = False
+    if use_compiled_schema is None:
+        use_compiled_schema = _defaults.USE_COMPILED_SCHEMAS
+    if use_slotted_formstash is None:
+        use_slotted_formstash = _defaults.USE_SLOTTED_FORMSTASH
+    if use_streaming_multipart is None:
+        use_streaming_multipart = _defaults.USE_STREAMING_MULTIPART
+    if csrf_early is None:
+        csrf_early = _defaults.CSRF_EARLY
+    if timings_collector is None:
+        timings_collector = _defaults.TIMINGS_COLLECTOR
+    if collect_timings is None:
+        collect_timings = _defaults.COLLECT_TIMINGS or (
+            ENVIRON_COLLECT_TIMINGS in request.environ
+        )
+
+    timer = None
+    if collect_timings or (timings_collector is not None):
+        timer = PhaseTimer("validate")
 
     errors = {}
     if formStash is None:
-        formStash = FormStash(
+        _class = FormStashSlotted if use_slotted_formstash else FormStash
+        formStash = _class(
             schema=schema,
             name=form_stash,
             error_main_key=error_main_key,
@@ -182,6 +350,53 @@ def _form_validate_core(
             )
 
     try:
+        # the body is only measured once; parsed params are measured below
+        limits_content_length = False
+        if (limits is not None) and (validate_params is None) and validate_post:
+            try:
+                limits.check_content_length(request.content_length)
+            except LimitExceeded as exc:
+                _form_limits_exceeded(formStash, exc, error_limits_text)
+            # `request.params` also carries the query string
+            limits_content_length = bool(request.content_length) and not validate_get
+
+        if (
+            use_streaming_multipart
+            and (validate_params is None)
+            and validate_post
+            and is_streamable(request)
+        ):
+            streamed = stream_multipart(
+                request,
+                schema,
+                csrf_name=csrf_name,
+                csrf_token=csrf_token,
+                validate_fields=not variable_decode,
+                state=state,
+            )
+            if streamed.is_rejected:
+                if __debug__:
+                    log.debug("form_validate - streamed body was rejected")
+                formStash.is_submitted_vars = True
+                formStash.parsed_form["defaults"] = streamed.values.mixed()
+                for _field, _message in streamed.errors.items():
+                    formStash.set_error(field=_field, message=_message)
+                if streamed.is_error_csrf:
+                    formStash.set_error(
+                        field=formStash.csrf_error_field,
+                        message=formStash.csrf_error_string,
+                        is_error_csrf=True,
+                    )
+                    formStash.is_error_csrf = True
+                elif error_main_text:
+                    formStash.set_error(
+                        field=formStash.error_main_key,
+                        message=error_main_text,
+                    )
+                raise ValidationStop("streamed body was rejected")
+            if timer:
+                timer.lap("streaming")
+
         # if we don't pass in ``validate_params``...
         # we must validate via GET, POST or BOTH
         if validate_params is None:
@@ -199,16 +414,60 @@ def _form_validate_core(
                 raise ValidationStop("no `validate_params`")
         if TYPE_CHECKING:
             assert isinstance(validate_params, MultiDict)
-        _validate_params: Dict = validate_params.mixed()
 
+        if limits is not None:
+            try:
+                limits.check_params(
+                    validate_params, check_bytes=not limits_content_length
+                )
+            except LimitExceeded as exc:
+                _form_limits_exceeded(formStash, exc, error_limits_text)
+            if timer:
+                timer.lap("limits")
+
+        if csrf_early and (csrf_token is not None):
+            if not csrf_token_matches(validate_params.get(csrf_name), csrf_token):
+                if __debug__:
+                    log.debug("form_validate - csrf token failed the early gate")
+                formStash.is_submitted_vars = True
+                formStash.parsed_form["defaults"] = validate_params.mixed()
+                formStash.set_error(
+                    field=formStash.csrf_error_field,
+                    message=formStash.csrf_error_string,
+                    is_error_csrf=True,
+                )
+                formStash.is_error_csrf = True
+                if timer:
+                    timer.lap("csrf")
+                raise ValidationStop("csrf token failed the early gate")
+            if timer:
+                timer.lap("csrf")
+
+        _validate_params: Mapping
+        if use_params_view:
+            _validate_params = MixedParamsView(validate_params)
+        else:
+            _validate_params = validate_params.mixed()
+        if timer:
+            timer.lap("params")
+
+        decoded_params: Mapping
         if variable_decode:
             if __debug__:
                 log.debug("form_validate - running variable_decode on params")
-            decoded_params = formencode.variabledecode.variable_decode(
-                _validate_params, dict_char, list_char
-            )
+            try:
+                decoded_params = variabledecode.variable_decode(
+                    _validate_params,
+                    dict_char,
+                    list_char,
+                    max_list_length=limits.max_list_length if limits else None,
+                )
+            except LimitExceeded as exc:
+                _form_limits_exceeded(formStash, exc, error_limits_text)
         else:
             decoded_params = _validate_params
+        if timer:
+            timer.lap("variable_decode")
 
         # if there are no params to validate against, then just stop
         # TODO: test how there are no `decoded_params` after
@@ -221,21 +480,65 @@ def _form_validate_core(
             raise ValidationStop("no `decoded_params`")
         formStash.is_submitted_vars = True
 
+        # only the schema's fields are validated, if it would discard the rest;
+        # the entire submission is kept as the defaults
+        schema_params: Mapping = decoded_params
+        if prefilter_fields:
+            if compiled is None:
+                compiled = get_compiled_schema(schema)
+            prefiltered = compiled.prefilter(decoded_params)
+            if prefiltered is not None:
+                schema_params = prefiltered
+
         # initialize our results
         results = {}
 
         if __debug__:
             log.debug("form_validate - validating against a schema")
+        validated: Optional[ValidationResult] = None
         try:
-            results = schema.to_python(decoded_params)
+            if (executor is not None) or use_compiled_schema:
+                if compiled is None:
+                    compiled = get_compiled_schema(schema)
+                if use_validation_results:
+                    validated = compiled.validate(
+                        schema_params,
+                        state,
+                        executor=executor,
+                        field_timings=timer.validators if timer else None,
+                    )
+                    if validated.is_valid:
+                        results = validated.results
+                else:
+                    results = compiled.to_python(
+                        schema_params,
+                        state,
+                        executor=executor,
+                        field_timings=timer.validators if timer else None,
+                    )
+            else:
+                results = schema.to_python(schema_params, state)
         except formencode.Invalid as e:
+            if timer:
+                timer.lap("to_python")
             errors = e.unpack_errors(variable_decode, dict_char, list_char)
             if isinstance(errors, str):
                 errors = {error_string_key: errors}
+            if timer:
+                timer.lap("unpack_errors")
+        else:
+            if timer:
+                timer.lap("to_python")
+            if (validated is not None) and not validated.is_valid:
+                errors = validated.unpack_errors(variable_decode, dict_char, list_char)
+                if isinstance(errors, str):
+                    errors = {error_string_key: errors}
+                if timer:
+                    timer.lap("unpack_errors")
         formStash.is_parsed = True
 
         formStash.parsed_form["defaults"] = decoded_params
-        formStash.parsed_form["errors"] = errors
+        formStash.parsed_form["errors"] = errors = ErrorsDict(errors)
         formStash.parsed_form["results"] = results
 
         if errors:
@@ -249,15 +552,17 @@ def _form_validate_core(
                             ", ".join([i for i in errors[_error_key] if i]) or "error"
                         )
                         errors[_error_key] = _error_condensed
+                if timer:
+                    timer.lap("foreach_defense")
             if error_main_text:
                 # don't raise an error, because we have to stash the form
                 formStash.set_error(
                     field=formStash.error_main_key,
                     message=error_main_text,
                 )
-        else:
+        elif not csrf_early:
             if csrf_token is not None:
-                if request.params.get(csrf_name) != csrf_token:
+                if not csrf_token_matches(request.params.get(csrf_name), csrf_token):
                     # don't raise an error, because we have to stash the form
                     formStash.set_error(
                         field=formStash.csrf_error_field,
@@ -265,12 +570,17 @@ def _form_validate_core(
                         is_error_csrf=True,
                     )
                     formStash.is_error_csrf = True
+                if timer:
+                    timer.lap("csrf")
 
     except ValidationStop as exc:  # noqa: F841
         if __debug__:
             log.debug("form_validate - encountered a ValidationStop")
         pass
 
+    if timer:
+        timer.finish(formStash, timings_collector)
+
     # save the form onto the request
     request.pyramid_formencode_classic[form_stash] = formStash
 
@@ -288,8 +598,24 @@ def _form_validate_core(
     return (not formStash.is_error, formStash)
 
 
+def _form_limits_exceeded(
+    formStash: FormStash,
+    exc: LimitExceeded,
+    error_limits_text: str,
+) -> None:
+    """
+    Rejects a submission which exceeded its `SubmissionLimits`.  The
+    submitted values are not stashed, so they are never reprinted.
+    """
+    if __debug__:
+        log.debug("form_validate - exceeded `%s`: %s", exc.limit, exc)
+    formStash.is_submitted_vars = True
+    formStash.set_error(field=formStash.error_main_key, message=error_limits_text)
+    raise ValidationStop("exceeded `%s`" % exc.limit)
+
+
 def form_validate(
-    request: "Request", schema: "Schema", **kwargs
+    request: "Request", schema: Union["Schema", str], **kwargs
 ) -> Tuple[bool, FormStash]:
     result = _form_validate_core(request, schema, **kwargs)
     if TYPE_CHECKING:
@@ -297,6 +623,75 @@ def form_validate(
     return result
 
 
+async def form_validate_async(
+    request: "Request", schema: Union["Schema", str], **kwargs
+) -> Tuple[bool, FormStash]:
+    """
+    An asynchronous `form_validate`.
+
+    The submission is validated by `form_validate`.  If it is valid, every
+    top-level `validators.AsyncValidator` field of the schema is then
+    awaited concurrently via `asyncio.gather`, with the field's result as
+    its value.  Failures are set onto the `FormStash` as field errors, just
+    as `form_validate` would; values returned by the validators replace the
+    field's result.
+
+    All kwargs of `form_validate` are supported.  ``raise_FormInvalid`` is
+    honored after the asynchronous validators have completed.
+
+    Note: ``chained_validators`` run during the synchronous pass, so they see
+    the values before the asynchronous conversion.
+    """
+    raise_FormInvalid = kwargs.pop("raise_FormInvalid", False)
+    (result, formStash) = form_validate(request, schema, **kwargs)
+    if result:
+        fields = getattr(formStash.schema, "fields", None) or {}
+        async_fields = [
+            name
+            for (name, validator) in fields.items()
+            if isinstance(validator, AsyncValidator) and name in formStash.results
+        ]
+        if async_fields:
+            if __debug__:
+                log.debug("form_validate_async - awaiting %s", async_fields)
+            state = kwargs.get("state")
+            outcomes = await asyncio.gather(
+                *[
+                    fields[name].to_python_async(formStash.results[name], state)
+                    for name in async_fields
+                ],
+                return_exceptions=True,
+            )
+            errors = False
+            for name, outcome in zip(async_fields, outcomes):
+                if isinstance(outcome, formencode.Invalid):
+                    formStash.set_error(field=name, message=str(outcome))
+                    errors = True
+                elif isinstance(outcome, BaseException):
+                    raise outcome
+                else:
+                    formStash.parsed_form["results"][name] = outcome
+            if errors:
+                error_main_text = kwargs.get("error_main_text")
+                if error_main_text is None:
+                    error_main_text = _defaults.DEFAULT_ERROR_MAIN_TEXT
+                if error_main_text:
+                    formStash.set_error(
+                        field=formStash.error_main_key,
+                        message=error_main_text,
+                    )
+    if formStash.is_error:
+        if raise_FormInvalid:
+            raise FormInvalid(
+                formStash,
+                error_main=kwargs.get("error_main_text"),
+                error_no_submission_text=kwargs.get("error_no_submission_text"),
+                integrate_special_errors=True,
+                raised_by="form_validate_async",
+            )
+    return (not formStash.is_error, formStash)
+
+
 def form_reprint(
     request: "Request",
     form_print_method: Optional[Callable],
@@ -305,6 +700,11 @@ def form_reprint(
     render_view_template: Optional[str] = None,
     auto_error_formatter: Callable = formatter_nobr,
     error_formatters: Optional[Dict[str, Callable]] = None,
+    use_fill_plans: Optional[bool] = None,
+    skip_unfillable: Optional[bool] = None,
+    reprint_profile: Optional[ReprintProfile] = None,
+    collect_timings: Optional[bool] = None,
+    timings_collector: Optional[TYPE_COLLECTOR] = None,
     **htmlfill_kwargs,
 ) -> "Response":
     """reprint a form
@@ -318,11 +718,49 @@ def form_reprint(
     ``error_formatters`` (default None) is a dict of error formatters to be passed into
         htmlfill. in order to ensure compatibilty, this dict will be merged with a copy
         of the htmlfill defaults, allowing you to override them or add extras.
+    ``use_fill_plans`` (default None) -- render against a cached
+        ``fillplans.FillPlan`` of the form markup, which skips re-parsing
+        identical markup. Defaults to ``_defaults.USE_FILL_PLANS``.
+    ``skip_unfillable`` (default None) -- return the response untouched,
+        without running htmlfill, if there are no errors to insert and a
+        pre-scan of the markup finds no tags htmlfill would rewrite. See
+        ``fillplans.is_fillable``. Defaults to
+        ``_defaults.SKIP_UNFILLABLE_REPRINTS``.
+    ``reprint_profile`` (default None) -- an ``objects.ReprintProfile``
+        holding precomputed htmlfill options. ``auto_error_formatter`` is
+        ignored, and ``error_formatters`` or ``**htmlfill_kwargs`` can not
+        be combined with a profile.
+    ``collect_timings`` (default None) -- record the duration of each phase
+        (``print_method``, ``charset``, ``htmlfill``, ``total``) onto
+        ``formStash.timings["reprint"]``. Defaults to
+        ``_defaults.COLLECT_TIMINGS``.
+    ``timings_collector`` (default None) -- a callable invoked as
+        ``timings_collector(formStash, "reprint", timings)``. Defaults to
+        ``_defaults.TIMINGS_COLLECTOR``.
     `**htmlfill_kwargs` -- passed on to htmlfill
     """
     if __debug__:
         log.debug("form_reprint - starting...")
 
+    if reprint_profile is not None:
+        if (error_formatters is not None) or htmlfill_kwargs:
+            raise ValueError(
+                "`error_formatters` and `htmlfill_kwargs` can not be combined "
+                "with a `reprint_profile`"
+            )
+        auto_error_formatter = reprint_profile.auto_error_formatter
+        error_formatters = reprint_profile.error_formatters  # type: ignore[assignment]
+
+    if timings_collector is None:
+        timings_collector = _defaults.TIMINGS_COLLECTOR
+    if collect_timings is None:
+        collect_timings = _defaults.COLLECT_TIMINGS or (
+            ENVIRON_COLLECT_TIMINGS in request.environ
+        )
+    timer = None
+    if collect_timings or (timings_collector is not None):
+        timer = PhaseTimer("reprint")
+
     response = None
     if form_print_method:
         response = form_print_method()
@@ -352,9 +790,11 @@ def form_reprint(
         return response
 
     formStash = request.pyramid_formencode_classic[form_stash]
+    if timer:
+        timer.lap("print_method")
 
     if __debug__:
-        _debug = {
+        _debug: Dict[str, Any] = {
             "print_method": str(form_print_method),
             "render_view": str(render_view),
             "render_view_template": str(render_view_template),
@@ -391,23 +831,67 @@ def form_reprint(
         encoding = determine_response_charset(response)
         form_content = form_content.decode(encoding)
 
-    # copy these because we don't want to overwrite a dict in place
-    _htmlfill_kwargs = htmlfill_kwargs.copy()
-    _htmlfill_kwargs.setdefault("encoding", request.charset)
-    if error_formatters is not None:
-        _error_formatters = dict(
-            list(formencode.htmlfill.default_formatter_dict.items())
-            + list(error_formatters.items())
-        )
-        _htmlfill_kwargs["error_formatters"] = _error_formatters
+    if timer:
+        timer.lap("charset")
+
+    _htmlfill_kwargs: Mapping[str, Any]
+    if reprint_profile is not None:
+        # frozen at configuration time
+        _encoding = reprint_profile.encoding or request.charset
+        _htmlfill_kwargs = reprint_profile.htmlfill_kwargs
+    else:
+        # copy these because we don't want to overwrite a dict in place
+        _kwargs = htmlfill_kwargs.copy()
+        _encoding = _kwargs.pop("encoding", request.charset)
+        _kwargs["auto_error_formatter"] = auto_error_formatter
+        if error_formatters is not None:
+            _error_formatters = dict(
+                list(formencode.htmlfill.default_formatter_dict.items())
+                + list(error_formatters.items())
+            )
+            _kwargs["error_formatters"] = _error_formatters
+        _htmlfill_kwargs = _kwargs
+
+    if skip_unfillable is None:
+        skip_unfillable = _defaults.SKIP_UNFILLABLE_REPRINTS
+    if (
+        skip_unfillable
+        and not formStash.errors_normal
+        and not _htmlfill_kwargs.get("use_all_keys")
+        and not fillplans.is_fillable(form_content)
+    ):
+        # htmlfill would return `form_content` unchanged
+        if __debug__:
+            log.debug("form_reprint - nothing to fill, skipping htmlfill")
+            _debug["response_size_before"] = _debug["response_size_after"] = len(
+                form_content
+            )
+            _debug["htmlfill"] = None
+        if timer:
+            timer.lap("htmlfill")
+            timer.finish(formStash, timings_collector)
+        return response
+
+    if use_fill_plans is None:
+        use_fill_plans = _defaults.USE_FILL_PLANS
+    _render = fillplans.render if use_fill_plans else formencode.htmlfill.render
+
+    if __debug__:
+        _debug["response_size_before"] = len(form_content)
+        _debug["htmlfill"] = str(_render)
 
     # _form_content = form_content
-    form_content = formencode.htmlfill.render(
+    form_content = _render(
         form_content,
         defaults=formStash.defaults,
         errors=formStash.errors_normal,
-        auto_error_formatter=auto_error_formatter,
+        encoding=_encoding,
         **_htmlfill_kwargs,
     )
     response.text = form_content
+    if __debug__:
+        _debug["response_size_after"] = len(form_content)
+    if timer:
+        timer.lap("htmlfill")
+        timer.finish(formStash, timings_collector)
     return response
@@ -0,0 +1,256 @@
+# stdlib
+import collections
+from concurrent.futures import ProcessPoolExecutor
+import functools
+import itertools
+import logging
+from typing import Any
+from typing import Callable
+from typing import Deque
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import TYPE_CHECKING
+
+# pypi
+import formencode
+
+# local
+from . import _defaults
+from . import variabledecode
+from .compiled import get_compiled_schema
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+    from concurrent.futures import Future
+
+    from formencode import Schema
+
+# ==============================================================================
+
+log = logging.getLogger("pyramid_formencode_classic")
+
+# (ok, results, errors)
+TYPE_ROW_RESULT = Tuple[bool, Dict, Dict]
+
+# the compact record sent back by a worker process: `(ok, results or errors)`
+TYPE_ROW_RECORD = Tuple[bool, Dict]
+
+# installed in each worker process by `_worker_initializer`
+_worker_validate: Optional[Callable[[Any], TYPE_ROW_RESULT]] = None
+
+# ------------------------------------------------------------------------------
+
+
+def validate_row(
+    schema: "Schema",
+    row: Any,
+    variable_decode: bool = False,
+    dict_char: str = ".",
+    list_char: str = "-",
+    state: Optional[Any] = None,
+    error_string_key: str = "Error_String",
+    foreach_defense: bool = True,
+) -> TYPE_ROW_RESULT:
+    """
+    Validates a single `row` (a dict or `MultiDict`) against `schema`, the
+    way `form_validate` validates a submission.
+
+    Returns a tuple of `(ok, results, errors)`.
+    """
+    if hasattr(row, "mixed"):
+        row = row.mixed()
+    if variable_decode:
+        row = variabledecode.variable_decode(row, dict_char, list_char)
+    try:
+        results = get_compiled_schema(schema).to_python(row, state)
+    except formencode.Invalid as e:
+        errors = e.unpack_errors(variable_decode, dict_char, list_char)
+        if isinstance(errors, str):
+            errors = {error_string_key: errors}
+        if foreach_defense:
+            for _error_key in errors:
+                if isinstance(errors[_error_key], list):
+                    errors[_error_key] = (
+                        ", ".join([i for i in errors[_error_key] if i]) or "error"
+                    )
+        return (False, {}, errors)
+    return (True, results, {})
+
+
+def validate_many(
+    schema: "Schema",
+    rows: Iterable[Any],
+    variable_decode: bool = False,
+    dict_char: str = ".",
+    list_char: str = "-",
+    state: Optional[Any] = None,
+    error_string_key: str = "Error_String",
+    foreach_defense: bool = True,
+    executor: Optional["Executor"] = None,
+    processes: Optional[int] = None,
+    chunk_size: Optional[int] = None,
+    max_in_flight: Optional[int] = None,
+) -> Iterator[TYPE_ROW_RESULT]:
+    """
+    Validates many rows, such as the records of a CSV or JSON import, against
+    `schema`.
+
+    This is a generator which yields a tuple of `(ok, results, errors)` for
+    each row, in order.  The schema is compiled once and no `request` or
+    `FormStash` is involved.
+
+    ``schema`` required
+        A FormEncode Schema class or instance.
+
+    ``rows`` required
+        An iterable of dicts or `MultiDict`.
+
+    ``variable_decode``, ``dict_char``, ``list_char``, ``state``,
+    ``error_string_key``, ``foreach_defense``
+        As in `form_validate`.
+
+    ``executor`` (None)
+        A ``concurrent.futures.Executor``. If provided, rows are submitted to
+        it in chunks of ``chunk_size``; a ``ProcessPoolExecutor`` spreads
+        CPU-heavy validators across processes. The schema and options are
+        sent with each chunk, so the schema, rows and ``state`` must be
+        picklable for a process pool. Only a bounded number of chunks are in
+        flight, so ``rows`` is consumed lazily.
+
+    ``processes`` (None)
+        Integer. If provided, a dedicated ``ProcessPoolExecutor`` with this
+        many workers is used instead of ``executor``. The schema and options
+        are sent once to each worker by its initializer; rows are then sent
+        in chunks of ``chunk_size``, and each worker returns compact
+        ``(ok, results or errors)`` records. Only a bounded number of chunks
+        are in flight, so ``rows`` is consumed lazily.
+
+    ``chunk_size`` (None)
+        Integer. The number of rows per chunk with an ``executor`` or
+        ``processes``. Defaults to ``_defaults.BULK_CHUNK_SIZE``.
+
+    ``max_in_flight`` (None)
+        Integer. The most chunks pending at once with an ``executor`` or
+        ``processes``. Defaults to twice ``processes``, or to
+        ``_defaults.BULK_MAX_IN_FLIGHT`` with an ``executor``; size it to the
+        executor's workers so that none sit idle.
+    """
+    if __debug__:
+        log.debug("validate_many - starting...")
+    _validate = functools.partial(
+        validate_row,
+        schema,
+        variable_decode=variable_decode,
+        dict_char=dict_char,
+        list_char=list_char,
+        state=state,
+        error_string_key=error_string_key,
+        foreach_defense=foreach_defense,
+    )
+    if (processes is not None) and (executor is not None):
+        raise ValueError("`executor` and `processes` are mutually exclusive")
+    if chunk_size is None:
+        chunk_size = _defaults.BULK_CHUNK_SIZE
+    if max_in_flight is None:
+        if processes is not None:
+            max_in_flight = processes * 2
+        else:
+            max_in_flight = _defaults.BULK_MAX_IN_FLIGHT
+    if processes is not None:
+        yield from _validate_many_processes(
+            _validate, rows, processes, max_in_flight, chunk_size
+        )
+    elif executor is None:
+        for row in rows:
+            yield _validate(row)
+    else:
+        yield from _validate_many_chunks(
+            executor,
+            functools.partial(_validate_chunk, _validate),
+            rows,
+            max_in_flight,
+            chunk_size,
+        )
+
+
+def _validate_chunk(
+    validate: Callable[[Any], TYPE_ROW_RESULT],
+    chunk: List[Any],
+) -> List[TYPE_ROW_RECORD]:
+    records: List[TYPE_ROW_RECORD] = []
+    for row in chunk:
+        (ok, results, errors) = validate(row)
+        records.append((ok, results if ok else errors))
+    return records
+
+
+def _worker_initializer(validate: Callable[[Any], TYPE_ROW_RESULT]) -> None:
+    global _worker_validate
+    _worker_validate = validate
+
+
+def _worker_validate_chunk(chunk: List[Any]) -> List[TYPE_ROW_RECORD]:
+    validate = _worker_validate
+    if TYPE_CHECKING:
+        assert validate is not None
+    return _validate_chunk(validate, chunk)
+
+
+def _validate_many_chunks(
+    executor: "Executor",
+    validate_chunk: Callable[[List[Any]], List[TYPE_ROW_RECORD]],
+    rows: Iterable[Any],
+    max_in_flight: int,
+    chunk_size: int,
+) -> Iterator[TYPE_ROW_RESULT]:
+    """
+    Submits `rows` to `executor` in chunks, with at most `max_in_flight`
+    chunks pending, and yields the results in order.
+    """
+    rows = iter(rows)
+    in_flight: Deque["Future"] = collections.deque()
+    try:
+        while True:
+            while len(in_flight) < max_in_flight:
+                chunk = list(itertools.islice(rows, chunk_size))
+                if not chunk:
+                    break
+                in_flight.append(executor.submit(validate_chunk, chunk))
+            if not in_flight:
+                break
+            for ok, payload in in_flight.popleft().result():
+                if ok:
+                    yield (True, payload, {})
+                else:
+                    yield (False, {}, payload)
+    finally:
+        # e.g. the generator was closed early
+        for future in in_flight:
+            future.cancel()
+
+
+def _validate_many_processes(
+    validate: Callable[[Any], TYPE_ROW_RESULT],
+    rows: Iterable[Any],
+    processes: int,
+    max_in_flight: int,
+    chunk_size: int,
+) -> Iterator[TYPE_ROW_RESULT]:
+    with ProcessPoolExecutor(
+        max_workers=processes,
+        initializer=_worker_initializer,
+        initargs=(validate,),
+    ) as executor:
+        yield from _validate_many_chunks(
+            executor, _worker_validate_chunk, rows, max_in_flight, chunk_size
+        )
+
+
+__all__ = (
+    "validate_row",
+    "validate_many",
+)
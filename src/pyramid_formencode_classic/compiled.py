@@ -0,0 +1,718 @@
+# stdlib
+from collections import OrderedDict
+import logging
+import threading
+import time
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import FrozenSet
+from typing import List
+from typing import Mapping
+from typing import Optional
+from typing import Set
+from typing import Tuple
+from typing import TYPE_CHECKING
+
+# pypi
+from formencode.api import FancyValidator
+from formencode.api import Invalid
+from formencode.api import NoDefault
+from formencode.schema import format_compound_error
+from formencode.schema import merge_dicts
+from formencode.schema import Schema
+
+# local
+from . import _defaults
+from .params import MixedParamsView
+from .utils import unpack_errors
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+    from concurrent.futures import Future
+
+    from formencode.api import Validator
+
+# ==============================================================================
+
+log = logging.getLogger("pyramid_formencode_classic")
+
+# how a field that was not submitted is handled
+MISSING_DEFAULT = 1  # use `validator.if_missing`
+MISSING_IGNORE = 2  # `Schema.ignore_key_missing`
+MISSING_ERROR = 3  # "Missing value"
+MISSING_KEY_DEFAULT = 4  # validate `Schema.if_key_missing`
+
+# methods which, if overridden, force a fallback to `schema.to_python`
+_COMPILABLE_METHODS = (
+    ("to_python", FancyValidator),
+    ("_convert_to_python", Schema),
+    ("_validate_other", FancyValidator),
+    ("_validate_python", FancyValidator),
+    ("assert_dict", Schema),
+    ("is_empty", Schema),
+    ("_value_is_iterator", Schema),
+)
+
+# ------------------------------------------------------------------------------
+
+
+def _resolve_method_owner(cls: type, name: str) -> Optional[type]:
+    for klass in cls.__mro__:
+        if name in klass.__dict__:
+            return klass
+    return None
+
+
+def _is_compilable(instance: Any) -> bool:
+    """
+    A schema can only be compiled if it uses the stock `formencode.Schema`
+    validation routines; anything customized must run through `to_python`.
+    """
+    if not isinstance(instance, Schema):
+        return False
+    cls = type(instance)
+    for name, owner in _COMPILABLE_METHODS:
+        if name in instance.__dict__:
+            return False
+        if _resolve_method_owner(cls, name) is not owner:
+            return False
+    return True
+
+
+def _value_is_iterator(value: Any) -> bool:
+    """inlined version of `formencode.Schema._value_is_iterator`"""
+    if isinstance(value, (bytes, str)):
+        return False
+    if isinstance(value, (list, tuple)):
+        return True
+    try:
+        for _v in value:
+            break
+        return True
+    except TypeError:
+        return False
+
+
+def _timed(to_python: Callable, name: str, field_timings: Dict[str, int]) -> Callable:
+    """wraps a field's `to_python` to record its duration into `field_timings`"""
+
+    def _to_python(value, state=None):
+        _started = time.perf_counter_ns()
+        try:
+            return to_python(value, state)
+        finally:
+            field_timings[name] = time.perf_counter_ns() - _started
+
+    return _to_python
+
+
+class ValidationResult(object):
+    """
+    The outcome of `CompiledSchema.validate`.
+
+    ``results``
+        The converted value, if the submission is valid.
+
+    ``error_dict``
+        The field errors (`Invalid` or `str`), if the fields failed.  No
+        compound `Invalid` or message is built for them.
+
+    ``invalid``
+        The `Invalid` raised by a pre- or chained validator, or by a schema
+        which is not compiled.
+    """
+
+    __slots__ = (
+        "results",
+        "error_dict",
+        "invalid",
+        "value",
+        "state",
+    )
+
+    results: Any
+    error_dict: Optional[Dict[str, Any]]
+    invalid: Optional[Invalid]
+    value: Any
+    state: Optional[Any]
+
+    def __init__(
+        self,
+        results: Any = None,
+        error_dict: Optional[Dict[str, Any]] = None,
+        invalid: Optional[Invalid] = None,
+        value: Any = None,
+        state: Optional[Any] = None,
+    ):
+        self.results = results
+        self.error_dict = error_dict
+        self.invalid = invalid
+        self.value = value
+        self.state = state
+
+    def __repr__(self) -> str:
+        return "<ValidationResult is_valid=%s>" % self.is_valid
+
+    @property
+    def is_valid(self) -> bool:
+        return (self.error_dict is None) and (self.invalid is None)
+
+    def unpack_errors(
+        self,
+        encode_variables: bool = False,
+        dict_char: str = ".",
+        list_char: str = "-",
+    ) -> Any:
+        """
+        Equivalent to `Invalid.unpack_errors`; see `utils.unpack_errors`.
+        Returns an empty `dict` if the submission is valid.
+        """
+        if self.error_dict is not None:
+            return unpack_errors(
+                self.error_dict, encode_variables, dict_char, list_char
+            )
+        if self.invalid is not None:
+            return unpack_errors(self.invalid, encode_variables, dict_char, list_char)
+        return {}
+
+    def as_invalid(self) -> Optional[Invalid]:
+        """
+        Returns the `Invalid` that `to_python` would have raised, or `None` if
+        the submission is valid.
+        """
+        if self.error_dict is not None:
+            return Invalid(
+                format_compound_error(self.error_dict),
+                self.value,
+                self.state,
+                error_dict=self.error_dict,
+            )
+        return self.invalid
+
+
+class CompiledSchema(object):
+    """
+    A precomputed validation plan for a `formencode.Schema`.
+
+    `formencode.Schema._convert_to_python` re-discovers the fields, the
+    missing-value handling of every field, and which chained validators
+    support partial validation on every invocation.  A `CompiledSchema`
+    computes all of that once, so validating a submission only executes the
+    validators themselves.
+
+    Validation is identical to `schema.to_python`. Schemas which customize
+    the core `formencode.Schema` routines are not compiled; `is_compiled` will
+    be `False` and `to_python` will simply invoke `schema.to_python`.
+
+    If a schema is altered after it was compiled (e.g. `Schema.add_field`),
+    `is_stale` is true and `get_compiled_schema` compiles it again.
+    """
+
+    schema: Any  # the class or instance that was compiled
+    instance: Optional[Schema]  # the object which actually validates
+    is_compiled: bool
+    fields: Dict[str, "Validator"]
+    fields_to_python: Dict[str, Callable]  # bound `validator.to_python`
+    field_names: FrozenSet[str]
+    fields_accept_iterator: FrozenSet[str]
+    fields_missing: Tuple[Tuple[str, "Validator", int, Any], ...]
+    pre_validators: Tuple["Validator", ...]
+    chained_validators: Tuple["Validator", ...]
+    partial_validators: Tuple["Validator", ...]
+    allow_extra_fields: bool
+    filter_extra_fields: bool
+    prefilter_field_names: Optional[FrozenSet[str]]
+    _options: Tuple[Any, ...]  # the options of `instance` which were compiled
+
+    def __init__(self, schema: Any):
+        self.schema = schema
+        instance = schema
+        if isinstance(schema, type):
+            # classes validate through their singleton instance
+            instance = schema.singleton()  # type: ignore[attr-defined]
+        self.is_compiled = _is_compilable(instance)
+        self.prefilter_field_names = None
+        if not self.is_compiled:
+            if __debug__:
+                log.debug("CompiledSchema - `%s` is not compilable", schema)
+            self.instance = None
+            return
+        self.instance = instance
+        self.fields = dict(instance.fields)
+        self.fields_to_python = {
+            name: validator.to_python for (name, validator) in self.fields.items()
+        }
+        self.field_names = frozenset(self.fields.keys())
+        self.fields_accept_iterator = frozenset(
+            name
+            for (name, validator) in self.fields.items()
+            if getattr(validator, "accept_iterator", False)
+        )
+        _fields_missing: List[Tuple[str, "Validator", int, Any]] = []
+        for name, validator in self.fields.items():
+            if_missing = getattr(validator, "if_missing", NoDefault)
+            if if_missing is not NoDefault:
+                _fields_missing.append((name, validator, MISSING_DEFAULT, if_missing))
+            elif instance.ignore_key_missing:
+                _fields_missing.append((name, validator, MISSING_IGNORE, None))
+            elif instance.if_key_missing is NoDefault:
+                _has_message = "missing" in getattr(validator, "_messages", {})
+                _fields_missing.append((name, validator, MISSING_ERROR, _has_message))
+            else:
+                _fields_missing.append(
+                    (name, validator, MISSING_KEY_DEFAULT, instance.if_key_missing)
+                )
+        self.fields_missing = tuple(_fields_missing)
+        self.pre_validators = tuple(instance.pre_validators)
+        self.chained_validators = tuple(instance.chained_validators)
+        self.partial_validators = tuple(
+            validator
+            for validator in self.chained_validators
+            if hasattr(validator, "validate_partial")
+            and getattr(validator, "validate_partial_form", False)
+        )
+        self.allow_extra_fields = instance.allow_extra_fields
+        self.filter_extra_fields = instance.filter_extra_fields
+        self._options = _schema_options(instance)
+        # extra fields may be dropped before validation only if the schema
+        # would drop them itself, and no pre_validator could rely on them
+        if (
+            self.allow_extra_fields
+            and self.filter_extra_fields
+            and not self.pre_validators
+        ):
+            self.prefilter_field_names = self.field_names
+
+    def __repr__(self) -> str:
+        return "<CompiledSchema %s; is_compiled=%s>" % (self.schema, self.is_compiled)
+
+    @property
+    def is_stale(self) -> bool:
+        """
+        `True` if the schema was altered after it was compiled, e.g. by
+        `Schema.add_field`.  Validators are compared by identity.
+        """
+        instance = self.instance
+        if instance is None:
+            # not compiled; `schema.to_python` always sees the current schema
+            return False
+        fields = instance.fields
+        if len(fields) != len(self.fields):
+            return True
+        for name, validator in self.fields.items():
+            if fields.get(name) is not validator:
+                return True
+        return _schema_options(instance) != self._options
+
+    def prefilter(self, params: Mapping) -> Optional[Dict]:
+        """
+        Returns the items of `params` (mixed and, if applicable, decoded)
+        which are the schema's fields, or `None` if the schema must see every
+        submitted field (see `prefilter_field_names`).
+
+        Only the fields are looked up, so a `params.MixedParamsView` does not
+        resolve the extra fields.
+        """
+        if self.prefilter_field_names is None:
+            return None
+        if isinstance(params, MixedParamsView):
+            return params.resolve(self.field_names)
+        return {name: params[name] for name in self.fields if name in params}
+
+    def to_python(
+        self,
+        value: Any,
+        state: Optional[Any] = None,
+        executor: Optional["Executor"] = None,
+        field_timings: Optional[Dict[str, int]] = None,
+    ) -> Any:
+        """
+        Validate `value`; equivalent to `schema.to_python(value, state)`.
+
+        If an `executor` is provided, the field validators are submitted to it
+        and run concurrently; pre- and chained validators run in the calling
+        thread.  The validators share `state`, so fields are validated
+        serially when a `state` is provided.
+
+        If a `field_timings` dict is provided, the `time.perf_counter_ns`
+        duration of each field validator is recorded into it.
+        """
+        if not self.is_compiled:
+            return self.schema.to_python(value, state)
+        fields_to_python = None
+        if field_timings is not None:
+            fields_to_python = {
+                name: _timed(to_python, name, field_timings)
+                for (name, to_python) in self.fields_to_python.items()
+            }
+        instance = self.instance
+        if TYPE_CHECKING:
+            assert instance is not None
+        try:
+            if instance.strip and isinstance(value, str):
+                value = value.strip()
+            elif hasattr(value, "mixed"):
+                value = value.mixed()
+            value = self._convert_to_python(
+                value, state, executor=executor, fields_to_python=fields_to_python
+            )
+        except Invalid:
+            value = instance.if_invalid
+            if value is NoDefault:
+                raise
+        return value
+
+    def validate(
+        self,
+        value: Any,
+        state: Optional[Any] = None,
+        executor: Optional["Executor"] = None,
+        field_timings: Optional[Dict[str, int]] = None,
+    ) -> ValidationResult:
+        """
+        Validate `value` like `to_python`, but return a `ValidationResult`
+        instead of raising an `Invalid`.
+
+        Field errors are collected into `ValidationResult.error_dict`; the
+        compound `Invalid` (and its formatted message) `to_python` raises is
+        never built.  Only pre- and chained validators, and schemas which are
+        not compiled, still raise internally.
+        """
+        if not self.is_compiled:
+            try:
+                return ValidationResult(results=self.schema.to_python(value, state))
+            except Invalid as exc:
+                return ValidationResult(invalid=exc, value=value, state=state)
+        fields_to_python = None
+        if field_timings is not None:
+            fields_to_python = {
+                name: _timed(to_python, name, field_timings)
+                for (name, to_python) in self.fields_to_python.items()
+            }
+        instance = self.instance
+        if TYPE_CHECKING:
+            assert instance is not None
+        try:
+            if instance.strip and isinstance(value, str):
+                value = value.strip()
+            elif hasattr(value, "mixed"):
+                value = value.mixed()
+            result = self._convert_to_python(
+                value,
+                state,
+                executor=executor,
+                fields_to_python=fields_to_python,
+                finish=self._convert_collect,
+            )
+        except Invalid as exc:
+            result = ValidationResult(invalid=exc, value=value, state=state)
+        if not isinstance(result, ValidationResult):
+            # `if_empty`
+            result = ValidationResult(results=result)
+        elif (not result.is_valid) and (instance.if_invalid is not NoDefault):
+            result = ValidationResult(results=instance.if_invalid)
+        return result
+
+    def _convert_to_python(
+        self,
+        value_dict: Any,
+        state: Optional[Any],
+        executor: Optional["Executor"] = None,
+        fields_to_python: Optional[Dict[str, Callable]] = None,
+        finish: Optional[Callable] = None,
+    ) -> Any:
+        """
+        mirrors `formencode.Schema._convert_to_python`
+
+        `finish` replaces `_convert_finish`; see `validate`.
+        """
+        instance = self.instance
+        if TYPE_CHECKING:
+            assert instance is not None
+        if not value_dict:
+            if instance.if_empty is not NoDefault:
+                return instance.if_empty
+            value_dict = {}
+
+        for validator in self.pre_validators:
+            value_dict = validator.to_python(value_dict, state)
+
+        instance.assert_dict(value_dict, state)
+
+        if fields_to_python is None:
+            fields_to_python = self.fields_to_python
+        if (executor is not None) and (state is None):
+            return self._convert_to_python_concurrent(
+                value_dict, executor, fields_to_python, finish=finish
+            )
+
+        fields_accept_iterator = self.fields_accept_iterator
+        new: Dict[str, Any] = {}
+        errors: Dict[str, Any] = {}
+        seen = set()
+        if state is not None:
+            previous_key = getattr(state, "key", None)
+            previous_full_dict = getattr(state, "full_dict", None)
+            state.full_dict = value_dict
+        if isinstance(value_dict, MixedParamsView) and (
+            self.prefilter_field_names is not None
+        ):
+            # only the fields are resolved; extra fields would be discarded
+            _items = list(value_dict.resolve(self.field_names).items())
+        else:
+            _items = list(value_dict.items())
+        try:
+            for name, value in _items:
+                to_python = fields_to_python.get(name)
+                if to_python is None:
+                    if not self.allow_extra_fields:
+                        raise Invalid(
+                            instance.message("notExpected", state, name=repr(name)),
+                            value_dict,
+                            state,
+                        )
+                    if not self.filter_extra_fields:
+                        new[name] = value
+                    continue
+                seen.add(name)
+
+                # are iterators (list, tuple, set, etc) allowed?
+                if _value_is_iterator(value) and name not in fields_accept_iterator:
+                    errors[name] = Invalid(
+                        instance.message("singleValueExpected", state),
+                        value_dict,
+                        state,
+                    )
+
+                if state is not None:
+                    state.key = name
+                try:
+                    new[name] = to_python(value, state)
+                except Invalid as e:
+                    errors[name] = e
+
+            self._convert_missing(new, errors, seen, state)
+
+            if state is not None:
+                state.key = previous_key
+            return (finish or self._convert_finish)(value_dict, new, errors, state)
+
+        finally:
+            if state is not None:
+                state.key = previous_key
+                state.full_dict = previous_full_dict
+
+    def _convert_missing(
+        self,
+        new: Dict[str, Any],
+        errors: Dict[str, Any],
+        seen: Set[str],
+        state: Optional[Any],
+    ) -> None:
+        """handles the fields which were not submitted"""
+        instance = self.instance
+        if TYPE_CHECKING:
+            assert instance is not None
+        for name, validator, missing, payload in self.fields_missing:
+            if name in seen:
+                continue
+            if missing == MISSING_DEFAULT:
+                new[name] = payload
+            elif missing == MISSING_ERROR:
+                message = None
+                if payload:
+                    try:
+                        message = validator.message("missing", state)
+                    except KeyError:
+                        pass
+                if message is None:
+                    message = instance.message("missingValue", state)
+                errors[name] = Invalid(message, None, state)
+            elif missing == MISSING_KEY_DEFAULT:
+                if state is not None:
+                    state.key = name
+                try:
+                    new[name] = validator.to_python(payload, state)
+                except Invalid as e:
+                    errors[name] = e
+            # MISSING_IGNORE: nothing to do
+
+    def _convert_partial(
+        self,
+        value_dict: Dict,
+        errors: Dict[str, Any],
+        state: Optional[Any],
+    ) -> None:
+        """runs the partial validators, merging their errors into `errors`"""
+        for validator in self.partial_validators:
+            try:
+                validator.validate_partial(value_dict, state)
+            except Invalid as e:
+                sub_errors = e.unpack_errors()
+                if not isinstance(sub_errors, dict):
+                    # Can't do anything here
+                    continue
+                merge_dicts(errors, sub_errors)
+
+    def _convert_finish(
+        self,
+        value_dict: Dict,
+        new: Dict[str, Any],
+        errors: Dict[str, Any],
+        state: Optional[Any],
+    ) -> Dict:
+        """runs the partial validators, raises errors, runs chained validators"""
+        self._convert_partial(value_dict, errors, state)
+        if errors:
+            raise Invalid(
+                format_compound_error(errors),
+                value_dict,
+                state,
+                error_dict=errors,
+            )
+
+        for validator in self.chained_validators:
+            new = validator.to_python(new, state)
+
+        return new
+
+    def _convert_collect(
+        self,
+        value_dict: Dict,
+        new: Dict[str, Any],
+        errors: Dict[str, Any],
+        state: Optional[Any],
+    ) -> ValidationResult:
+        """`_convert_finish`, returning the errors instead of raising them"""
+        self._convert_partial(value_dict, errors, state)
+        if errors:
+            return ValidationResult(error_dict=errors, value=value_dict, state=state)
+        try:
+            for validator in self.chained_validators:
+                new = validator.to_python(new, state)
+        except Invalid as exc:
+            return ValidationResult(invalid=exc, value=value_dict, state=state)
+        return ValidationResult(results=new)
+
+    def _convert_to_python_concurrent(
+        self,
+        value_dict: Dict,
+        executor: "Executor",
+        fields_to_python: Dict[str, Callable],
+        finish: Optional[Callable] = None,
+    ) -> Any:
+        """
+        `_convert_to_python`, with the field validators submitted to
+        `executor`.  The results and errors are collected in submission order,
+        so the output is identical to the serial path.
+        """
+        instance = self.instance
+        if TYPE_CHECKING:
+            assert instance is not None
+        fields_accept_iterator = self.fields_accept_iterator
+        new: Dict[str, Any] = {}
+        errors: Dict[str, Any] = {}
+        seen = set()
+        # (name, singleValueExpected error, future)
+        pending: List[Tuple[str, Optional[Invalid], "Future"]] = []
+        for name, value in list(value_dict.items()):
+            to_python = fields_to_python.get(name)
+            if to_python is None:
+                if not self.allow_extra_fields:
+                    for _, _, future in pending:
+                        future.cancel()
+                    raise Invalid(
+                        instance.message("notExpected", None, name=repr(name)),
+                        value_dict,
+                        None,
+                    )
+                if not self.filter_extra_fields:
+                    new[name] = value
+                continue
+            seen.add(name)
+            error_iterator = None
+            if _value_is_iterator(value) and name not in fields_accept_iterator:
+                error_iterator = Invalid(
+                    instance.message("singleValueExpected", None),
+                    value_dict,
+                    None,
+                )
+            # reserve the position of the key in `new`
+            new[name] = None
+            pending.append((name, error_iterator, executor.submit(to_python, value)))
+
+        for name, error_iterator, future in pending:
+            if error_iterator is not None:
+                errors[name] = error_iterator
+            try:
+                new[name] = future.result()
+            except Invalid as e:
+                del new[name]
+                errors[name] = e
+
+        self._convert_missing(new, errors, seen, None)
+        return (finish or self._convert_finish)(value_dict, new, errors, None)
+
+
+# ------------------------------------------------------------------------------
+
+
+_compiled_schemas: "OrderedDict[Any, CompiledSchema]" = OrderedDict()
+_compiled_schemas_lock = threading.Lock()
+
+
+def _schema_options(instance: Schema) -> Tuple[Any, ...]:
+    """the options of `instance`, other than `fields`, which a plan compiles"""
+    return (
+        tuple(instance.pre_validators),
+        tuple(instance.chained_validators),
+        instance.allow_extra_fields,
+        instance.filter_extra_fields,
+        instance.ignore_key_missing,
+        instance.if_key_missing,
+    )
+
+
+def get_compiled_schema(schema: Any) -> CompiledSchema:
+    """
+    Returns the cached `CompiledSchema` for `schema`, compiling it if needed.
+
+    The cache is keyed on the schema class or instance, and is bounded by
+    `_defaults.COMPILED_SCHEMA_CACHE_SIZE` entries.  A cached plan which
+    `is_stale` is compiled again.
+    """
+    with _compiled_schemas_lock:
+        compiled = _compiled_schemas.get(schema)
+        if compiled is not None:
+            if not compiled.is_stale:
+                _compiled_schemas.move_to_end(schema)
+                return compiled
+            if __debug__:
+                log.debug("get_compiled_schema - `%s` is stale", schema)
+    compiled = CompiledSchema(schema)
+    with _compiled_schemas_lock:
+        _compiled_schemas[schema] = compiled
+        while len(_compiled_schemas) > _defaults.COMPILED_SCHEMA_CACHE_SIZE:
+            _compiled_schemas.popitem(last=False)
+    return compiled
+
+
+def invalidate_compiled_schema(schema: Optional[Any] = None) -> None:
+    """
+    Discards the cached `CompiledSchema` for `schema`.
+    If `schema` is `None`, the entire cache is cleared.
+    """
+    with _compiled_schemas_lock:
+        if schema is None:
+            _compiled_schemas.clear()
+        else:
+            _compiled_schemas.pop(schema, None)
+
+
+__all__ = (
+    "CompiledSchema",
+    "ValidationResult",
+    "get_compiled_schema",
+    "invalidate_compiled_schema",
+)
@@ -0,0 +1,263 @@
+# stdlib
+import inspect
+import logging
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Mapping
+from typing import Optional
+from typing import Tuple
+from typing import TYPE_CHECKING
+
+# pypi
+from pyramid.exceptions import ConfigurationError
+from pyramid.path import DottedNameResolver
+from pyramid.renderers import RendererHelper
+from pyramid.settings import asbool
+from pyramid.settings import aslist
+
+# local
+from . import _defaults
+from .compiled import get_compiled_schema
+from .registry import add_form_schema
+
+if TYPE_CHECKING:
+    from pyramid.config import Configurator
+    from pyramid.registry import Registry
+
+# ==============================================================================
+
+log = logging.getLogger("pyramid_formencode_classic")
+
+SETTINGS_PREFIX = "pyramid_formencode_classic."
+_SETTINGS_PREFIX_LEN = len(SETTINGS_PREFIX)
+
+# the warm-up runs after the actions of other includes, such as renderers
+WARMUP_ORDER = 100
+
+# setting name: (`_defaults` attribute, converter)
+_SETTINGS: Dict[str, Any] = {
+    "debug_fails": ("DEBUG_FAILS", asbool),
+    "default_error_main_key": ("DEFAULT_ERROR_MAIN_KEY", str),
+    "default_error_main_text": ("DEFAULT_ERROR_MAIN_TEXT", str),
+    "default_error_field_text": ("DEFAULT_ERROR_FIELD_TEXT", str),
+    "default_error_nothing_submitted": ("DEFAULT_ERROR_NOTHING_SUBMITTED", str),
+    "default_error_limits_text": ("DEFAULT_ERROR_LIMITS_TEXT", str),
+    "use_compiled_schemas": ("USE_COMPILED_SCHEMAS", asbool),
+    "compiled_schema_cache_size": ("COMPILED_SCHEMA_CACHE_SIZE", int),
+    "use_fill_plans": ("USE_FILL_PLANS", asbool),
+    "fill_plan_cache_size": ("FILL_PLAN_CACHE_SIZE", int),
+    "skip_unfillable_reprints": ("SKIP_UNFILLABLE_REPRINTS", asbool),
+    "formatter_cache_size": ("FORMATTER_CACHE_SIZE", int),
+    "use_slotted_formstash": ("USE_SLOTTED_FORMSTASH", asbool),
+    "use_lazy_formstash": ("USE_LAZY_FORMSTASH", asbool),
+    "csrf_early": ("CSRF_EARLY", asbool),
+    "submission_limits": ("SUBMISSION_LIMITS", None),  # a dotted name
+    "prefilter_fields": ("PREFILTER_FIELDS", asbool),
+    "use_params_view": ("USE_PARAMS_VIEW", asbool),
+    "use_validation_results": ("USE_VALIDATION_RESULTS", asbool),
+    "use_streaming_multipart": ("USE_STREAMING_MULTIPART", asbool),
+    "streaming_chunk_size": ("STREAMING_CHUNK_SIZE", int),
+    "bulk_chunk_size": ("BULK_CHUNK_SIZE", int),
+    "bulk_max_in_flight": ("BULK_MAX_IN_FLIGHT", int),
+    "collect_timings": ("COLLECT_TIMINGS", asbool),
+    "timings_collector": ("TIMINGS_COLLECTOR", None),  # a dotted name
+}
+
+# settings which are handled by `includeme`, not `_defaults`
+_SETTINGS_OTHER = (
+    "automatic_cleanup",
+    "warmup",
+    "warmup.schemas",
+    "warmup.templates",
+)
+
+# ------------------------------------------------------------------------------
+
+
+def _accepts(func: Callable, *args: Any) -> Optional[bool]:
+    """
+    Whether `func` can be invoked with `args`, or `None` if its signature can
+    not be inspected.
+    """
+    try:
+        inspect.signature(func).bind(*args)
+    except TypeError:
+        return False
+    except ValueError:
+        return None
+    return True
+
+
+def _as_timings_collector(key: str, value: Any) -> Any:
+    """
+    Returns the collector for a resolved ``timings_collector`` setting, which
+    is either a collector instance or a factory that takes no arguments, e.g.
+    a class.  Anything else raises a `ConfigurationError` now, rather than a
+    `TypeError` on every request.
+    """
+    if inspect.isclass(value) or (_accepts(value, None, "validate", {}) is False):
+        if not callable(value) or (_accepts(value) is False):
+            raise ConfigurationError(
+                "invalid setting `%s`: `%r` is neither a collector nor a "
+                "factory which takes no arguments" % (key, value)
+            )
+        value = value()
+    if not callable(value) or (_accepts(value, None, "validate", {}) is False):
+        raise ConfigurationError(
+            "invalid setting `%s`: `%r` is not a collector; see "
+            "`instrumentation.TYPE_COLLECTOR`" % (key, value)
+        )
+    return value
+
+
+# a dotted name setting: a function which validates or converts the resolved
+# object, invoked with `(key, resolved)`
+_RESOLVED_CONVERTERS: Dict[str, Callable[[str, Any], Any]] = {
+    "timings_collector": _as_timings_collector,
+}
+
+
+class _Warmup(object):
+    """The schemas and templates registered for the warm-up."""
+
+    schemas: List[Any]
+    templates: List[Tuple[str, Any]]  # (renderer name, package)
+
+    def __init__(self):
+        self.schemas = []
+        self.templates = []
+
+
+def apply_settings(
+    settings: Mapping[str, Any],
+    resolver: Optional[DottedNameResolver] = None,
+) -> Dict[str, Any]:
+    """
+    Applies the ``pyramid_formencode_classic.*`` entries of `settings` onto
+    `_defaults`, and returns the values that were applied.
+
+    `_defaults` are module globals, so the settings affect the entire
+    process.  An unknown setting raises a `ConfigurationError`.
+    """
+    if resolver is None:
+        resolver = DottedNameResolver()
+    applied: Dict[str, Any] = {}
+    for key, value in settings.items():
+        if not key.startswith(SETTINGS_PREFIX):
+            continue
+        name = key[_SETTINGS_PREFIX_LEN:]
+        if name in _SETTINGS_OTHER:
+            continue
+        if name not in _SETTINGS:
+            raise ConfigurationError("unknown setting `%s`" % key)
+        (attribute, converter) = _SETTINGS[name]
+        if converter is None:
+            value = resolver.maybe_resolve(value) if value else None
+            if (value is not None) and (name in _RESOLVED_CONVERTERS):
+                value = _RESOLVED_CONVERTERS[name](key, value)
+        else:
+            try:
+                value = converter(value)
+            except ValueError as exc:
+                raise ConfigurationError("invalid setting `%s`: %s" % (key, exc))
+        setattr(_defaults, attribute, value)
+        applied[attribute] = value
+    if __debug__:
+        log.debug("apply_settings - %s", applied)
+    return applied
+
+
+def _get_warmup(registry: "Registry") -> _Warmup:
+    warmup = getattr(registry, "pyramid_formencode_classic_warmup", None)
+    if warmup is None:
+        warmup = registry.pyramid_formencode_classic_warmup = _Warmup()
+    return warmup
+
+
+def add_form_warmup(
+    config: "Configurator",
+    schemas: Iterable[Any] = (),
+    templates: Iterable[str] = (),
+) -> None:
+    """
+    A configurator directive which registers `schemas` (classes, instances or
+    dotted names) to be compiled, and `templates` (renderer asset specs) to be
+    loaded, when the configuration is committed.
+
+    usage::
+
+        config.add_form_warmup(
+            schemas=("myapp.forms.Form_Login",),
+            templates=("myapp:templates/login.mako",),
+        )
+    """
+    warmup = _get_warmup(config.registry)
+    warmup.schemas.extend(config.maybe_dotted(i) for i in schemas)
+    warmup.templates.extend((i, config.package) for i in templates)
+
+
+def warmup(registry: "Registry") -> None:
+    """
+    Compiles the registered schemas, and loads the registered templates
+    through their renderers, so the first requests of a worker do not pay for
+    either.
+
+    A failure is logged rather than raised, as a warm-up must not prevent
+    the application from starting.
+    """
+    _warmup = _get_warmup(registry)
+    if __debug__:
+        log.debug(
+            "warmup - %s schemas, %s templates",
+            len(_warmup.schemas),
+            len(_warmup.templates),
+        )
+    for schema in _warmup.schemas:
+        try:
+            get_compiled_schema(schema)
+        except Exception as exc:
+            log.exception("warmup - could not compile `%s`: %s", schema, exc)
+    for template, package in _warmup.templates:
+        try:
+            renderer = RendererHelper(
+                name=template, package=package, registry=registry
+            ).renderer
+            # template renderers, such as `pyramid_mako`, load on access
+            getattr(renderer, "template", None)
+        except Exception as exc:
+            log.exception("warmup - could not load `%s`: %s", template, exc)
+
+
+def includeme(config: "Configurator") -> None:
+    """
+    Applies the settings, registers the `add_form_warmup` and
+    `add_form_schema` directives and the warm-up action.  Invoked by
+    `pyramid_formencode_classic.includeme`.
+    """
+    settings = config.get_settings() or {}
+    apply_settings(settings, resolver=DottedNameResolver(config.package))
+    config.add_directive("add_form_warmup", add_form_warmup)
+    config.add_directive("add_form_schema", add_form_schema)
+    add_form_warmup(
+        config,
+        schemas=aslist(settings.get(SETTINGS_PREFIX + "warmup.schemas", "")),
+        templates=aslist(settings.get(SETTINGS_PREFIX + "warmup.templates", "")),
+    )
+    if asbool(settings.get(SETTINGS_PREFIX + "warmup", True)):
+        config.action(
+            ("pyramid_formencode_classic", "warmup"),
+            warmup,
+            args=(config.registry,),
+            order=WARMUP_ORDER,
+        )
+
+
+__all__ = (
+    "SETTINGS_PREFIX",
+    "add_form_warmup",
+    "apply_settings",
+    "warmup",
+)
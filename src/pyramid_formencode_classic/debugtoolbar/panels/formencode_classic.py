@@ -6,10 +6,15 @@ from typing import TYPE_CHECKING
 # pypi
 from pyramid_debugtoolbar.panels import DebugPanel
 
+# local
+from ...instrumentation import ENVIRON_COLLECT_TIMINGS
+
 if TYPE_CHECKING:
     from pyramid.request import Request
     from pyramid.response import Response
 
+    from ...objects import FormStash
+
 # ==============================================================================
 
 
@@ -29,13 +34,51 @@ class FormencodeClassicDebugPanel(DebugPanel):
         # so stash the request, then process it under `process_response`
         self.request = request
 
+        # collect timings for every form on this request
+        request.environ[ENVIRON_COLLECT_TIMINGS] = True
+
     def process_response(self, response: "Response") -> None:
         if "pyramid_formencode_classic" in self.request.__dict__.keys():
             self.has_content = True
             forms: Dict = {}
+            summaries: Dict = {}
             for form_stash in self.request.pyramid_formencode_classic.keys():
-                forms[form_stash] = self.request.pyramid_formencode_classic[form_stash]
+                form = self.request.pyramid_formencode_classic[form_stash]
+                forms[form_stash] = form
+                summaries[form_stash] = self._summarize(form)
             self.data["forms"] = forms
+            self.data["summaries"] = summaries
+
+    def _summarize(self, form: "FormStash") -> Dict:
+        """timings in milliseconds, allocations and reprint stats of `form`"""
+        timings = form.timings or {}
+        reprints = list(form._reprints)
+        return {
+            "timings": {
+                event: {phase: ns / 1000000.0 for (phase, ns) in phases.items()}
+                for (event, phases) in timings.items()
+                if event != "validators"
+            },
+            "validators": sorted(
+                (
+                    (ns / 1000000.0, field)
+                    for (field, ns) in timings.get("validators", {}).items()
+                ),
+                reverse=True,
+            ),
+            "allocations": form.allocations or {},
+            # skipped reprints are recorded with an `htmlfill` of `None`
+            "htmlfill_passes": sum(
+                1 for reprint in reprints if reprint.get("htmlfill") is not None
+            ),
+            "response_sizes": [
+                (
+                    reprint.get("response_size_before"),
+                    reprint.get("response_size_after"),
+                )
+                for reprint in reprints
+            ],
+        }
 
     @property
     def nav_title(self) -> str:
@@ -32,7 +32,9 @@ class FormInvalid(BaseException):
     error_main: str
     error_no_submission_text: Optional[str]
     formStash: "FormStash"
-    raised_by: Literal["fatal_form", "fatal_field", "_form_validate_core", None]
+    raised_by: Literal[
+        "fatal_form", "fatal_field", "_form_validate_core", "form_validate_async", None
+    ]
     integrate_special_errors: bool
     error_main_overwrite: bool
     debug_fails: Optional[bool]
@@ -45,7 +47,11 @@ class FormInvalid(BaseException):
         error_no_submission_text: Optional[str] = None,
         integrate_special_errors: bool = True,
         raised_by: Literal[
-            "fatal_form", "fatal_field", "_form_validate_core", None
+            "fatal_form",
+            "fatal_field",
+            "_form_validate_core",
+            "form_validate_async",
+            None,
         ] = None,
         debug_fails: Optional[bool] = None,
     ):
@@ -100,7 +106,11 @@ class FormFieldInvalid(FormInvalid):
         error_main: Optional[str] = None,
         allow_unknown_fields: bool = False,
         raised_by: Literal[
-            "fatal_form", "fatal_field", "_form_validate_core", None
+            "fatal_form",
+            "fatal_field",
+            "_form_validate_core",
+            "form_validate_async",
+            None,
         ] = None,
         integrate_special_errors: bool = True,
         error_no_submission_text: Optional[str] = None,
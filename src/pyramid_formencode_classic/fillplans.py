@@ -0,0 +1,229 @@
+# stdlib
+from collections import OrderedDict
+from html.parser import HTMLParser
+import logging
+import re
+import threading
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+# pypi
+from formencode.htmlfill import default_formatter
+from formencode.htmlfill import FillingParser
+
+# local
+from . import _defaults
+
+# ==============================================================================
+
+log = logging.getLogger("pyramid_formencode_classic")
+
+# (handler name, data or tag, attrs or None, position)
+TYPE_EVENT = Tuple[str, Any, Optional[Tuple[Tuple[str, Optional[str]], ...]], Tuple]
+
+# the handlers `html.parser.HTMLParser` dispatches to while tokenizing
+_HANDLERS = (
+    "handle_starttag",
+    "handle_startendtag",
+    "handle_endtag",
+    "handle_data",
+    "handle_charref",
+    "handle_entityref",
+    "handle_comment",
+    "handle_decl",
+    "handle_pi",
+    "unknown_decl",
+)
+
+# the tags `formencode.htmlfill.FillingParser` rewrites
+_RE_FILLABLE = re.compile(r"<(?:input|select|textarea|option|form:)", re.IGNORECASE)
+
+# ------------------------------------------------------------------------------
+
+
+class _RecordingParser(HTMLParser):
+    """
+    Tokenizes a document exactly as `formencode.rewritingparser.RewritingParser`
+    would, but only records the handler invocations and their positions.
+    """
+
+    events: List[TYPE_EVENT]
+
+    def __init__(self):
+        HTMLParser.__init__(self, convert_charrefs=False)
+        self.events = []
+
+    def handle_starttag(self, tag, attrs):
+        self.events.append(("handle_starttag", tag, tuple(attrs), self.getpos()))
+
+    def handle_startendtag(self, tag, attrs):
+        self.events.append(("handle_startendtag", tag, tuple(attrs), self.getpos()))
+
+
+def _record_handler(name: str) -> Callable:
+    def _handler(self, data):
+        self.events.append((name, data, None, self.getpos()))
+
+    _handler.__name__ = name
+    return _handler
+
+
+for _name in _HANDLERS:
+    if _name not in ("handle_starttag", "handle_startendtag"):
+        setattr(_RecordingParser, _name, _record_handler(_name))
+
+
+class FillPlan(object):
+    """
+    A pre-parsed document for `formencode.htmlfill`.
+
+    `formencode.htmlfill.render` tokenizes the entire document on every
+    invocation.  A `FillPlan` records the tokenization of a document once: the
+    source lines, plus every tag/text event and the offset it occurred at.
+    Rendering a plan replays those events into a stock
+    `formencode.htmlfill.FillingParser`, so only the splicing of values and
+    errors into inputs, selects, textareas and `<form:error>` placeholders is
+    performed on each reprint.
+    """
+
+    source: str
+    lines: List[str]
+    events_feed: List[TYPE_EVENT]
+    position_feed: Tuple[int, int]
+    events_close: List[TYPE_EVENT]
+    position_close: Tuple[int, int]
+
+    def __init__(self, source: str):
+        self.source = source
+        self.lines = source.split("\n")
+        recorder = _RecordingParser()
+        recorder.feed(source)
+        self.events_feed = recorder.events
+        self.position_feed = recorder.getpos()
+        recorder.events = []
+        recorder.close()
+        self.events_close = recorder.events
+        self.position_close = recorder.getpos()
+
+
+class _FillPlanParser(FillingParser):
+    """
+    A `FillingParser` which replays the events of a `FillPlan` instead of
+    tokenizing the document.
+    """
+
+    _plan: FillPlan
+
+    def __init__(self, plan: FillPlan, **kwargs):
+        FillingParser.__init__(self, **kwargs)
+        self._plan = plan
+
+    def feed(self, data):
+        # mirrors `RewritingParser.feed`
+        self.data_is_str = isinstance(data, str)
+        self.source = data
+        self.lines = self._plan.lines
+        self.source_pos = 1, 0
+        if self.listener:
+            self.listener.reset()
+        self._replay(self._plan.events_feed, self._plan.position_feed)
+
+    def goahead(self, end):
+        # only invoked by `HTMLParser.close`
+        self._replay(self._plan.events_close, self._plan.position_close)
+
+    def _replay(self, events: List[TYPE_EVENT], position: Tuple[int, int]) -> None:
+        for name, data, attrs, (self.lineno, self.offset) in events:
+            if attrs is None:
+                getattr(self, name)(data)
+            else:
+                # the handlers alter `attrs` in place
+                getattr(self, name)(data, list(attrs))
+        self.lineno, self.offset = position
+
+
+# ------------------------------------------------------------------------------
+
+
+_fill_plans: "OrderedDict[str, FillPlan]" = OrderedDict()
+_fill_plans_lock = threading.Lock()
+
+
+def is_fillable(form: str) -> bool:
+    """
+    A cheap pre-scan of `form` for any tag that htmlfill would rewrite.
+
+    If this returns `False` and there are no errors to insert, htmlfill
+    returns `form` unchanged.  A false positive, such as a tag within a
+    comment, only costs a render.
+    """
+    return _RE_FILLABLE.search(form) is not None
+
+
+def get_fill_plan(form: str) -> FillPlan:
+    """
+    Returns the cached `FillPlan` for the markup `form`, parsing it if needed.
+
+    The cache is keyed on the markup itself, and is bounded by
+    `_defaults.FILL_PLAN_CACHE_SIZE` entries.
+    """
+    with _fill_plans_lock:
+        plan = _fill_plans.get(form)
+        if plan is not None:
+            _fill_plans.move_to_end(form)
+            return plan
+    if __debug__:
+        log.debug("get_fill_plan - parsing a new FillPlan")
+    plan = FillPlan(form)
+    with _fill_plans_lock:
+        _fill_plans[form] = plan
+        while len(_fill_plans) > _defaults.FILL_PLAN_CACHE_SIZE:
+            _fill_plans.popitem(last=False)
+    return plan
+
+
+def invalidate_fill_plans() -> None:
+    """Discards all cached `FillPlan` objects."""
+    with _fill_plans_lock:
+        _fill_plans.clear()
+
+
+def render(
+    form: str,
+    defaults: Optional[Dict] = None,
+    errors: Optional[Dict] = None,
+    auto_insert_errors: bool = True,
+    auto_error_formatter: Optional[Callable] = None,
+    **kwargs,
+) -> str:
+    """
+    A drop-in replacement for `formencode.htmlfill.render` which renders
+    against a cached `FillPlan` of `form`.
+    """
+    if defaults is None:
+        defaults = {}
+    if auto_insert_errors and auto_error_formatter is None:
+        auto_error_formatter = default_formatter
+    p = _FillPlanParser(
+        get_fill_plan(form),
+        defaults=defaults,
+        errors=errors,
+        auto_error_formatter=auto_error_formatter,
+        **kwargs,
+    )
+    p.feed(form)
+    p.close()
+    return p.text()
+
+
+__all__ = (
+    "FillPlan",
+    "get_fill_plan",
+    "invalidate_fill_plans",
+    "is_fillable",
+    "render",
+)
@@ -1,9 +1,15 @@
 # stdlib
+import functools
 from html import escape as html_escape
+from typing import Callable
+from typing import Optional
 
 # pypi
 import formencode
 
+# local
+from . import _defaults
+
 # ==============================================================================
 
 
@@ -54,10 +60,46 @@ def formatter_empty_string(error: str) -> str:
     return ""
 
 
+def memoize_formatter(
+    formatter: Callable[[str], str],
+    maxsize: Optional[int] = None,
+) -> Callable[[str], str]:
+    """
+    Wraps `formatter` in a bounded LRU cache, so each distinct error string
+    is escaped and formatted once per process.
+
+    Only `str` errors are cached; anything else, such as an
+    `htmlfill.htmlliteral`, is passed through to `formatter`. The cache is
+    exposed as `cache_info()` and `cache_clear()` on the returned function.
+
+    ``maxsize`` (None)
+        Integer. Defaults to ``_defaults.FORMATTER_CACHE_SIZE``.
+
+    usage::
+
+        formatter = memoize_formatter(formatter_nobr)
+        form_reprint(request, print_method, auto_error_formatter=formatter)
+    """
+    if maxsize is None:
+        maxsize = _defaults.FORMATTER_CACHE_SIZE
+    _cached = functools.lru_cache(maxsize=maxsize)(formatter)
+
+    def memoized(error: str) -> str:
+        if type(error) is str:
+            return _cached(error)
+        return formatter(error)
+
+    functools.update_wrapper(memoized, formatter)
+    memoized.cache_info = _cached.cache_info  # type: ignore[attr-defined]
+    memoized.cache_clear = _cached.cache_clear  # type: ignore[attr-defined]
+    return memoized
+
+
 __all__ = (
     "formatter_comment",
     "formatter_empty_string",
     "formatter_help_inline",
     "formatter_hidden",
     "formatter_nobr",
+    "memoize_formatter",
 )
@@ -0,0 +1,158 @@
+# stdlib
+import logging
+import time
+import tracemalloc
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Optional
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .objects import FormStash
+
+# ==============================================================================
+
+log = logging.getLogger("pyramid_formencode_classic")
+
+# a request whose environ has this key set will collect timings
+# the debugtoolbar panel sets this
+ENVIRON_COLLECT_TIMINGS = "pyramid_formencode_classic.collect_timings"
+
+# a collector is invoked as `collector(formStash, event, timings)`
+# `event` is "validate" or "reprint"; `timings` is `{phase: nanoseconds}`
+TYPE_COLLECTOR = Callable[["FormStash", str, Dict[str, int]], Any]
+
+# ------------------------------------------------------------------------------
+
+
+class PhaseTimer(object):
+    """
+    Records the `time.perf_counter_ns` duration of consecutive phases.
+
+    Each call to `lap(phase)` records the time elapsed since the previous
+    lap (or since the timer was created) into `phase`.  `finish` records
+    the `total` and returns the timings.
+
+    Field validators can record their durations into `validators`.
+
+    If `tracemalloc` is tracing, the net bytes allocated between the
+    creation of the timer and `finish` are recorded as well.
+    """
+
+    event: str
+    timings: Dict[str, int]
+    validators: Dict[str, int]
+    _started: int
+    _last: int
+    _memory_started: Optional[int] = None
+
+    def __init__(self, event: str):
+        self.event = event
+        self.timings = {}
+        self.validators = {}
+        if tracemalloc.is_tracing():
+            self._memory_started = tracemalloc.get_traced_memory()[0]
+        self._started = self._last = time.perf_counter_ns()
+
+    def lap(self, phase: str) -> None:
+        now = time.perf_counter_ns()
+        self.timings[phase] = self.timings.get(phase, 0) + (now - self._last)
+        self._last = now
+
+    def finish(
+        self,
+        formStash: "FormStash",
+        collector: Optional[TYPE_COLLECTOR] = None,
+    ) -> Dict[str, int]:
+        """
+        Records the `total`, stores the timings onto `formStash.timings` as
+        `{event: {phase: nanoseconds}}` and invokes the `collector`.
+
+        Validator durations are stored as `formStash.timings["validators"]`;
+        allocated bytes as `formStash.allocations[event]`.
+        """
+        self.timings["total"] = time.perf_counter_ns() - self._started
+        if formStash.timings is None:
+            formStash.timings = {}
+        formStash.timings[self.event] = self.timings
+        if self.validators:
+            formStash.timings["validators"] = self.validators
+        if self._memory_started is not None:
+            if formStash.allocations is None:
+                formStash.allocations = {}
+            formStash.allocations[self.event] = (
+                tracemalloc.get_traced_memory()[0] - self._memory_started
+            )
+        if collector is not None:
+            try:
+                collector(formStash, self.event, self.timings)
+            except Exception as exc:
+                # never let instrumentation break a request
+                log.exception("timings collector failed: %s", exc)
+        return self.timings
+
+
+# ------------------------------------------------------------------------------
+
+
+def _form_name(formStash: Optional["FormStash"]) -> str:
+    return getattr(formStash, "name", None) or "_unknown"
+
+
+class StatsdCollector(object):
+    """
+    A collector which sends timings to a statsd client, such as the `statsd`
+    or `datadog` packages, as `{prefix}.{form}.{event}.{phase}` in
+    milliseconds via `client.timing(stat, ms)`.
+    """
+
+    client: Any
+    prefix: str
+
+    def __init__(self, client: Any, prefix: str = "pyramid_formencode_classic"):
+        self.client = client
+        self.prefix = prefix
+
+    def __call__(
+        self,
+        formStash: Optional["FormStash"],
+        event: str,
+        timings: Dict[str, int],
+    ) -> None:
+        _base = "%s.%s.%s" % (self.prefix, _form_name(formStash), event)
+        for phase, ns in timings.items():
+            self.client.timing("%s.%s" % (_base, phase), ns / 1000000.0)
+
+
+class PrometheusCollector(object):
+    """
+    A collector which observes timings, in seconds, on a
+    `prometheus_client.Histogram` (or `Summary`) which was declared with the
+    labels `("form", "event", "phase")`.
+    """
+
+    metric: Any
+
+    def __init__(self, metric: Any):
+        self.metric = metric
+
+    def __call__(
+        self,
+        formStash: Optional["FormStash"],
+        event: str,
+        timings: Dict[str, int],
+    ) -> None:
+        _form = _form_name(formStash)
+        for phase, ns in timings.items():
+            self.metric.labels(form=_form, event=event, phase=phase).observe(
+                ns / 1000000000.0
+            )
+
+
+__all__ = (
+    "ENVIRON_COLLECT_TIMINGS",
+    "PhaseTimer",
+    "PrometheusCollector",
+    "StatsdCollector",
+)
@@ -0,0 +1,143 @@
+# stdlib
+import logging
+from typing import Dict
+from typing import Optional
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from webob.multidict import MultiDict
+
+# ==============================================================================
+
+log = logging.getLogger("pyramid_formencode_classic")
+
+# ------------------------------------------------------------------------------
+
+
+class LimitExceeded(ValueError):
+    """
+    Raised when a submission exceeds a `SubmissionLimits`.
+
+    ``limit`` is the name of the exceeded limit, e.g. ``"max_fields"``.
+    """
+
+    limit: str
+
+    def __init__(self, limit: str, message: str):
+        ValueError.__init__(self, message)
+        self.limit = limit
+
+
+class SubmissionLimits(object):
+    """
+    Limits a submission must respect before `form_validate` parses it with
+    the schema.  Every limit defaults to `None`, which disables it.
+
+    ``max_fields``
+        The number of submitted values, counting repeated keys.
+
+    ``max_value_length``
+        The length of any single (non-file) value.
+
+    ``max_total_bytes``
+        The size of the submission.  When the request body is validated this
+        is its ``Content-Length``, checked before the body is parsed;
+        otherwise the UTF-8 size of the submitted keys and values.
+
+    ``max_list_length``
+        The number of values of a repeated key, and the number of members of
+        a `variable_decode` list (including ``--repetitions`` padding).
+
+    usage::
+
+        limits = SubmissionLimits(max_fields=50, max_value_length=4096)
+        form_validate(request, schema=Form_Login, limits=limits)
+    """
+
+    __slots__ = (
+        "max_fields",
+        "max_value_length",
+        "max_total_bytes",
+        "max_list_length",
+    )
+
+    max_fields: Optional[int]
+    max_value_length: Optional[int]
+    max_total_bytes: Optional[int]
+    max_list_length: Optional[int]
+
+    def __init__(
+        self,
+        max_fields: Optional[int] = None,
+        max_value_length: Optional[int] = None,
+        max_total_bytes: Optional[int] = None,
+        max_list_length: Optional[int] = None,
+    ):
+        self.max_fields = max_fields
+        self.max_value_length = max_value_length
+        self.max_total_bytes = max_total_bytes
+        self.max_list_length = max_list_length
+
+    def __repr__(self) -> str:
+        return "<SubmissionLimits %s>" % ", ".join(
+            "%s=%s" % (k, getattr(self, k)) for k in self.__slots__
+        )
+
+    def check_content_length(self, content_length: Optional[int]) -> None:
+        """Checks the ``Content-Length`` of a request body."""
+        if (self.max_total_bytes is not None) and (content_length is not None):
+            if content_length > self.max_total_bytes:
+                raise LimitExceeded(
+                    "max_total_bytes",
+                    "the body of %s bytes exceeds %s"
+                    % (content_length, self.max_total_bytes),
+                )
+
+    def check_params(self, params: "MultiDict", check_bytes: bool = True) -> None:
+        """
+        Checks `params` in a single pass over its items.  If `check_bytes` is
+        `False`, ``max_total_bytes`` is not checked, e.g. because the
+        ``Content-Length`` has already been checked.
+        """
+        max_fields = self.max_fields
+        max_value_length = self.max_value_length
+        max_total_bytes = self.max_total_bytes if check_bytes else None
+        max_list_length = self.max_list_length
+        repeated: Dict[str, int] = {}
+        fields = 0
+        total_bytes = 0
+        for key, value in params.items():
+            fields += 1
+            if (max_fields is not None) and (fields > max_fields):
+                raise LimitExceeded(
+                    "max_fields", "more than %s fields were submitted" % max_fields
+                )
+            if max_list_length is not None:
+                repeated[key] = _count = repeated.get(key, 0) + 1
+                if _count > max_list_length:
+                    raise LimitExceeded(
+                        "max_list_length",
+                        "`%s` was submitted more than %s times"
+                        % (key, max_list_length),
+                    )
+            if not isinstance(value, str):
+                # e.g. an upload
+                continue
+            if (max_value_length is not None) and (len(value) > max_value_length):
+                raise LimitExceeded(
+                    "max_value_length",
+                    "the value of `%s` exceeds %s characters" % (key, max_value_length),
+                )
+            if max_total_bytes is not None:
+                total_bytes += len(key.encode("utf-8")) + len(value.encode("utf-8"))
+                if total_bytes > max_total_bytes:
+                    raise LimitExceeded(
+                        "max_total_bytes",
+                        "the submission exceeds %s bytes" % max_total_bytes,
+                    )
+
+
+__all__ = (
+    "LimitExceeded",
+    "SubmissionLimits",
+)
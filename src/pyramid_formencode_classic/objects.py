@@ -1,12 +1,19 @@
 # stdlib
 import logging
+from types import MappingProxyType
+from typing import Any
+from typing import Callable
 from typing import Dict
 from typing import Iterable
+from typing import List
+from typing import Mapping
 from typing import NoReturn
 from typing import Optional
+from typing import Type
 from typing import TYPE_CHECKING
 
 # pypi
+import formencode.htmlfill
 from typing_extensions import Literal
 from typing_extensions import TypedDict
 
@@ -14,6 +21,7 @@ from typing_extensions import TypedDict
 from . import _defaults
 from ._utils import TYPES_ERRORS
 from .exceptions import FormInvalid
+from .formatters import formatter_nobr
 
 if TYPE_CHECKING:
     from formencode import Schema
@@ -28,7 +36,119 @@ log = logging.getLogger("pyramid_formencode_classic")
 class ParsedForm(TypedDict):
     errors: Dict[str, str]
     results: Dict[str, str]
-    defaults: Dict[str, str]
+    defaults: Mapping[str, Any]  # a `dict`, or a `params.MixedParamsView`
+
+
+class ReadOnlyDict(dict):
+    """
+    A `dict` which can not be mutated; any mutation raises a `TypeError`.
+
+    Unlike a `types.MappingProxyType` it is still a `dict`, so it can be
+    serialized with `json`, and `copy()` returns a plain, mutable `dict`.
+    """
+
+    __slots__ = ()
+
+    def __reduce__(self):
+        return (self.__class__, (dict(self),))
+
+    def _readonly(self, *args, **kwargs) -> NoReturn:
+        raise TypeError("`%s` is read-only" % self.__class__.__name__)
+
+    __setitem__ = __delitem__ = __ior__ = _readonly  # type: ignore[assignment]
+    clear = pop = popitem = setdefault = update = _readonly  # type: ignore[assignment]
+
+
+# shared by stashes without errors
+_EMPTY_ERRORS: Dict[str, str] = ReadOnlyDict()
+
+
+class ErrorsDict(dict):
+    """
+    The `dict` of errors stored in `FormStash.parsed_form["errors"]`.
+
+    The "normal" and "special" (`*`-prefixed keys) partitions behind
+    `FormStash.errors_normal` and `FormStash.errors_special` are built in a
+    single pass on first read, and cached until the next mutation; repeated
+    template access does not rebuild them.  The partitions are shared, so
+    they are `ReadOnlyDict`s; set errors with `FormStash.set_error`.
+    """
+
+    __slots__ = (
+        "_normal",
+        "_special",
+    )
+
+    _normal: Optional[Dict[str, str]]
+    _special: Optional[Dict[str, str]]
+
+    def __init__(self, *args, **kwargs):
+        dict.__init__(self, *args, **kwargs)
+        self._normal = None
+        self._special = None
+
+    def __reduce__(self):
+        return (self.__class__, (dict(self),))
+
+    def _partition(self) -> None:
+        normal = ReadOnlyDict()
+        special = ReadOnlyDict()
+        for k, v in dict.items(self):
+            dict.__setitem__(special if k[0] == "*" else normal, k, v)
+        self._normal = normal
+        self._special = special
+
+    def _invalidate(self) -> None:
+        self._normal = None
+        self._special = None
+
+    def get_normal(self) -> Dict[str, str]:
+        """Returns the cached errors of the fields."""
+        if self._normal is None:
+            self._partition()
+        if TYPE_CHECKING:
+            assert self._normal is not None
+        return self._normal
+
+    def get_special(self) -> Dict[str, str]:
+        """Returns the cached `*`-prefixed errors."""
+        if self._special is None:
+            self._partition()
+        if TYPE_CHECKING:
+            assert self._special is not None
+        return self._special
+
+    def __setitem__(self, key, value):
+        dict.__setitem__(self, key, value)
+        self._invalidate()
+
+    def __delitem__(self, key):
+        dict.__delitem__(self, key)
+        self._invalidate()
+
+    def __ior__(self, other):  # type: ignore[misc]
+        self.update(other)
+        return self
+
+    def clear(self):
+        dict.clear(self)
+        self._invalidate()
+
+    def pop(self, key, *args):
+        self._invalidate()
+        return dict.pop(self, key, *args)
+
+    def popitem(self):
+        self._invalidate()
+        return dict.popitem(self)
+
+    def setdefault(self, key, default=None):
+        self._invalidate()
+        return dict.setdefault(self, key, default)
+
+    def update(self, *args, **kwargs):
+        dict.update(self, *args, **kwargs)
+        self._invalidate()
 
 
 class FormStash(object):
@@ -71,6 +191,11 @@ class FormStash(object):
     _reprints: Iterable  # internal use for debugging
     assets: Dict  # namespace used to house extra data for developers
 
+    # `{event: {phase: nanoseconds}}`, if timings are collected
+    timings: Optional[Dict[str, Dict[str, int]]] = None
+    # `{event: bytes}`, if timings are collected while `tracemalloc` traces
+    allocations: Optional[Dict[str, int]] = None
+
     def __init__(
         self,
         schema: "Schema",
@@ -85,7 +210,7 @@ class FormStash(object):
         if name:
             self.name = name
         self.parsed_form: ParsedForm = {
-            "errors": {},
+            "errors": ErrorsDict(),
             "results": {},
             "defaults": {},
         }
@@ -113,9 +238,13 @@ class FormStash(object):
         self.error_no_submission_text = error_no_submission_text
 
         self.is_unicode_params = is_unicode_params
+        self._init_containers()
+        self.debug_fails = debug_fails
+
+    def _init_containers(self) -> None:
+        """allocates `_reprints` and `assets`; see `FormStashSlotted`"""
         self._reprints = []
         self.assets = {}
-        self.debug_fails = debug_fails
 
     # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
 
@@ -132,11 +261,11 @@ class FormStash(object):
     # Proxy methods to maintain compatibility
 
     @property
-    def defaults(self) -> Dict:
+    def defaults(self) -> Mapping[str, Any]:
         return self.parsed_form["defaults"]
 
     @property
-    def errors(self) -> Dict:
+    def errors(self) -> Dict[str, str]:
         return self.errors_normal
 
     @property
@@ -156,12 +285,18 @@ class FormStash(object):
         return self.parsed_form["errors"]
 
     @property
-    def errors_normal(self) -> Dict:
-        return {k: v for k, v in self.parsed_form["errors"].items() if k[0] != "*"}
+    def errors_normal(self) -> Dict[str, str]:
+        errors = self.parsed_form["errors"]
+        if isinstance(errors, ErrorsDict):
+            return errors.get_normal()
+        return {k: v for k, v in errors.items() if k[0] != "*"}
 
     @property
-    def errors_special(self) -> Dict:
-        return {k: v for k, v in self.parsed_form["errors"].items() if k[0] == "*"}
+    def errors_special(self) -> Dict[str, str]:
+        errors = self.parsed_form["errors"]
+        if isinstance(errors, ErrorsDict):
+            return errors.get_special()
+        return {k: v for k, v in errors.items() if k[0] == "*"}
 
     def count_errors(self, include_special: bool = False) -> int:
         if include_special:
@@ -427,7 +562,7 @@ class FormStash(object):
                     if self.error_main_key in self.parsed_form["errors"]:
                         del self.parsed_form["errors"][self.error_main_key]
             else:
-                self.parsed_form["errors"] = {}
+                self.parsed_form["errors"] = ErrorsDict()
         if self.parsed_form["errors"]:
             self.is_error = True
 
@@ -599,6 +734,218 @@ class FormStash(object):
         )
 
 
+class FormStashSlotted(FormStash):
+    """
+    A compact `FormStash`.
+
+    The per-form state is stored in `__slots__` and the `assets` and
+    `_reprints` containers are only allocated when first accessed.
+
+    As a subclass of `FormStash`, which has no `__slots__`, an instance still
+    has a `__dict__`.  It holds attributes that are not listed below, such as
+    the templates and css class assigned by the `set_*` methods.
+
+    The public API is identical to `FormStash`.
+    """
+
+    __slots__ = (
+        "schema",
+        "name",
+        "error_main_key",
+        "is_error",
+        "is_error_csrf",
+        "is_parsed",
+        "is_unicode_params",
+        "is_submitted_vars",
+        "parsed_form",
+        "default_texts",
+        "error_no_submission_text",
+        "debug_fails",
+        "timings",
+        "allocations",
+        "_assets",
+        "_reprints_",
+    )
+
+    _assets: Optional[Dict]
+    _reprints_: Optional[List]
+
+    def __init__(
+        self,
+        schema: "Schema",
+        name: Optional[str] = None,
+        error_main_key: Optional[str] = None,
+        error_main_text: Optional[str] = None,
+        error_no_submission_text: Optional[str] = None,
+        is_unicode_params: bool = False,
+        debug_fails: Optional[bool] = None,
+    ):
+        # the slots shadow the class-level defaults of `FormStash`
+        self.is_error = False
+        self.is_error_csrf = False
+        self.is_parsed = False
+        self.is_submitted_vars = None
+        self.timings = None
+        self.allocations = None
+        FormStash.__init__(
+            self,
+            schema,
+            name=name,
+            error_main_key=error_main_key,
+            error_main_text=error_main_text,
+            error_no_submission_text=error_no_submission_text,
+            is_unicode_params=is_unicode_params,
+            debug_fails=debug_fails,
+        )
+
+    def _init_containers(self) -> None:
+        # allocated on first access
+        self._reprints_ = None
+        self._assets = None
+
+    # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+
+    def _debug(self):
+        import pprint
+
+        print("====================")
+        print(self)
+        pprint.pprint(
+            {
+                k: getattr(self, k)
+                for k in self.__slots__
+                if hasattr(self, k)  # `name` is optional
+            }
+        )
+        print("====================")
+
+    # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+
+    @property  # type: ignore[override]
+    def assets(self) -> Dict:
+        if self._assets is None:
+            self._assets = {}
+        return self._assets
+
+    @assets.setter
+    def assets(self, value: Dict) -> None:
+        self._assets = value
+
+    @property  # type: ignore[override]
+    def _reprints(self) -> List:
+        if self._reprints_ is None:
+            self._reprints_ = []
+        return self._reprints_
+
+    @_reprints.setter
+    def _reprints(self, value: List) -> None:
+        self._reprints_ = value
+
+
+class _EmptyFormStash(FormStash):
+    """
+    A placeholder `FormStash` for a form which has not been validated.
+
+    Templates often only ask an unvalidated form for its errors, e.g. via
+    `html_error_placeholder`, which are always empty.  The placeholder
+    answers those reads without allocating the containers of a `FormStash`.
+
+    The first access to any of the containers, or to any method which may
+    mutate them, promotes the placeholder in place into a `FormStash`.
+    """
+
+    # attributes which promote the placeholder on access
+    _lazy_attributes = frozenset(
+        (
+            "parsed_form",
+            "default_texts",
+            "error_no_submission_text",
+            "assets",
+            "_reprints",
+        )
+    )
+
+    _lazy_init: Dict[str, Any]
+
+    def __init__(
+        self,
+        schema: "Schema",
+        name: Optional[str] = None,
+        error_main_key: Optional[str] = None,
+        error_main_text: Optional[str] = None,
+        is_unicode_params: bool = False,
+    ):
+        if error_main_key is None:
+            error_main_key = _defaults.DEFAULT_ERROR_MAIN_KEY
+        self.schema = schema
+        if name:
+            self.name = name
+        self.error_main_key = error_main_key
+        self.is_unicode_params = is_unicode_params
+        self._lazy_init = {
+            "schema": schema,
+            "name": name,
+            "error_main_key": error_main_key,
+            "error_main_text": error_main_text,
+            "is_unicode_params": is_unicode_params,
+        }
+
+    def _promote(self) -> None:
+        """Turns this placeholder into a full `FormStash`."""
+        if __debug__:
+            log.debug("`_EmptyFormStash` - promoting")
+        kwargs = self.__dict__.pop("_lazy_init")
+        self.__class__ = FormStash  # type: ignore[assignment]
+        FormStash.__init__(self, **kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        # only invoked for attributes that are not yet set
+        if name in _EmptyFormStash._lazy_attributes:
+            self._promote()
+            return getattr(self, name)
+        raise AttributeError(name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name in _EmptyFormStash._lazy_attributes:
+            self._promote()
+        object.__setattr__(self, name, value)
+
+    # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+
+    # reads of the (empty) errors do not promote
+
+    @property
+    def error_main(self) -> Optional[str]:
+        return None
+
+    @property
+    def errors_normal(self) -> Dict[str, str]:
+        return _EMPTY_ERRORS
+
+    @property
+    def errors_special(self) -> Dict[str, str]:
+        return _EMPTY_ERRORS
+
+    def count_errors(self, include_special: bool = False) -> int:
+        return 0
+
+    def has_error(self, field: str) -> bool:
+        return False
+
+    def has_errors(self) -> bool:
+        return False
+
+    def css_error(
+        self,
+        field: str,
+        css_error: Optional[str] = None,
+    ) -> str:
+        return ""
+
+    def get_error(self, field: str) -> Optional[TYPES_ERRORS]:
+        return None
+
+
 class FormStashList(dict):
     """
     dict for holding multiple `FormStash`
@@ -617,13 +964,32 @@ class FormStashList(dict):
         error_main_key: Optional[str] = None,
         error_main_text: Optional[str] = None,
         is_unicode_params: bool = False,
+        use_slotted_formstash: Optional[bool] = None,
+        use_lazy_formstash: Optional[bool] = None,
     ) -> FormStash:
+        """
+        Returns the `FormStash` named `form_stash`, creating it if needed.
+
+        ``use_lazy_formstash`` (default None) -- if a stash is created, create
+            a placeholder which is promoted into a `FormStash` on its first
+            mutation. Ignored if ``use_slotted_formstash``. Defaults to
+            ``_defaults.USE_LAZY_FORMSTASH``.
+        """
         if form_stash not in self:
+            if use_slotted_formstash is None:
+                use_slotted_formstash = _defaults.USE_SLOTTED_FORMSTASH
+            if use_lazy_formstash is None:
+                use_lazy_formstash = _defaults.USE_LAZY_FORMSTASH
             if error_main_key is None:
                 error_main_key = _defaults.DEFAULT_ERROR_MAIN_KEY
             if error_main_text is None:
                 error_main_text = _defaults.DEFAULT_ERROR_MAIN_TEXT
-            self[form_stash] = FormStash(
+            _class: Type[FormStash] = FormStash
+            if use_slotted_formstash:
+                _class = FormStashSlotted
+            elif use_lazy_formstash:
+                _class = _EmptyFormStash
+            self[form_stash] = _class(
                 schema=schema,
                 name=form_stash,
                 error_main_key=error_main_key,
@@ -631,3 +997,63 @@ class FormStashList(dict):
                 is_unicode_params=is_unicode_params,
             )
         return self[form_stash]
+
+
+class ReprintProfile(object):
+    """
+    A frozen set of htmlfill options for `form_reprint`.
+
+    Create a profile once, at configuration time, and pass it to
+    `form_reprint(reprint_profile=...)`.  The merged `error_formatters` and
+    the htmlfill kwargs are computed here, so a reprint only renders.
+
+    ``auto_error_formatter`` (formatter_nobr)
+        As in `form_reprint`.
+
+    ``error_formatters`` (None)
+        As in `form_reprint`; merged into a copy of the htmlfill defaults.
+
+    ``encoding`` (None)
+        Passed to htmlfill. If `None`, `request.charset` is used.
+
+    ``**htmlfill_kwargs``
+        Passed on to htmlfill.
+    """
+
+    __slots__ = (
+        "auto_error_formatter",
+        "encoding",
+        "error_formatters",
+        "htmlfill_kwargs",
+    )
+
+    auto_error_formatter: Callable
+    encoding: Optional[str]
+    error_formatters: Optional[Mapping[str, Callable]]
+    htmlfill_kwargs: Mapping[str, Any]
+
+    def __init__(
+        self,
+        auto_error_formatter: Callable = formatter_nobr,
+        error_formatters: Optional[Dict[str, Callable]] = None,
+        encoding: Optional[str] = None,
+        **htmlfill_kwargs,
+    ):
+        _htmlfill_kwargs = dict(htmlfill_kwargs)
+        _htmlfill_kwargs["auto_error_formatter"] = auto_error_formatter
+        _error_formatters = None
+        if error_formatters is not None:
+            _error_formatters = dict(formencode.htmlfill.default_formatter_dict)
+            _error_formatters.update(error_formatters)
+            _htmlfill_kwargs["error_formatters"] = _error_formatters
+        self.auto_error_formatter = auto_error_formatter
+        self.encoding = encoding
+        self.error_formatters = (
+            MappingProxyType(_error_formatters)
+            if _error_formatters is not None
+            else None
+        )
+        self.htmlfill_kwargs = MappingProxyType(_htmlfill_kwargs)
+
+    def __repr__(self) -> str:
+        return "<ReprintProfile %r>" % dict(self.htmlfill_kwargs)
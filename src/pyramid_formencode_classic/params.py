@@ -0,0 +1,119 @@
+# stdlib
+import logging
+from typing import AbstractSet
+from typing import Any
+from typing import Dict
+from typing import ItemsView
+from typing import Iterator
+from typing import Mapping
+from typing import Optional
+from typing import Set
+from typing import TYPE_CHECKING
+from typing import ValuesView
+
+if TYPE_CHECKING:
+    from webob.multidict import MultiDict
+
+# ==============================================================================
+
+log = logging.getLogger("pyramid_formencode_classic")
+
+# ------------------------------------------------------------------------------
+
+
+class MixedParamsView(Mapping):
+    """
+    A read-only view of a `MultiDict` with the semantics of
+    `MultiDict.mixed()`: a key submitted once is its value, a key submitted
+    several times is a list of its values.
+
+    `MultiDict.mixed()` copies every submitted key and value.  A view copies
+    nothing when it is created.  `resolve` copies a known set of keys, such
+    as a schema's fields, in a single pass; any other read materializes the
+    entire `mixed()` dict once, which then serves every later lookup.  A
+    view pays off when the extra keys are never read, e.g. by a
+    `compiled.CompiledSchema` which filters extra fields.
+    """
+
+    __slots__ = (
+        "_multidict",
+        "_resolved",
+        "_mixed",
+    )
+
+    _multidict: "MultiDict"
+    _resolved: Dict[str, Any]
+    _mixed: Optional[Dict[str, Any]]
+
+    def __init__(self, multidict: "MultiDict"):
+        self._multidict = multidict
+        self._resolved = {}
+        self._mixed = None
+
+    def __repr__(self) -> str:
+        return "<MixedParamsView %r>" % (self._multidict,)
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return self._resolved[key]
+        except KeyError:
+            pass
+        return self.materialize()[key]
+
+    def __contains__(self, key: Any) -> bool:
+        return (key in self._resolved) or (key in self.materialize())
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.materialize())
+
+    def __len__(self) -> int:
+        return len(self.materialize())
+
+    def __bool__(self) -> bool:
+        return bool(self._multidict)
+
+    def items(self) -> ItemsView[str, Any]:
+        return self.materialize().items()
+
+    def values(self) -> ValuesView[Any]:
+        return self.materialize().values()
+
+    def copy(self) -> Dict[str, Any]:
+        """Returns a `dict`; `htmlfill` copies its defaults with `use_all_keys`."""
+        return dict(self.materialize())
+
+    def resolve(self, keys: AbstractSet[str]) -> Dict[str, Any]:
+        """
+        Returns the mixed values of the submitted `keys`, which are resolved
+        (and memoized) in a single pass over the `MultiDict`.  Other keys are
+        not copied.
+        """
+        if self._mixed is not None:
+            _mixed = self._mixed
+            return {key: _mixed[key] for key in keys if key in _mixed}
+        rval: Dict[str, Any] = {}
+        multiple: Set[str] = set()
+        for key, value in self._multidict.items():
+            if key not in keys:
+                continue
+            # mirrors `MultiDict.mixed`
+            if key not in rval:
+                rval[key] = value
+            elif key in multiple:
+                rval[key].append(value)
+            else:
+                rval[key] = [rval[key], value]
+                multiple.add(key)
+        self._resolved.update(rval)
+        return rval
+
+    def materialize(self) -> Dict[str, Any]:
+        """Returns (and memoizes) the `MultiDict.mixed()` dict."""
+        if self._mixed is None:
+            if __debug__:
+                log.debug("MixedParamsView - materializing")
+            self._mixed = self._resolved = self._multidict.mixed()
+        return self._mixed
+
+
+__all__ = ("MixedParamsView",)
@@ -0,0 +1,123 @@
+# stdlib
+import logging
+from typing import Any
+from typing import Dict
+from typing import Optional
+from typing import TYPE_CHECKING
+
+# local
+from .compiled import CompiledSchema
+from .compiled import get_compiled_schema
+from .limits import SubmissionLimits
+
+if TYPE_CHECKING:
+    from formencode import Schema
+    from pyramid.config import Configurator
+    from pyramid.registry import Registry
+
+# ==============================================================================
+
+log = logging.getLogger("pyramid_formencode_classic")
+
+# ------------------------------------------------------------------------------
+
+
+class RegisteredSchema(object):
+    """
+    A schema registered under a name with `config.add_form_schema`, and the
+    metadata precomputed for it at registration.
+
+    ``name``
+        The registered name.
+
+    ``schema``
+        The `formencode.Schema` class or instance.
+
+    ``compiled``
+        The `compiled.CompiledSchema` plan.  The plan is compiled at
+        registration, and read through `compiled.get_compiled_schema`, so a
+        schema altered afterwards is compiled again.
+
+    ``limits``
+        The `limits.SubmissionLimits` for the schema, or `None`.
+    """
+
+    name: str
+    schema: "Schema"
+    limits: Optional[SubmissionLimits]
+
+    def __init__(
+        self,
+        name: str,
+        schema: "Schema",
+        limits: Optional[SubmissionLimits] = None,
+    ):
+        self.name = name
+        self.schema = schema
+        self.limits = limits
+        get_compiled_schema(schema)
+
+    @property
+    def compiled(self) -> CompiledSchema:
+        return get_compiled_schema(self.schema)
+
+    def __repr__(self) -> str:
+        return "<RegisteredSchema %s: %s>" % (self.name, self.schema)
+
+
+def _get_schemas(registry: "Registry") -> Dict[str, RegisteredSchema]:
+    schemas = getattr(registry, "pyramid_formencode_classic_schemas", None)
+    if schemas is None:
+        schemas = registry.pyramid_formencode_classic_schemas = {}
+    return schemas
+
+
+def get_form_schema(registry: "Registry", name: str) -> RegisteredSchema:
+    """
+    Returns the `RegisteredSchema` registered as `name` on `registry`.
+
+    Raises a `ValueError` if there is no such schema.
+    """
+    try:
+        return _get_schemas(registry)[name]
+    except KeyError:
+        raise ValueError("no schema is registered as `%s`" % name)
+
+
+def add_form_schema(
+    config: "Configurator",
+    name: str,
+    schema: Any,
+    limits: Optional[SubmissionLimits] = None,
+) -> None:
+    """
+    A configurator directive which registers `schema` (a class, instance or
+    dotted name) as `name`.  `form_validate` will then accept `name` as its
+    `schema`.
+
+    The schema is compiled when the configuration is committed.  Registering
+    two schemas under one name is a configuration conflict.
+
+    `limits`, a `limits.SubmissionLimits`, is enforced by `form_validate`
+    for this schema unless it is invoked with its own ``limits``.
+
+    usage::
+
+        config.add_form_schema("login", "myapp.forms.Form_Login")
+    """
+    schema = config.maybe_dotted(schema)
+    registry = config.registry
+
+    def register():
+        if __debug__:
+            log.debug("add_form_schema - registering `%s`", name)
+        _get_schemas(registry)[name] = RegisteredSchema(name, schema, limits=limits)
+
+    config.action(("pyramid_formencode_classic.schema", name), register)
+
+
+__all__ = (
+    "RegisteredSchema",
+    "add_form_schema",
+    "get_form_schema",
+)
@@ -0,0 +1,337 @@
+# stdlib
+from email.message import Message
+import logging
+import tempfile
+from typing import Any
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import TYPE_CHECKING
+
+# pypi
+from formencode.api import Invalid
+from webob.multidict import MultiDict
+
+# local
+from . import _defaults
+from .compiled import get_compiled_schema
+from .utils import csrf_token_matches
+
+if TYPE_CHECKING:
+    from formencode import Schema
+    from pyramid.request import Request
+
+# ==============================================================================
+
+log = logging.getLogger("pyramid_formencode_classic")
+
+# scanner events
+PART_START = 1  # (PART_START, (name, filename))
+PART_DATA = 2  # (PART_DATA, bytes)
+PART_END = 3  # (PART_END, None)
+
+# state of `MultipartScanner`
+_STATE_DELIMITER = 1
+_STATE_HEADERS = 2
+_STATE_BODY = 3
+_STATE_DONE = 4
+
+# largest allowed header block of a single part
+_MAX_HEADER_SIZE = 16384
+
+# ------------------------------------------------------------------------------
+
+
+class MalformedMultipart(ValueError):
+    """Raised by `MultipartScanner` on a body it can not parse."""
+
+    pass
+
+
+class MultipartScanner(object):
+    """
+    An incremental `multipart/form-data` tokenizer.
+
+    Chunks of the body are passed to `feed`, which yields the parts as they
+    arrive.  The payload of a part is yielded in pieces and never buffered,
+    so the caller decides what to retain.
+    """
+
+    _buffer: bytes
+    _delimiter: bytes
+    _separator: bytes
+    _state: int
+
+    def __init__(self, boundary: bytes):
+        self._buffer = b""
+        self._delimiter = b"--" + boundary
+        self._separator = b"\r\n--" + boundary
+        self._state = _STATE_DELIMITER
+
+    @property
+    def is_done(self) -> bool:
+        return self._state == _STATE_DONE
+
+    def feed(self, chunk: bytes) -> Iterator[Tuple[int, Any]]:
+        self._buffer += chunk
+        while True:
+            if self._state == _STATE_DELIMITER:
+                idx = self._buffer.find(self._delimiter)
+                if idx == -1:
+                    return
+                _end = idx + len(self._delimiter)
+                _trailer = self._buffer[_end:]
+                if len(_trailer) < 2:
+                    return
+                if _trailer[:2] == b"--":
+                    self._buffer = b""
+                    self._state = _STATE_DONE
+                    return
+                _eol = _trailer.find(b"\r\n")
+                if _eol == -1:
+                    return
+                self._buffer = _trailer[_eol:][2:]
+                self._state = _STATE_HEADERS
+            elif self._state == _STATE_HEADERS:
+                idx = self._buffer.find(b"\r\n\r\n")
+                if idx == -1:
+                    if len(self._buffer) > _MAX_HEADER_SIZE:
+                        raise MalformedMultipart("part headers are too large")
+                    return
+                headers = self._buffer[:idx]
+                self._buffer = self._buffer[idx:][4:]
+                self._state = _STATE_BODY
+                yield (PART_START, _parse_disposition(headers))
+            elif self._state == _STATE_BODY:
+                idx = self._buffer.find(self._separator)
+                if idx == -1:
+                    # keep enough of the tail to detect a split separator
+                    _keep = len(self._separator) - 1
+                    if len(self._buffer) > _keep:
+                        yield (PART_DATA, self._buffer[:-_keep])
+                        self._buffer = self._buffer[-_keep:]
+                    return
+                if idx:
+                    yield (PART_DATA, self._buffer[:idx])
+                self._buffer = self._buffer[idx:][2:]
+                self._state = _STATE_DELIMITER
+                yield (PART_END, None)
+            else:
+                return
+
+
+def _get_boundary(request: "Request") -> Optional[bytes]:
+    """returns the boundary of a `multipart/form-data` request, if any"""
+    if request.content_type != "multipart/form-data":
+        return None
+    msg = Message()
+    msg["content-type"] = request.environ.get("CONTENT_TYPE", "")
+    boundary = msg.get_param("boundary", header="content-type")
+    if not boundary or not isinstance(boundary, str):
+        return None
+    return boundary.encode("latin-1")
+
+
+def is_streamable(request: "Request") -> bool:
+    """
+    Returns `True` if `stream_multipart` can process the body of `request`:
+    an unparsed `multipart/form-data` body with a known length.
+    """
+    if "webob._parsed_post_vars" in request.environ:
+        return False
+    if request.content_length is None:
+        return False
+    return _get_boundary(request) is not None
+
+
+def _parse_disposition(headers: bytes) -> Tuple[Optional[str], Optional[str]]:
+    """returns the `name` and `filename` of a part's `Content-Disposition`"""
+    for line in headers.split(b"\r\n"):
+        key, _, value = line.partition(b":")
+        if key.strip().lower() == b"content-disposition":
+            msg = Message()
+            msg["content-disposition"] = value.decode("latin-1").strip()
+            name = msg.get_param("name", header="content-disposition")
+            filename = msg.get_param("filename", header="content-disposition")
+            return (
+                name if isinstance(name, str) else None,
+                filename if isinstance(filename, str) else None,
+            )
+    raise MalformedMultipart("part is missing a `Content-Disposition`")
+
+
+class StreamedSubmission(object):
+    """
+    The outcome of `stream_multipart`.
+
+    ``is_rejected``
+        `True` if the body was rejected before it was entirely read.
+
+    ``is_error_csrf``
+        `True` if the rejection was caused by the csrf token.
+
+    ``errors``
+        dict of field name to error message.
+
+    ``values``
+        MultiDict of the scalar (non-file) fields read before completion or
+        rejection.
+    """
+
+    is_rejected: bool = False
+    is_error_csrf: bool = False
+    errors: Dict[str, str]
+    values: MultiDict
+
+    def __init__(self):
+        self.errors = {}
+        self.values = MultiDict()
+
+
+def stream_multipart(
+    request: "Request",
+    schema: Optional["Schema"] = None,
+    csrf_name: str = "csrf_",
+    csrf_token: Optional[str] = None,
+    validate_fields: bool = True,
+    state: Optional[Any] = None,
+) -> StreamedSubmission:
+    """
+    Reads a `multipart/form-data` request body as a stream, rejecting it as
+    soon as a scalar (non-file) field fails.
+
+    As each scalar field arrives:
+
+    * if `csrf_token` is provided and the field is `csrf_name`, the value
+      must equal `csrf_token`.
+    * if `validate_fields` is `True`, the field is validated by the matching
+      field validator of the compiled `schema`, with `state`.  This is
+      skipped for schemas that can not be compiled or use `pre_validators`,
+      as the submitted names may not correspond to the schema's fields.
+
+    On a failure, reading stops.  Any remaining upload parts are never read,
+    so they are not spooled to disk by webob.  ``request.POST`` will only
+    contain the scalar fields that were read.
+
+    If the body passes, it is installed as a seekable body on the request,
+    and ``request.POST`` parses it as usual.  The body is buffered into a
+    `tempfile.SpooledTemporaryFile` bounded by
+    ``request.request_body_tempfile_limit``, just as webob would.  An
+    accepted body is therefore read twice: once while it is scanned and
+    copied, and again when webob parses (and spools the uploads of) the copy.
+    """
+    if __debug__:
+        log.debug("stream_multipart - starting...")
+    submission = StreamedSubmission()
+    boundary = _get_boundary(request)
+    content_length = request.content_length
+    if not boundary or content_length is None:
+        raise ValueError("`request` does not have a streamable multipart body")
+
+    field_validators: Dict[str, Any] = {}
+    if validate_fields and (schema is not None):
+        _compiled = get_compiled_schema(schema)
+        if _compiled.is_compiled and not _compiled.pre_validators:
+            field_validators = _compiled.fields_to_python
+
+    charset = request.charset or "UTF-8"
+    chunk_size = _defaults.STREAMING_CHUNK_SIZE
+    body_raw = request.body_file_raw
+    tee = tempfile.SpooledTemporaryFile(max_size=request.request_body_tempfile_limit)
+    scanner = MultipartScanner(boundary)
+
+    part_name: Optional[str] = None
+    part_data: Optional[List[bytes]] = None  # `None` for uploads
+    remaining = content_length
+    try:
+        while remaining > 0 and not submission.is_rejected:
+            chunk = body_raw.read(min(chunk_size, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            tee.write(chunk)
+            for event, payload in scanner.feed(chunk):
+                if event == PART_START:
+                    (part_name, _filename) = payload
+                    part_data = [] if _filename is None else None
+                elif event == PART_DATA:
+                    if part_data is not None:
+                        part_data.append(payload)
+                elif event == PART_END:
+                    if (part_name is None) or (part_data is None):
+                        continue
+                    try:
+                        value = b"".join(part_data).decode(charset)
+                    except UnicodeDecodeError:
+                        continue
+                    _is_repeated = part_name in submission.values
+                    submission.values.add(part_name, value)
+                    _check_field(
+                        submission,
+                        part_name,
+                        value,
+                        field_validators if not _is_repeated else None,
+                        csrf_name,
+                        csrf_token,
+                        state,
+                    )
+                    if submission.is_rejected:
+                        break
+    except MalformedMultipart as exc:
+        # leave the body for webob to handle
+        if __debug__:
+            log.debug("stream_multipart - malformed body: %s", exc)
+        submission.errors = {}
+        submission.is_rejected = submission.is_error_csrf = False
+        while remaining > 0:
+            chunk = body_raw.read(min(chunk_size, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            tee.write(chunk)
+
+    tee.seek(0)
+    request.body_file_raw = tee
+    if submission.is_rejected:
+        if __debug__:
+            log.debug("stream_multipart - rejected: %s", submission.errors)
+        # `request.POST` will return the fields that were read
+        request.environ["webob._parsed_post_vars"] = (submission.values, tee)
+    else:
+        request.is_body_seekable = True
+    return submission
+
+
+def _check_field(
+    submission: StreamedSubmission,
+    name: str,
+    value: str,
+    field_validators: Optional[Dict[str, Any]],
+    csrf_name: str,
+    csrf_token: Optional[str],
+    state: Optional[Any] = None,
+) -> None:
+    if (csrf_token is not None) and (name == csrf_name):
+        if not csrf_token_matches(value, csrf_token):
+            submission.is_rejected = True
+            submission.is_error_csrf = True
+        return
+    if field_validators:
+        to_python = field_validators.get(name)
+        if to_python is not None:
+            try:
+                to_python(value, state)
+            except Invalid as exc:
+                submission.is_rejected = True
+                submission.errors[name] = str(exc)
+
+
+__all__ = (
+    "MalformedMultipart",
+    "MultipartScanner",
+    "StreamedSubmission",
+    "is_streamable",
+    "stream_multipart",
+)
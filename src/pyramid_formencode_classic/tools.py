@@ -1,4 +1,6 @@
 # stdlib
+import functools
+import json
 from typing import Any
 from typing import Dict
 from typing import Union
@@ -6,6 +8,7 @@ from typing import Union
 # pypi
 import formencode
 from formencode.api import NoDefault
+from formencode.foreach import ForEach
 from formencode.validators import FancyValidator
 from formencode.validators import FormValidator
 from formencode.validators import OneOf
@@ -13,32 +16,41 @@ from formencode.validators import OneOf
 # ==============================================================================
 
 
-def document_form(form: formencode.schema.Schema) -> Dict:
+def _document_validator(validator: Union[FancyValidator, FormValidator]) -> Dict:
+    if isinstance(validator, type):
+        # a `Schema` class used as a validator
+        validator = validator()
+    subdict: Dict[str, Any] = {"type": None}
+    if isinstance(validator, FancyValidator):
+        if_missing = validator.if_missing
+        if if_missing is not NoDefault:
+            subdict["if_missing"] = if_missing
+        subdict["not_empty"] = validator.not_empty
+    for attr in (
+        "max",
+        "min",
+        "missing",
+        "only_one_ofs",  # pyramid_formencode_classic.validators.OnlyOneOf
+        "present",
+        "required",
+    ):
+        if hasattr(validator, attr):
+            subdict[attr] = getattr(validator, attr)
+
+    subdict["type"] = validator.__class__.__name__
+    if isinstance(validator, OneOf):
+        subdict["options"] = validator.list
+
+    # descend into nested validators
+    if isinstance(validator, formencode.Schema):
+        subdict["fields"] = _document_schema(validator)
+    elif isinstance(validator, ForEach):
+        subdict["validators"] = [_document_validator(i) for i in validator.validators]
+
+    return subdict
 
-    def _document_validator(validator: Union[FancyValidator, FormValidator]) -> Dict:
-        subdict: Dict[str, Any] = {"type": None}
-        if isinstance(validator, FancyValidator):
-            if_missing = validator.if_missing
-            if if_missing is not NoDefault:
-                subdict["if_missing"] = if_missing
-            subdict["not_empty"] = validator.not_empty
-        for attr in (
-            "max",
-            "min",
-            "missing",
-            "only_one_ofs",  # pyramid_formencode_classic.validators.OnlyOneOf
-            "present",
-            "required",
-        ):
-            if hasattr(validator, attr):
-                subdict[attr] = getattr(validator, attr)
-
-        subdict["type"] = validator.__class__.__name__
-        if isinstance(validator, OneOf):
-            subdict["options"] = validator.list
-
-        return subdict
 
+def _document_schema(form: formencode.schema.Schema) -> Dict:
     rval: Dict[str, Any] = {}
     for field, validator in form.fields.items():
         rval[field] = _document_validator(validator)
@@ -51,3 +63,39 @@ def document_form(form: formencode.schema.Schema) -> Dict:
             ]
 
     return rval
+
+
+def document_form(form: formencode.schema.Schema) -> Dict:
+    """
+    Documents the fields and `chained_validators` of `form`.
+
+    Nested `Schema` fields are documented under ``"fields"``, and the
+    validators of `ForEach` fields under ``"validators"``.
+
+    A new `dict` is built on each invocation; see `document_form_json` for a
+    memoized serialization.
+    """
+    return _document_schema(form)
+
+
+@functools.lru_cache(maxsize=256)
+def document_form_json(form: formencode.schema.Schema) -> str:
+    """
+    Returns `document_form(form)` as compact JSON, memoized per schema class
+    or instance.
+
+    Values which JSON can not represent are serialized as their `str`.
+    Clear the memoized documents with `document_form_json.cache_clear()`.
+    """
+    return json.dumps(
+        document_form(form),
+        default=str,
+        separators=(",", ":"),
+        sort_keys=True,
+    )
+
+
+__all__ = (
+    "document_form",
+    "document_form_json",
+)
@@ -1,7 +1,16 @@
 # stdlib
+import hmac
 import logging
 import sys
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Tuple
 from typing import TYPE_CHECKING
+from typing import Union
+
+# pypi
+from formencode.api import Invalid
 
 # local
 from ._utils import TYPES_ERRORS
@@ -27,6 +36,91 @@ def determine_response_charset(response: "Response") -> str:
     return charset
 
 
+def csrf_token_matches(submitted: Any, csrf_token: str) -> bool:
+    """
+    Compares a `submitted` csrf token to `csrf_token` in constant time.
+
+    A missing or non-string submission (e.g. an upload) never matches.
+    """
+    if not isinstance(submitted, str):
+        return False
+    return hmac.compare_digest(submitted.encode("utf-8"), csrf_token.encode("utf-8"))
+
+
+def unpack_errors(
+    error: Union[Invalid, Dict[str, Any]],
+    encode_variables: bool = False,
+    dict_char: str = ".",
+    list_char: str = "-",
+) -> Any:
+    """
+    An iterative `formencode.Invalid.unpack_errors`, with identical output.
+
+    `error` is an `Invalid`, or the `error_dict` of one.  The nested errors
+    are unpacked with an explicit stack instead of one recursive call (and
+    one `variable_encode` call) per level.  If `encode_variables` is true, the
+    errors are flattened as `variable_encode` would, and empty ones dropped;
+    an `error` without an `error_dict` then returns its message rather than
+    failing an assertion.
+    """
+    root: List[Any] = [None]
+    # (error, container, key)
+    stack: List[Tuple[Any, Any, Any]] = []
+    if isinstance(error, dict):
+        root[0] = {}
+        for name, item in error.items():
+            root[0][name] = None  # reserve the position of the key
+            stack.append((item, root[0], name))
+    else:
+        stack.append((error, root, 0))
+    while stack:
+        (item, container, key) = stack.pop()
+        if isinstance(item, str) or not item:
+            container[key] = item
+        elif item.error_list:
+            sub_list: List[Any] = [None] * len(item.error_list)
+            container[key] = sub_list
+            for index, sub_item in enumerate(item.error_list):
+                stack.append((sub_item, sub_list, index))
+        elif item.error_dict:
+            sub_dict: Dict[Any, Any] = {}
+            container[key] = sub_dict
+            for name, sub_item in item.error_dict.items():
+                sub_dict[name] = None
+                stack.append((sub_item, sub_dict, name))
+        else:
+            container[key] = item.msg
+    unpacked = root[0]
+    if not encode_variables or not isinstance(unpacked, dict):
+        return unpacked
+
+    # mirrors `formencode.variabledecode.variable_encode(add_repetitions=False)`
+    encoded: Dict[Any, Any] = {}
+    # (value, prefix); pushed in reverse, so popped in order
+    pending: List[Tuple[Any, Any]] = [(unpacked, "")]
+    while pending:
+        (value, prefix) = pending.pop()
+        if isinstance(value, dict):
+            _children = []
+            for name, sub_value in value.items():
+                if name is None:
+                    _name = prefix
+                elif not prefix:
+                    _name = name
+                else:
+                    _name = "%s%s%s" % (prefix, dict_char, name)
+                _children.append((sub_value, _name))
+            pending.extend(reversed(_children))
+        elif isinstance(value, list):
+            pending.extend(
+                (sub_value, "%s%s%i" % (prefix, list_char, index))
+                for (index, sub_value) in reversed(list(enumerate(value)))
+            )
+        else:
+            encoded[prefix] = value
+    return {k: v for (k, v) in encoded.items() if v}
+
+
 def encode_formencode_errors(
     errors: TYPES_ERRORS,
     encoding: str,
@@ -6,12 +6,36 @@ from typing import Optional
 
 # pypi
 from formencode.validators import _
+from formencode.validators import FancyValidator
 from formencode.validators import FormValidator
 from formencode.validators import Invalid
 
 # ==============================================================================
 
 
+class AsyncValidator(FancyValidator):
+    """
+    A field validator with an asynchronous check, such as a uniqueness lookup
+    in a database or a call to a remote service.
+
+    The synchronous `to_python` only performs the stock `FancyValidator`
+    processing (e.g. `not_empty`, `strip`).  `api.form_validate_async` then
+    awaits `to_python_async` on the result of every `AsyncValidator` field of
+    the schema concurrently.
+
+    Subclasses implement `_convert_to_python_async`, which should raise
+    `Invalid` or return the converted value.
+
+    Only the top-level fields of a schema are awaited.
+    """
+
+    async def to_python_async(self, value: Any, state: Optional[Any] = None) -> Any:
+        return await self._convert_to_python_async(value, state)
+
+    async def _convert_to_python_async(self, value: Any, state: Any) -> Any:
+        return value
+
+
 class OnlyOneOf(FormValidator):
     # Field that only one of is allowed
     only_one_ofs: List[str]
@@ -0,0 +1,156 @@
+# stdlib
+import functools
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Mapping
+from typing import Optional
+from typing import Set
+from typing import Tuple
+from typing import Union
+
+# local
+from .limits import LimitExceeded
+
+# ==============================================================================
+
+# a parsed key: the path of dict keys and list indexes
+TYPE_PATH = Tuple[Union[str, int], ...]
+
+_REPETITIONS = "--repetitions"
+_REPETITIONS_LEN = len(_REPETITIONS)
+
+# ------------------------------------------------------------------------------
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_key(
+    key: str,
+    dict_char: str,
+    list_char: str,
+) -> Tuple[TYPE_PATH, bool, Tuple[TYPE_PATH, ...]]:
+    """
+    Parses a flat key into `(path, is_repetitions, lists)`, where `lists` are
+    the paths of the lists the key is a member of.
+
+    Field names repeat across submissions, so parses are memoized.
+    """
+    new_keys: List[Union[str, int]] = []
+    lists: List[TYPE_PATH] = []
+    for subkey in key.split(dict_char):
+        if subkey.endswith(_REPETITIONS):
+            new_keys.append(subkey[:-_REPETITIONS_LEN])
+            return (tuple(new_keys), True, tuple(lists))
+        elif list_char in subkey:
+            maybe_key, index = subkey.split(list_char, 1)
+            if not index.isdigit():
+                new_keys.append(subkey)
+            else:
+                new_keys.append(maybe_key)
+                lists.append(tuple(new_keys))
+                new_keys.append(int(index))
+        else:
+            new_keys.append(subkey)
+    return (tuple(new_keys), False, tuple(lists))
+
+
+def _sort_key(item: Tuple[Any, Any]) -> Tuple[bool, Any]:
+    """mirrors `formencode.variabledecode._sort_key`"""
+    key = item[0]
+    return not isinstance(key, int), key
+
+
+def variable_decode(
+    d: Mapping,
+    dict_char: str = ".",
+    list_char: str = "-",
+    max_list_length: Optional[int] = None,
+) -> Dict:
+    """
+    Decode the flat dictionary `d` into a nested structure.
+
+    A drop-in replacement for `formencode.variabledecode.variable_decode`
+    which returns identical output; the parsing of each key is memoized.
+
+    If `max_list_length` is provided, a `limits.LimitExceeded` is raised
+    before any list would have more members, including a ``--repetitions``
+    padding.
+    """
+    result: Dict = {}
+    dicts_to_sort: Set[TYPE_PATH] = set()
+    known_lengths: Dict[TYPE_PATH, int] = {}
+    list_members: Dict[TYPE_PATH, Set[Union[str, int]]] = {}
+    for key, value in d.items():
+        (new_keys, is_repetitions, lists) = _parse_key(key, dict_char, list_char)
+        dicts_to_sort.update(lists)
+        if is_repetitions:
+            known_lengths[new_keys] = int(value)
+            if (max_list_length is not None) and (
+                known_lengths[new_keys] > max_list_length
+            ):
+                raise LimitExceeded(
+                    "max_list_length",
+                    "`%s` exceeds %s members" % (key, max_list_length),
+                )
+            continue
+        if (max_list_length is not None) and lists:
+            for path in lists:
+                members = list_members.setdefault(path, set())
+                members.add(new_keys[len(path)])
+                if len(members) > max_list_length:
+                    raise LimitExceeded(
+                        "max_list_length",
+                        "`%s` exceeds %s members" % (key, max_list_length),
+                    )
+
+        place = result
+        for subkey in new_keys[:-1]:
+            try:
+                if not isinstance(place[subkey], dict):
+                    place[subkey] = {None: place[subkey]}
+                place = place[subkey]
+            except KeyError:
+                place[subkey] = place = {}
+        last = new_keys[-1]
+        if last in place:
+            existing = place[last]
+            if isinstance(existing, dict):
+                existing[None] = value
+            elif isinstance(existing, list):
+                if isinstance(value, list):
+                    existing.extend(value)
+                else:
+                    existing.append(value)
+            else:
+                if isinstance(value, list):
+                    place[last] = [existing]
+                    place[last].extend(value)
+                else:
+                    place[last] = [existing, value]
+        else:
+            place[last] = value
+
+    for path in sorted(dicts_to_sort, key=len, reverse=True):
+        to_sort = result
+        source: Dict = {}
+        last_key = None
+        for sub_key in path:
+            source = to_sort
+            last_key = sub_key
+            to_sort = to_sort[sub_key]
+        items: Any
+        if None in to_sort:
+            items = [(0, x) for x in to_sort.pop(None)]
+            items.extend(to_sort.items())
+        else:
+            items = to_sort.items()
+        values = [x[1] for x in sorted(items, key=_sort_key)]
+        if path in known_lengths:
+            if len(values) < known_lengths[path]:
+                values.extend([""] * (known_lengths[path] - len(values)))
+        source[last_key] = values
+
+    return result
+
+
+__all__ = ("variable_decode",)
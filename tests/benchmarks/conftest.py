@@ -0,0 +1,26 @@
+# stdlib
+import os
+
+# pypi
+import pytest
+
+# ==============================================================================
+
+# benchmarks are slow, so they only run when requested:
+#   pytest tests/benchmarks --benchmark-only
+#   PYRAMID_FORMENCODE_CLASSIC__BENCHMARKS=1 pytest
+ENV_BENCHMARKS = bool(int(os.getenv("PYRAMID_FORMENCODE_CLASSIC__BENCHMARKS", "0")))
+
+
+def pytest_collection_modifyitems(config, items):
+    if ENV_BENCHMARKS:
+        return
+    if config.getoption("benchmark_only", default=False):
+        return
+    if config.getoption("benchmark_enable", default=False):
+        return
+    skip = pytest.mark.skip(reason="run with `--benchmark-only` to benchmark")
+    _here = os.path.dirname(__file__)
+    for item in items:
+        if str(item.fspath).startswith(_here):
+            item.add_marker(skip)
@@ -0,0 +1,259 @@
+"""
+Benchmarks of the validate and reprint hot paths.
+
+Run with::
+
+    pytest tests/benchmarks --benchmark-only
+
+Save a baseline, then compare a later run against it; the comparison fails if
+the mean of a benchmark regressed by more than 10%::
+
+    tox -e bench-baseline
+    tox -e bench-compare
+
+The bytes allocated by one call of each benchmarked function are reported as
+`allocated_bytes` in the `extra_info` of each benchmark.
+"""
+
+# stdlib
+import tracemalloc
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Tuple
+
+# pypi
+import formencode
+from pyramid import testing
+from pyramid.response import Response
+import pytest
+from webob.multidict import MultiDict
+
+# local
+import pyramid_formencode_classic
+from pyramid_formencode_classic.objects import FormStash
+from ..test_core import DummyRequest
+
+pytest.importorskip("pytest_benchmark")
+
+# ==============================================================================
+
+
+def _make_schema(name: str, count: int) -> Any:
+    fields: Dict[str, Any] = {
+        "allow_extra_fields": True,
+        "filter_extra_fields": True,
+    }
+    for i in range(count):
+        if i % 3 == 0:
+            fields["field_%s" % i] = formencode.validators.Int(not_empty=True)
+        elif i % 3 == 1:
+            fields["field_%s" % i] = formencode.validators.Email(not_empty=True)
+        else:
+            fields["field_%s" % i] = formencode.validators.UnicodeString(
+                not_empty=False, if_missing=None, max=255
+            )
+    return type(name, (formencode.Schema,), fields)
+
+
+def _make_submission(count: int, valid: bool = True) -> MultiDict:
+    submission = MultiDict()
+    for i in range(count):
+        if i % 3 == 0:
+            submission["field_%s" % i] = str(i) if valid else "x%s" % i
+        elif i % 3 == 1:
+            submission["field_%s" % i] = "user%s@example.com" % i
+        else:
+            submission["field_%s" % i] = "value %s" % i
+    return submission
+
+
+def _make_document(count: int, form: str = "") -> str:
+    _form = ' data-formencode-form="%s"' % form if form else ""
+    rows = []
+    for i in range(count):
+        rows.append(
+            """<div class="form-group">"""
+            """<label for="field_%(i)s">Field %(i)s</label>"""
+            """<form:error name="field_%(i)s"%(form)s/>"""
+            """<input type="text" name="field_%(i)s" id="field_%(i)s"%(form)s/>"""
+            """</div>""" % {"i": i, "form": _form}
+        )
+    return (
+        """<form method="POST" action="/">"""
+        """<form:error name="Error_Main"%s/>%s"""
+        """<select name="choice"><option value="a">a</option></select>"""
+        """<textarea name="notes"></textarea>"""
+        """</form>""" % (_form, "\n".join(rows))
+    )
+
+
+SIZES: Dict[str, int] = {"small": 3, "medium": 15, "huge": 120}
+SCHEMAS: Dict[str, Any] = {
+    size: _make_schema("Form_%s" % size, count) for (size, count) in SIZES.items()
+}
+DOCUMENTS: Dict[str, str] = {
+    size: "<html><body>%s</body></html>" % _make_document(count)
+    for (size, count) in SIZES.items()
+}
+
+
+class Form_LineItem(formencode.Schema):
+    sku = formencode.validators.UnicodeString(not_empty=True)
+    qty = formencode.validators.Int(not_empty=True, min=1)
+    price = formencode.validators.Number(not_empty=True)
+
+
+class Form_Order(formencode.Schema):
+    allow_extra_fields = True
+    filter_extra_fields = True
+    email = formencode.validators.Email(not_empty=True)
+    items = formencode.foreach.ForEach(Form_LineItem())
+
+
+def _make_order(rows: int) -> MultiDict:
+    submission = MultiDict(email="a@example.com")
+    for i in range(rows):
+        submission["items-%s.sku" % i] = "SKU-%s" % i
+        submission["items-%s.qty" % i] = str(i + 1)
+        submission["items-%s.price" % i] = "%s.99" % i
+    return submission
+
+
+# ------------------------------------------------------------------------------
+
+
+@pytest.fixture
+def request_():
+    config = testing.setUp()
+    config.include("pyramid_formencode_classic")
+    request = DummyRequest()
+    request.pyramid_formencode_classic = (
+        pyramid_formencode_classic._new_request_FormStashList(request)
+    )
+    yield request
+    testing.tearDown()
+
+
+def _run(benchmark: Any, func: Callable, *args, **kwargs) -> Any:
+    """benchmarks `func` and records the bytes allocated by a single call"""
+    tracemalloc.start()
+    try:
+        func(*args, **kwargs)
+        (_current, _peak) = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    benchmark.extra_info["allocated_bytes"] = _peak
+    return benchmark(func, *args, **kwargs)
+
+
+def _validated(request: Any, size: str, valid: bool = True) -> Tuple[bool, Any]:
+    request.POST = _make_submission(SIZES[size], valid=valid)
+    return pyramid_formencode_classic.form_validate(request, schema=SCHEMAS[size])
+
+
+# ------------------------------------------------------------------------------
+
+
+@pytest.mark.parametrize("size", list(SIZES.keys()))
+def test_validate(benchmark, request_, size):
+    request_.POST = _make_submission(SIZES[size])
+    (result, formStash) = _run(
+        benchmark,
+        pyramid_formencode_classic.form_validate,
+        request_,
+        schema=SCHEMAS[size],
+    )
+    assert result
+
+
+@pytest.mark.parametrize("size", list(SIZES.keys()))
+def test_validate_invalid(benchmark, request_, size):
+    request_.POST = _make_submission(SIZES[size], valid=False)
+    (result, formStash) = _run(
+        benchmark,
+        pyramid_formencode_classic.form_validate,
+        request_,
+        schema=SCHEMAS[size],
+    )
+    assert not result
+
+
+@pytest.mark.parametrize("rows", [10, 250])
+def test_validate_variable_decode(benchmark, request_, rows):
+    request_.POST = _make_order(rows)
+    (result, formStash) = _run(
+        benchmark,
+        pyramid_formencode_classic.form_validate,
+        request_,
+        schema=Form_Order,
+        variable_decode=True,
+    )
+    assert result
+    assert len(formStash.results["items"]) == rows
+
+
+@pytest.mark.parametrize("size", list(SIZES.keys()))
+def test_reprint(benchmark, request_, size):
+    (result, formStash) = _validated(request_, size, valid=False)
+    assert not result
+
+    def _print_form():
+        return Response(DOCUMENTS[size])
+
+    response = _run(
+        benchmark,
+        pyramid_formencode_classic.form_reprint,
+        request_,
+        _print_form,
+    )
+    assert 'value="user1@example.com"' in response.text
+
+
+def test_reprint_multiform(benchmark, request_):
+    request_.POST = _make_submission(SIZES["medium"], valid=False)
+    for form_stash in ("a", "b"):
+        pyramid_formencode_classic.form_validate(
+            request_, schema=SCHEMAS["medium"], form_stash=form_stash
+        )
+    document = "<html><body>%s%s</body></html>" % (
+        _make_document(SIZES["medium"], form="a"),
+        _make_document(SIZES["medium"], form="b"),
+    )
+
+    def _print_form():
+        return Response(document)
+
+    def _reprint_all():
+        for form_stash in ("a", "b"):
+            response = pyramid_formencode_classic.form_reprint(
+                request_,
+                _print_form,
+                form_stash=form_stash,
+                data_formencode_form=form_stash,
+            )
+        return response
+
+    response = _run(benchmark, _reprint_all)
+    assert "user1@example.com" in response.text
+
+
+@pytest.mark.parametrize("errors", [1, 50])
+def test_set_error(benchmark, errors):
+    def _set_errors():
+        formStash = FormStash(schema=SCHEMAS["huge"])
+        for i in range(errors):
+            formStash.set_error(field="field_%s" % i, message="Invalid")
+        return formStash
+
+    formStash = _run(benchmark, _set_errors)
+    assert formStash.count_errors() == errors
+
+
+def test_form_cleanup(benchmark, request_):
+    for form_stash in ("a", "b", "c"):
+        request_.POST = _make_submission(SIZES["medium"])
+        pyramid_formencode_classic.form_validate(
+            request_, schema=SCHEMAS["medium"], form_stash=form_stash
+        )
+    _run(benchmark, pyramid_formencode_classic._form_cleanup, request_)
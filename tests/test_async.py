@@ -0,0 +1,93 @@
+# stdlib
+import asyncio
+import time
+import unittest
+
+# pypi
+import formencode
+
+# local
+import pyramid_formencode_classic
+from pyramid_formencode_classic import _defaults
+from pyramid_formencode_classic.exceptions import FormInvalid
+from pyramid_formencode_classic.validators import AsyncValidator
+from .test_core import _TestHarness
+
+# ==============================================================================
+
+
+class SlowUnique(AsyncValidator):
+    taken = ("taken",)
+
+    async def _convert_to_python_async(self, value, state):
+        await asyncio.sleep(0.1)
+        if value in self.taken:
+            raise formencode.Invalid("That is taken.", value, state)
+        return value.upper()
+
+
+class Form_Async(formencode.Schema):
+    username = SlowUnique(not_empty=True)
+    nickname = SlowUnique(not_empty=True)
+    age = formencode.validators.Int(not_empty=False, if_missing=None)
+
+
+class TestFormValidateAsync(_TestHarness, unittest.TestCase):
+    def test_valid(self):
+        self.request.POST["username"] = "a"
+        self.request.POST["nickname"] = "b"
+        _start = time.time()
+        (result, formStash) = asyncio.run(
+            pyramid_formencode_classic.form_validate_async(
+                self.request, schema=Form_Async
+            )
+        )
+        # the validators were awaited concurrently
+        self.assertLess(time.time() - _start, 0.19)
+        self.assertTrue(result)
+        self.assertEqual(
+            formStash.results, {"username": "A", "nickname": "B", "age": None}
+        )
+        self.assertIs(self.request.pyramid_formencode_classic["_default"], formStash)
+
+    def test_invalid(self):
+        self.request.POST["username"] = "taken"
+        self.request.POST["nickname"] = "b"
+        (result, formStash) = asyncio.run(
+            pyramid_formencode_classic.form_validate_async(
+                self.request, schema=Form_Async
+            )
+        )
+        self.assertFalse(result)
+        self.assertEqual(
+            formStash.errors,
+            {
+                "username": "That is taken.",
+                "Error_Main": _defaults.DEFAULT_ERROR_MAIN_TEXT,
+            },
+        )
+
+    def test_invalid_raise(self):
+        self.request.POST["username"] = "a"
+        self.request.POST["nickname"] = "taken"
+        with self.assertRaises(FormInvalid) as cm:
+            asyncio.run(
+                pyramid_formencode_classic.form_validate_async(
+                    self.request, schema=Form_Async, raise_FormInvalid=True
+                )
+            )
+        self.assertIn("nickname", cm.exception.formStash.errors)
+
+    def test_invalid_sync(self):
+        # the async validators are not awaited if the sync pass fails
+        self.request.POST["username"] = "taken"
+        self.request.POST["nickname"] = "b"
+        self.request.POST["age"] = "x"
+        (result, formStash) = asyncio.run(
+            pyramid_formencode_classic.form_validate_async(
+                self.request, schema=Form_Async
+            )
+        )
+        self.assertFalse(result)
+        self.assertIn("age", formStash.errors)
+        self.assertNotIn("username", formStash.errors)
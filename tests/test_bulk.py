@@ -0,0 +1,128 @@
+# stdlib
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+from typing import Tuple
+import unittest
+
+# pypi
+from webob.multidict import MultiDict
+
+# local
+from pyramid_formencode_classic import bulk
+from .test_compiled import Form_Compiled
+
+# ==============================================================================
+
+
+ROWS: Tuple[Any, ...] = (
+    {"email": "a@example.com", "username": "ab"},
+    MultiDict([("email", "b@example.com"), ("username", "cd"), ("tags", "1")]),
+    {"email": "not-an-email", "username": "ab", "age": "x"},
+    {},
+)
+
+EXPECTED = [
+    (
+        True,
+        {
+            "email": "a@example.com",
+            "username": "ab",
+            "age": None,
+            "tags": [],
+            "id": None,
+            "unicode_string": None,
+        },
+        {},
+    ),
+    (
+        True,
+        {
+            "email": "b@example.com",
+            "username": "cd",
+            "age": None,
+            "tags": [1],
+            "id": None,
+            "unicode_string": None,
+        },
+        {},
+    ),
+    (
+        False,
+        {},
+        {
+            "email": "An email address must contain a single @",
+            "age": "Please enter an integer value",
+        },
+    ),
+    (
+        False,
+        {},
+        {"email": "Missing value", "username": "Missing value"},
+    ),
+]
+
+
+class TestValidateMany(unittest.TestCase):
+    def test_serial(self):
+        results = bulk.validate_many(Form_Compiled, iter(ROWS))
+        self.assertFalse(isinstance(results, list))
+        self.assertEqual(list(results), EXPECTED)
+
+    def test_executor(self):
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            self.assertEqual(
+                list(bulk.validate_many(Form_Compiled, ROWS, executor=executor)),
+                EXPECTED,
+            )
+
+    def test_executor_bounded(self):
+        consumed = []
+
+        def _rows():
+            for i in range(100):
+                consumed.append(i)
+                yield ROWS[0]
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            results = bulk.validate_many(
+                Form_Compiled,
+                _rows(),
+                executor=executor,
+                chunk_size=3,
+                max_in_flight=2,
+            )
+            self.assertEqual(next(results), EXPECTED[0])
+            self.assertEqual(len(consumed), 6)
+
+            consumed[:] = []
+            results = bulk.validate_many(
+                Form_Compiled, _rows(), executor=executor, chunk_size=3
+            )
+            self.assertEqual(next(results), EXPECTED[0])
+            # `_defaults.BULK_MAX_IN_FLIGHT` chunks
+            self.assertEqual(len(consumed), 12)
+
+    def test_variable_decode(self):
+        self.assertEqual(
+            bulk.validate_row(
+                Form_Compiled,
+                {"email": "a@example.com", "username": "ab", "tags-0": "1"},
+                variable_decode=True,
+            )[1]["tags"],
+            [1],
+        )
+
+    def test_processes(self):
+        rows = (row for row in ROWS * 5)
+        self.assertEqual(
+            list(bulk.validate_many(Form_Compiled, rows, processes=2, chunk_size=3)),
+            EXPECTED * 5,
+        )
+        with self.assertRaises(ValueError):
+            with ProcessPoolExecutor(max_workers=1) as executor:
+                list(
+                    bulk.validate_many(
+                        Form_Compiled, ROWS, executor=executor, processes=2
+                    )
+                )
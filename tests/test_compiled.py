@@ -0,0 +1,367 @@
+# stdlib
+from concurrent.futures import ThreadPoolExecutor
+import time
+from typing import Any
+from typing import Dict
+from typing import Tuple
+import unittest
+
+# pypi
+import formencode
+
+# local
+import pyramid_formencode_classic
+from pyramid_formencode_classic import _defaults
+from pyramid_formencode_classic import compiled
+import pyramid_formencode_classic.validators
+from .test_core import _TestHarness
+
+# ==============================================================================
+
+
+class Form_Compiled(formencode.Schema):
+    allow_extra_fields = True
+    filter_extra_fields = True
+
+    email = formencode.validators.Email(not_empty=True)
+    username = formencode.validators.UnicodeString(not_empty=True, min=2)
+    age = formencode.validators.Int(not_empty=False, if_missing=None)
+    tags = formencode.foreach.ForEach(formencode.validators.Int())
+    id = formencode.validators.Int(not_empty=False, if_missing=None)
+    unicode_string = formencode.validators.UnicodeString(
+        not_empty=False, if_missing=None
+    )
+
+    chained_validators = [
+        pyramid_formencode_classic.validators.OnlyOneOf(
+            ("id", "unicode_string"), not_empty=False
+        ),
+    ]
+
+
+class Form_Strict(formencode.Schema):
+    allow_extra_fields = False
+    email = formencode.validators.Email(not_empty=True)
+
+
+class Form_Unfiltered(formencode.Schema):
+    allow_extra_fields = True
+    filter_extra_fields = False
+    email = formencode.validators.Email(not_empty=True)
+
+
+class Form_IgnoreKeyMissing(formencode.Schema):
+    ignore_key_missing = True
+    email = formencode.validators.Email(not_empty=True)
+    username = formencode.validators.UnicodeString()
+
+
+class Form_IfKeyMissing(formencode.Schema):
+    if_key_missing = ""
+    email = formencode.validators.Email(not_empty=True)
+    username = formencode.validators.UnicodeString()
+
+
+class Form_PreValidators(formencode.Schema):
+    pre_validators = [formencode.variabledecode.NestedVariables()]
+    chained_validators = [
+        formencode.validators.FieldsMatch("password", "password_confirm"),
+    ]
+    password = formencode.validators.UnicodeString(not_empty=True)
+    password_confirm = formencode.validators.UnicodeString(not_empty=True)
+
+
+class Form_Custom(formencode.Schema):
+    email = formencode.validators.Email(not_empty=True)
+
+    def _convert_to_python(self, value_dict, state):
+        value_dict = dict(value_dict)
+        value_dict.setdefault("email", "custom@example.com")
+        return formencode.Schema._convert_to_python(self, value_dict, state)
+
+
+SUBMISSIONS: Tuple[Dict, ...] = (
+    {},
+    {"email": "a@example.com", "username": "ab"},
+    {"email": "a@example.com", "username": "ab", "extra": "1"},
+    {"email": "a@example.com", "username": "a", "age": "x"},
+    {"email": "not-an-email", "tags": ["1", "2", "x"]},
+    {"email": "a@example.com", "age": ["1", "2"], "username": "ab"},
+    {"email": "a@example.com", "username": "ab", "id": "1", "unicode_string": "x"},
+    {"password": "a", "password_confirm": "b"},
+    {"password": "a", "password_confirm": "a"},
+)
+
+
+def _validate(validator: Any, value: Dict) -> Any:
+    try:
+        return (True, validator.to_python(value))
+    except formencode.Invalid as exc:
+        return (False, exc.unpack_errors())
+
+
+class TestCompiledSchema(unittest.TestCase):
+    def setUp(self):
+        compiled.invalidate_compiled_schema()
+
+    def tearDown(self):
+        compiled.invalidate_compiled_schema()
+
+    def test_equivalence(self):
+        for schema in (
+            Form_Compiled,
+            Form_Compiled(),
+            Form_Strict,
+            Form_Unfiltered,
+            Form_IgnoreKeyMissing,
+            Form_IfKeyMissing,
+            Form_PreValidators,
+        ):
+            _compiled = compiled.get_compiled_schema(schema)
+            self.assertTrue(_compiled.is_compiled)
+            for submission in SUBMISSIONS:
+                self.assertEqual(
+                    _validate(_compiled, dict(submission)),
+                    _validate(schema, dict(submission)),
+                    (schema, submission),
+                )
+
+    def test_equivalence_executor(self):
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            for schema in (
+                Form_Compiled,
+                Form_Strict,
+                Form_Unfiltered,
+                Form_IgnoreKeyMissing,
+                Form_IfKeyMissing,
+                Form_PreValidators,
+            ):
+                _compiled = compiled.get_compiled_schema(schema)
+                for submission in SUBMISSIONS:
+                    try:
+                        expected = (True, schema.to_python(dict(submission)))
+                    except formencode.Invalid as exc:
+                        expected = (False, (str(exc), exc.unpack_errors()))
+                    try:
+                        actual = (
+                            True,
+                            _compiled.to_python(dict(submission), executor=executor),
+                        )
+                    except formencode.Invalid as exc:
+                        actual = (False, (str(exc), exc.unpack_errors()))
+                    self.assertEqual(actual, expected, (schema, submission))
+
+    def test_validate_results(self):
+        for schema in (
+            Form_Compiled,
+            Form_Strict,
+            Form_Unfiltered,
+            Form_IgnoreKeyMissing,
+            Form_IfKeyMissing,
+            Form_PreValidators,
+            Form_Custom,
+        ):
+            _compiled = compiled.get_compiled_schema(schema)
+            for submission in SUBMISSIONS:
+                validated = _compiled.validate(dict(submission))
+                try:
+                    expected = schema.to_python(dict(submission))
+                    self.assertTrue(validated.is_valid, (schema, submission))
+                    self.assertEqual(validated.results, expected)
+                    self.assertIsNone(validated.as_invalid())
+                except formencode.Invalid as exc:
+                    self.assertFalse(validated.is_valid, (schema, submission))
+                    self.assertEqual(validated.unpack_errors(), exc.unpack_errors())
+                    invalid = validated.as_invalid()
+                    assert invalid is not None
+                    self.assertEqual(str(invalid), str(exc))
+                    if exc.error_dict:
+                        for dict_char, list_char in ((".", "-"), (":", "_")):
+                            self.assertEqual(
+                                validated.unpack_errors(True, dict_char, list_char),
+                                exc.unpack_errors(True, dict_char, list_char),
+                            )
+
+    def test_validate_results_executor(self):
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            _compiled = compiled.get_compiled_schema(Form_Compiled)
+            for submission in SUBMISSIONS:
+                validated = _compiled.validate(dict(submission), executor=executor)
+                try:
+                    expected = Form_Compiled.to_python(dict(submission))
+                    self.assertEqual(validated.results, expected)
+                except formencode.Invalid as exc:
+                    self.assertEqual(validated.unpack_errors(), exc.unpack_errors())
+
+    def test_fallback(self):
+        _compiled = compiled.get_compiled_schema(Form_Custom)
+        self.assertFalse(_compiled.is_compiled)
+        self.assertEqual(
+            _compiled.to_python({}),
+            {"email": "custom@example.com"},
+        )
+
+    def test_cache(self):
+        _compiled = compiled.get_compiled_schema(Form_Compiled)
+        self.assertIs(_compiled, compiled.get_compiled_schema(Form_Compiled))
+        self.assertEqual(
+            _compiled.field_names,
+            frozenset(("email", "username", "age", "tags", "id", "unicode_string")),
+        )
+
+        compiled.invalidate_compiled_schema(Form_Compiled)
+        self.assertIsNot(_compiled, compiled.get_compiled_schema(Form_Compiled))
+
+    def test_stale(self):
+        schema = formencode.Schema()
+        schema.add_field("a", formencode.validators.Int(not_empty=True))
+        _compiled = compiled.get_compiled_schema(schema)
+        self.assertEqual(_compiled.to_python({"a": "1"}), {"a": 1})
+        self.assertFalse(_compiled.is_stale)
+
+        # a field added after the schema was compiled is validated
+        schema.add_field("b", formencode.validators.Int(not_empty=True))
+        self.assertTrue(_compiled.is_stale)
+        _recompiled = compiled.get_compiled_schema(schema)
+        self.assertIsNot(_compiled, _recompiled)
+        self.assertEqual(
+            _validate(_recompiled, {"a": "1"}), (False, {"b": "Missing value"})
+        )
+        self.assertEqual(
+            _validate(_recompiled, {"a": "1"}), _validate(schema, {"a": "1"})
+        )
+
+        # as are chained validators
+        schema.add_chained_validator(formencode.validators.FieldsMatch("a", "b"))
+        self.assertTrue(_recompiled.is_stale)
+        self.assertFalse(
+            _validate(compiled.get_compiled_schema(schema), {"a": "1", "b": "2"})[0]
+        )
+
+    def test_cache_size(self):
+        _og_size = _defaults.COMPILED_SCHEMA_CACHE_SIZE
+        try:
+            _defaults.COMPILED_SCHEMA_CACHE_SIZE = 2
+            _first = compiled.get_compiled_schema(Form_Strict)
+            compiled.get_compiled_schema(Form_Unfiltered)
+            compiled.get_compiled_schema(Form_IfKeyMissing)
+            self.assertEqual(len(compiled._compiled_schemas), 2)
+            self.assertIsNot(_first, compiled.get_compiled_schema(Form_Strict))
+        finally:
+            _defaults.COMPILED_SCHEMA_CACHE_SIZE = _og_size
+
+
+class SlowInt(formencode.validators.Int):
+    def _convert_to_python(self, value, state):
+        time.sleep(0.1)
+        return formencode.validators.Int._convert_to_python(self, value, state)
+
+
+class Form_Slow(formencode.Schema):
+    a = SlowInt(not_empty=True)
+    b = SlowInt(not_empty=True)
+    c = SlowInt(not_empty=True)
+
+    chained_validators = [
+        pyramid_formencode_classic.validators.OnlyOneOf(("a", "d"), not_empty=True),
+    ]
+
+
+class _State(object):
+    def __init__(self):
+        self.seen = []
+
+
+class StateInt(formencode.validators.Int):
+    def _convert_to_python(self, value, state):
+        state.seen.append(value)
+        return formencode.validators.Int._convert_to_python(self, value, state)
+
+
+class Form_State(formencode.Schema):
+    a = StateInt(not_empty=True)
+    b = StateInt(not_empty=True)
+
+
+class TestCompiledSchemaValidate(_TestHarness, unittest.TestCase):
+    def test_validate(self):
+        self.request.POST["email"] = "a@example.com"
+        self.request.POST["username"] = "ab"
+        for use_compiled_schema in (True, False):
+            (result, formStash) = pyramid_formencode_classic.form_validate(
+                self.request,
+                schema=Form_Compiled,
+                use_compiled_schema=use_compiled_schema,
+            )
+            self.assertTrue(result)
+            self.assertEqual(
+                formStash.results,
+                {
+                    "email": "a@example.com",
+                    "username": "ab",
+                    "age": None,
+                    "tags": [],
+                    "id": None,
+                    "unicode_string": None,
+                },
+            )
+
+    def test_validation_results(self):
+        self.request.POST["email"] = "not-an-email"
+        self.request.POST["tags-0"] = "1"
+        self.request.POST["tags-1"] = "x"
+        for variable_decode in (False, True):
+            stashes = []
+            for use_validation_results in (False, True):
+                (result, formStash) = pyramid_formencode_classic.form_validate(
+                    self.request,
+                    schema=Form_Compiled,
+                    variable_decode=variable_decode,
+                    use_validation_results=use_validation_results,
+                    foreach_defense=False,
+                )
+                self.assertFalse(result)
+                stashes.append(formStash)
+            self.assertEqual(dict(stashes[0].errors), dict(stashes[1].errors))
+            self.assertEqual(stashes[0].results, stashes[1].results)
+
+    def test_validate_executor(self):
+        self.request.POST["a"] = "1"
+        self.request.POST["b"] = "2"
+        self.request.POST["c"] = "x"
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            _start = time.time()
+            (result, formStash) = pyramid_formencode_classic.form_validate(
+                self.request,
+                schema=Form_Slow,
+                executor=executor,
+            )
+            self.assertLess(time.time() - _start, 0.25)
+            self.assertFalse(result)
+            self.assertEqual(list(formStash.errors.keys()), ["c", "Error_Main"])
+
+            self.request.POST["c"] = "3"
+            (result, formStash) = pyramid_formencode_classic.form_validate(
+                self.request,
+                schema=Form_Slow,
+                executor=executor,
+            )
+            self.assertTrue(result)
+            self.assertEqual(formStash.results, {"a": 1, "b": 2, "c": 3})
+
+    def test_state(self):
+        self.request.POST["a"] = "1"
+        self.request.POST["b"] = "2"
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            for kwargs in (
+                {"use_compiled_schema": False},
+                {"use_compiled_schema": True},
+                {"use_validation_results": True},
+                {"executor": executor},
+            ):
+                state = _State()
+                (result, formStash) = pyramid_formencode_classic.form_validate(
+                    self.request, schema=Form_State, state=state, **kwargs
+                )
+                self.assertTrue(result, kwargs)
+                self.assertEqual(state.seen, ["1", "2"], kwargs)
@@ -0,0 +1,157 @@
+# stdlib
+import unittest
+
+# pypi
+from pyramid import testing
+from pyramid.exceptions import ConfigurationError
+from pyramid.interfaces import IRendererFactory
+
+# local
+import pyramid_formencode_classic
+from pyramid_formencode_classic import _defaults
+from pyramid_formencode_classic import compiled
+from pyramid_formencode_classic import config as pfc_config
+from pyramid_formencode_classic.instrumentation import StatsdCollector
+from .test_core import Form_EmailUsername
+
+# ==============================================================================
+
+
+class _DummyStatsd(object):
+    def __init__(self):
+        self.sent = []
+
+    def timing(self, stat, ms):
+        self.sent.append(stat)
+
+
+def statsd_collector():
+    """a `timings_collector` factory"""
+    return StatsdCollector(_DummyStatsd(), prefix="forms")
+
+
+class _DefaultsHarness(object):
+    def setUp(self):
+        self._og_defaults = {k: v for k, v in vars(_defaults).items() if k.isupper()}
+        self._og_cleanup = pyramid_formencode_classic.AUTOMATIC_CLEANUP
+
+    def tearDown(self):
+        for k, v in self._og_defaults.items():
+            setattr(_defaults, k, v)
+        pyramid_formencode_classic.AUTOMATIC_CLEANUP = self._og_cleanup
+        testing.tearDown()
+
+
+class TestApplySettings(_DefaultsHarness, unittest.TestCase):
+    def test_apply(self):
+        applied = pfc_config.apply_settings(
+            {
+                "pyramid_formencode_classic.use_fill_plans": "true",
+                "pyramid_formencode_classic.fill_plan_cache_size": "12",
+                "pyramid_formencode_classic.default_error_main_text": "Oops",
+                "pyramid_formencode_classic.timings_collector": (
+                    "tests.test_config.statsd_collector"
+                ),
+                "pyramid_formencode_classic.warmup": "false",
+                "other.setting": "1",
+            }
+        )
+        self.assertEqual(
+            applied,
+            {
+                "USE_FILL_PLANS": True,
+                "FILL_PLAN_CACHE_SIZE": 12,
+                "DEFAULT_ERROR_MAIN_TEXT": "Oops",
+                "TIMINGS_COLLECTOR": _defaults.TIMINGS_COLLECTOR,
+            },
+        )
+        self.assertIs(_defaults.USE_FILL_PLANS, True)
+        self.assertEqual(_defaults.FILL_PLAN_CACHE_SIZE, 12)
+        self.assertEqual(_defaults.DEFAULT_ERROR_MAIN_TEXT, "Oops")
+        # the factory was invoked, and its collector works
+        collector = _defaults.TIMINGS_COLLECTOR
+        assert isinstance(collector, StatsdCollector)
+        collector(None, "validate", {"total": 1000000})
+        self.assertEqual(collector.client.sent, ["forms._unknown.validate.total"])
+
+    def test_timings_collector(self):
+        # a collector is used as-is
+        applied = pfc_config.apply_settings(
+            {"pyramid_formencode_classic.timings_collector": statsd_collector()}
+        )
+        self.assertIsInstance(applied["TIMINGS_COLLECTOR"], StatsdCollector)
+        # a class which needs arguments is neither a collector nor a factory
+        with self.assertRaises(ConfigurationError):
+            pfc_config.apply_settings(
+                {
+                    "pyramid_formencode_classic.timings_collector": (
+                        "pyramid_formencode_classic.instrumentation.StatsdCollector"
+                    )
+                }
+            )
+        with self.assertRaises(ConfigurationError):
+            pfc_config.apply_settings(
+                {"pyramid_formencode_classic.timings_collector": "tests.test_core"}
+            )
+
+    def test_invalid(self):
+        with self.assertRaises(ConfigurationError):
+            pfc_config.apply_settings({"pyramid_formencode_classic.nope": "1"})
+        with self.assertRaises(ConfigurationError):
+            pfc_config.apply_settings(
+                {"pyramid_formencode_classic.bulk_chunk_size": "many"}
+            )
+
+
+class TestIncludeme(_DefaultsHarness, unittest.TestCase):
+    def test_settings(self):
+        config = testing.setUp(
+            settings={
+                "pyramid_formencode_classic.use_lazy_formstash": "1",
+                "pyramid_formencode_classic.automatic_cleanup": "false",
+            }
+        )
+        config.include("pyramid_formencode_classic")
+        self.assertIs(_defaults.USE_LAZY_FORMSTASH, True)
+        self.assertIs(pyramid_formencode_classic.AUTOMATIC_CLEANUP, False)
+
+    def test_warmup(self):
+        compiled.invalidate_compiled_schema(Form_EmailUsername)
+        config = testing.setUp(
+            settings={
+                "pyramid_formencode_classic.warmup.schemas": (
+                    "tests.test_core.Form_EmailUsername"
+                ),
+            },
+            autocommit=False,
+        )
+        config.include("pyramid_formencode_classic")
+        config.include("pyramid_mako")
+        config.add_form_warmup(
+            templates=(
+                "fixtures/form_a-html_error_placeholder-default.mako",
+                "fixtures/missing.mako",  # logged, not raised
+            )
+        )
+        self.assertNotIn(Form_EmailUsername, compiled._compiled_schemas)
+        config.commit()
+        self.assertIn(Form_EmailUsername, compiled._compiled_schemas)
+        lookup = config.registry.queryUtility(IRendererFactory, name=".mako").lookup
+        self.assertTrue(
+            [i for i in lookup._collection if "form_a-html_error_placeholder" in i]
+        )
+
+    def test_warmup_disabled(self):
+        compiled.invalidate_compiled_schema(Form_EmailUsername)
+        config = testing.setUp(
+            settings={
+                "pyramid_formencode_classic.warmup": "false",
+                "pyramid_formencode_classic.warmup.schemas": (
+                    "tests.test_core.Form_EmailUsername"
+                ),
+            },
+            autocommit=False,
+        )
+        config.include("pyramid_formencode_classic")
+        config.commit()
+        self.assertNotIn(Form_EmailUsername, compiled._compiled_schemas)
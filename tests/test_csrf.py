@@ -0,0 +1,116 @@
+# stdlib
+import unittest
+
+# local
+import pyramid_formencode_classic
+from pyramid_formencode_classic import _defaults
+from pyramid_formencode_classic.utils import csrf_token_matches
+from .test_core import _TestHarness
+from .test_core import Form_EmailUsername
+
+# ==============================================================================
+
+
+class _Form_Counting(Form_EmailUsername):
+    allow_extra_fields = True
+    filter_extra_fields = True
+    runs = 0
+
+    def _convert_to_python(self, value_dict, state):
+        _Form_Counting.runs += 1
+        return Form_EmailUsername._convert_to_python(self, value_dict, state)
+
+
+class TestCsrfTokenMatches(unittest.TestCase):
+    def test_matches(self):
+        self.assertTrue(csrf_token_matches("abc", "abc"))
+        self.assertTrue(csrf_token_matches("\u00e9t\u00e9", "\u00e9t\u00e9"))
+        self.assertFalse(csrf_token_matches("abd", "abc"))
+        self.assertFalse(csrf_token_matches("", "abc"))
+        self.assertFalse(csrf_token_matches(None, "abc"))
+        self.assertFalse(csrf_token_matches(["abc"], "abc"))
+
+
+class TestCsrfEarly(_TestHarness, unittest.TestCase):
+    def setUp(self):
+        _TestHarness.setUp(self)
+        _Form_Counting.runs = 0
+        self.request.POST["email"] = "a@example.com"
+        self.request.POST["username"] = "a"
+
+    def test_forged(self):
+        self.request.POST["csrf_"] = "forged"
+        (result, formStash) = pyramid_formencode_classic.form_validate(
+            self.request,
+            schema=_Form_Counting,
+            csrf_token="token",
+            csrf_early=True,
+            use_compiled_schema=False,
+        )
+        self.assertFalse(result)
+        self.assertTrue(formStash.is_error_csrf)
+        self.assertFalse(formStash.is_parsed)
+        self.assertEqual(_Form_Counting.runs, 0)
+        self.assertEqual(list(formStash.errors.keys()), [formStash.csrf_error_field])
+        self.assertIn(
+            formStash.csrf_error_string, formStash.errors[formStash.csrf_error_field]
+        )
+        # the submission is kept for the reprint
+        self.assertEqual(formStash.defaults["email"], "a@example.com")
+
+    def test_valid(self):
+        self.request.POST["csrf_"] = "token"
+        (result, formStash) = pyramid_formencode_classic.form_validate(
+            self.request,
+            schema=_Form_Counting,
+            csrf_token="token",
+            csrf_early=True,
+            use_compiled_schema=False,
+        )
+        self.assertTrue(result)
+        self.assertFalse(formStash.is_error_csrf)
+        self.assertEqual(_Form_Counting.runs, 1)
+
+    def test_selected_source(self):
+        # the early gate only reads the validated params, not `request.GET`
+        self.request.GET["csrf_"] = "token"
+        _og = _defaults.CSRF_EARLY
+        try:
+            _defaults.CSRF_EARLY = True
+            (result, formStash) = pyramid_formencode_classic.form_validate(
+                self.request,
+                schema=Form_EmailUsername,
+                csrf_token="token",
+            )
+        finally:
+            _defaults.CSRF_EARLY = _og
+        self.assertFalse(result)
+        self.assertTrue(formStash.is_error_csrf)
+
+    def test_late(self):
+        self.request.POST["csrf_"] = "forged"
+        (result, formStash) = pyramid_formencode_classic.form_validate(
+            self.request,
+            schema=_Form_Counting,
+            csrf_token="token",
+            use_compiled_schema=False,
+        )
+        self.assertFalse(result)
+        self.assertTrue(formStash.is_error_csrf)
+        self.assertTrue(formStash.is_parsed)
+        self.assertEqual(_Form_Counting.runs, 1)
+
+    def test_early_invalid(self):
+        self.request.POST["csrf_"] = "token"
+        self.request.POST["email"] = "not-an-email"
+        with self.assertRaises(pyramid_formencode_classic.FormInvalid):
+            pyramid_formencode_classic.form_validate(
+                self.request,
+                schema=Form_EmailUsername,
+                csrf_token="token",
+                csrf_early=True,
+                raise_FormInvalid=True,
+            )
+        formStash = self.request.pyramid_formencode_classic.get_form()
+        self.assertFalse(formStash.is_error_csrf)
+        self.assertIn("email", formStash.errors)
@@ -0,0 +1,82 @@
+# stdlib
+import os
+import tracemalloc
+import unittest
+
+# pypi
+from mako.template import Template
+from pyramid.renderers import render_to_response
+from pyramid.response import Response
+
+# local
+import pyramid_formencode_classic
+from pyramid_formencode_classic.debugtoolbar.panels import formencode_classic
+from .test_core import _TestHarness
+from .test_core import Form_EmailUsername
+
+# ==============================================================================
+
+
+class TestDebugPanel(_TestHarness, unittest.TestCase):
+    template = "fixtures/form_a-html_error_placeholder-default.mako"
+
+    def test_panel(self):
+        panel = formencode_classic.FormencodeClassicDebugPanel(self.request)
+        self.request.POST["email"] = "a@example.com"
+
+        def _print_form():
+            return render_to_response(self.template, {"request": self.request})
+
+        tracemalloc.start()
+        try:
+            (result, formStash) = pyramid_formencode_classic.form_validate(
+                self.request, schema=Form_EmailUsername
+            )
+            response = pyramid_formencode_classic.form_reprint(
+                self.request, _print_form
+            )
+        finally:
+            tracemalloc.stop()
+        self.assertFalse(result)
+
+        panel.process_response(response)
+        self.assertTrue(panel.has_content)
+        summary = panel.data["summaries"]["_default"]
+        self.assertEqual(set(summary["timings"].keys()), {"validate", "reprint"})
+        self.assertEqual([field for (ms, field) in summary["validators"]], ["email"])
+        self.assertEqual(set(summary["allocations"].keys()), {"validate", "reprint"})
+        self.assertEqual(summary["htmlfill_passes"], 1)
+        (size_before, size_after) = summary["response_sizes"][0]
+        self.assertLess(size_before, size_after)
+
+        rendered = Template(
+            filename=os.path.join(
+                os.path.dirname(formencode_classic.__file__),
+                "templates",
+                "formencode_classic.dbtmako",
+            )
+        ).render(**panel.data)
+        self.assertIn("htmlfill passes", rendered)
+        self.assertIn("<th>email</th>", rendered)
+
+    def test_panel_skipped(self):
+        panel = formencode_classic.FormencodeClassicDebugPanel(self.request)
+        self.request.POST["email"] = "a@example.com"
+        self.request.POST["username"] = "a"
+
+        def _print_markup():
+            return Response("<html><body><p>Done.</p></body></html>")
+
+        (result, formStash) = pyramid_formencode_classic.form_validate(
+            self.request, schema=Form_EmailUsername
+        )
+        self.assertTrue(result)
+        response = pyramid_formencode_classic.form_reprint(
+            self.request, _print_markup, skip_unfillable=True
+        )
+
+        panel.process_response(response)
+        summary = panel.data["summaries"]["_default"]
+        # the reprint was recorded, but htmlfill did not run
+        self.assertEqual(len(summary["response_sizes"]), 1)
+        self.assertEqual(summary["htmlfill_passes"], 0)
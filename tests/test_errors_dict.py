@@ -0,0 +1,94 @@
+# stdlib
+import copy
+import json
+import pickle
+import unittest
+
+# local
+from pyramid_formencode_classic.objects import ErrorsDict
+from pyramid_formencode_classic.objects import FormStash
+from .test_core import Form_EmailUsername
+
+# ==============================================================================
+
+
+class TestErrorsDict(unittest.TestCase):
+    def _check(self, errors: ErrorsDict) -> None:
+        self.assertEqual(
+            errors.get_normal(), {k: v for k, v in errors.items() if k[0] != "*"}
+        )
+        self.assertEqual(
+            errors.get_special(), {k: v for k, v in errors.items() if k[0] == "*"}
+        )
+
+    def test_mutations(self):
+        errors = ErrorsDict({"email": "Invalid", "*nothing_submitted": "Nothing"})
+        self._check(errors)
+        errors["username"] = "Missing"
+        errors["*error_main"] = "Main"
+        self._check(errors)
+        del errors["email"]
+        self._check(errors)
+        errors.pop("username")
+        errors.pop("unknown", None)
+        self._check(errors)
+        errors.setdefault("age", "Invalid")
+        errors.setdefault("age", "Ignored")
+        errors.update({"*error_main": "Updated"}, id="Invalid")
+        errors |= {"foo": "bar"}
+        self._check(errors)
+        self.assertEqual(errors["age"], "Invalid")
+        errors.popitem()
+        self._check(errors)
+        for _errors in (copy.copy(errors), pickle.loads(pickle.dumps(errors))):
+            self.assertIsInstance(_errors, ErrorsDict)
+            self.assertEqual(_errors, errors)
+            self._check(_errors)
+        errors.clear()
+        self._check(errors)
+        self.assertEqual(errors.get_normal(), {})
+
+    def test_formstash(self):
+        formStash = FormStash(schema=Form_EmailUsername)
+        formStash.set_error(field="email", message="Invalid")
+        formStash.set_special_error(
+            error_name="*nothing_submitted", error_message="bar"
+        )
+
+        # the partitions are cached until the next mutation
+        errors_normal = formStash.errors_normal
+        self.assertIs(formStash.errors_normal, errors_normal)
+        # the shared partitions are read-only, but still a `dict`
+        self.assertIsInstance(errors_normal, dict)
+        with self.assertRaises(TypeError):
+            formStash.errors["email"] = "Changed"
+        with self.assertRaises(TypeError):
+            formStash.errors_special.clear()
+        _copied = formStash.errors.copy()
+        _copied["email"] = "Changed"
+        self.assertEqual(formStash.errors, {"email": "Invalid"})
+        for _errors in (
+            copy.copy(errors_normal),
+            pickle.loads(pickle.dumps(errors_normal)),
+        ):
+            self.assertEqual(_errors, errors_normal)
+        self.assertEqual(
+            json.loads(json.dumps({"errors": formStash.errors})),
+            {"errors": {"email": "Invalid"}},
+        )
+        self.assertEqual(formStash.errors, {"email": "Invalid"})
+        self.assertEqual(formStash.errors_special, {"*nothing_submitted": "bar"})
+        self.assertEqual(formStash.count_errors(), 1)
+        self.assertEqual(formStash.count_errors(include_special=True), 2)
+
+        formStash.clear_error("email")
+        self.assertEqual(formStash.errors, {})
+        self.assertEqual(formStash.errors_special, {"*nothing_submitted": "bar"})
+        formStash.clear_error()
+        self.assertEqual(formStash.errors, {})
+        self.assertIsInstance(formStash.parsed_form["errors"], ErrorsDict)
+
+        # a plain dict is still supported
+        formStash.parsed_form["errors"] = {"email": "Invalid", "*foo": "bar"}
+        self.assertEqual(formStash.errors, {"email": "Invalid"})
+        self.assertEqual(formStash.errors_special, {"*foo": "bar"})
@@ -0,0 +1,163 @@
+# stdlib
+from typing import Any
+from typing import Dict
+from typing import Tuple
+import unittest
+
+# pypi
+import formencode
+from pyramid.renderers import render_to_response
+from pyramid.response import Response
+
+# local
+import pyramid_formencode_classic
+from pyramid_formencode_classic import _defaults
+from pyramid_formencode_classic import fillplans
+from .test_core import _TestHarness
+from .test_core import Form_EmailUsername
+
+# ==============================================================================
+
+
+DOCUMENT = """\
+<html><head><script>if (a < b) {}</script></head><body>
+<form:error name="Error_Main"/>
+<form action="/" method="POST">
+    <form:iferror name="email"><div class="has-error"></form:iferror>
+    <input type="text" name="email" value="old" />
+    <input type="checkbox" name="agree" checked="checked" />
+    <input type="radio" name="choice" value="a"/><input type="radio" name="choice" value="b">
+    <input type="password" name="password" value="secret" />
+    <input type="hidden" name="csrf_" value="token" data-formencode-ignore='1' />
+    <select name="color"><option value="red">red</option><option value="blue" selected>blue</option></select>
+    <select name="sizes" multiple><option value="s">s</option><option value="m">m</option></select>
+    <textarea name="bio">a &amp; b &#169; &copy;</textarea>
+    <!-- a comment -->
+    <?pi?>
+</form>
+&nbsp; trailing text"""
+
+
+class TestFillPlans(unittest.TestCase):
+    def setUp(self):
+        fillplans.invalidate_fill_plans()
+
+    def tearDown(self):
+        fillplans.invalidate_fill_plans()
+
+    def test_equivalence(self):
+        tests: Tuple[Tuple[Dict, Dict, Dict[str, Any]], ...] = (
+            ({}, {}, {}),
+            (
+                {
+                    "email": "a@example.com",
+                    "agree": "1",
+                    "choice": "b",
+                    "color": "red",
+                    "sizes": ["s", "m"],
+                    "bio": "<b>",
+                },
+                {"email": "Invalid", "Error_Main": "Error", "unused": "Unused"},
+                {},
+            ),
+            (
+                {"email": "a@example.com"},
+                {"email": "Invalid"},
+                {
+                    "force_defaults": False,
+                    "skip_passwords": True,
+                    "prefix_error": False,
+                    "data_formencode_ignore": True,
+                    "auto_error_formatter": pyramid_formencode_classic.formatters.formatter_nobr,
+                },
+            ),
+        )
+        for defaults, errors, kwargs in tests:
+            expected = formencode.htmlfill.render(
+                DOCUMENT, defaults=defaults, errors=errors, **kwargs
+            )
+            # run twice to cover a plan being reused
+            for _ in range(2):
+                self.assertEqual(
+                    fillplans.render(
+                        DOCUMENT, defaults=defaults, errors=errors, **kwargs
+                    ),
+                    expected,
+                )
+        self.assertEqual(len(fillplans._fill_plans), 1)
+
+    def test_is_fillable(self):
+        self.assertTrue(fillplans.is_fillable(DOCUMENT))
+        self.assertTrue(fillplans.is_fillable("<INPUT name='a'>"))
+        self.assertTrue(fillplans.is_fillable("<form:error name='a'/>"))
+        self.assertFalse(fillplans.is_fillable("<p>Thanks &amp; goodbye</p>"))
+        self.assertFalse(fillplans.is_fillable("<form action='/'></form>"))
+
+    def test_cache_size(self):
+        _og_size = _defaults.FILL_PLAN_CACHE_SIZE
+        try:
+            _defaults.FILL_PLAN_CACHE_SIZE = 2
+            _first = fillplans.get_fill_plan("<input name='a'/>")
+            self.assertIs(_first, fillplans.get_fill_plan("<input name='a'/>"))
+            fillplans.get_fill_plan("<input name='b'/>")
+            fillplans.get_fill_plan("<input name='c'/>")
+            self.assertEqual(len(fillplans._fill_plans), 2)
+            self.assertIsNot(_first, fillplans.get_fill_plan("<input name='a'/>"))
+        finally:
+            _defaults.FILL_PLAN_CACHE_SIZE = _og_size
+
+
+class TestFillPlansReprint(_TestHarness, unittest.TestCase):
+    template = "fixtures/form_a-html_error_placeholder-default.mako"
+
+    def test_reprint(self):
+        self.request.POST["email"] = "a@example.com"
+
+        def _print_form():
+            return render_to_response(self.template, {"request": self.request})
+
+        (result, formStash) = pyramid_formencode_classic.form_validate(
+            self.request,
+            schema=Form_EmailUsername,
+        )
+        self.assertFalse(result)
+        rendered = pyramid_formencode_classic.form_reprint(
+            self.request, _print_form, use_fill_plans=False
+        )
+        rendered_planned = pyramid_formencode_classic.form_reprint(
+            self.request, _print_form, use_fill_plans=True
+        )
+        self.assertEqual(rendered.text, rendered_planned.text)
+        self.assertIn('value="a@example.com"', rendered_planned.text)
+
+    def test_reprint_skip_unfillable(self):
+        self.request.POST["email"] = "a@example.com"
+        self.request.POST["username"] = "a"
+        markup = "<html><body><p>Sorry, that&#39;s gone.</p></body></html>"
+
+        def _print_markup():
+            return Response(markup)
+
+        (result, formStash) = pyramid_formencode_classic.form_validate(
+            self.request,
+            schema=Form_EmailUsername,
+        )
+        self.assertTrue(result)
+
+        rendered = pyramid_formencode_classic.form_reprint(self.request, _print_markup)
+        self.assertEqual(rendered.text, markup)
+        self.assertIsNone(list(formStash._reprints)[-1]["htmlfill"])
+
+        # errors are inserted at the top of the document
+        formStash.set_error(field="email", message="Invalid")
+        rendered = pyramid_formencode_classic.form_reprint(self.request, _print_markup)
+        self.assertIn("Invalid", rendered.text)
+        self.assertIsNotNone(list(formStash._reprints)[-1]["htmlfill"])
+
+        # the fast path can be disabled
+        formStash.clear_error("email")
+        rendered = pyramid_formencode_classic.form_reprint(
+            self.request, _print_markup, skip_unfillable=False
+        )
+        self.assertEqual(rendered.text, markup)
+        self.assertIsNotNone(list(formStash._reprints)[-1]["htmlfill"])
@@ -0,0 +1,80 @@
+# stdlib
+import unittest
+
+# pypi
+from formencode.htmlfill import htmlliteral
+from pyramid.renderers import render_to_response
+
+# local
+import pyramid_formencode_classic
+from pyramid_formencode_classic import _defaults
+from pyramid_formencode_classic import formatters
+from .test_core import _TestHarness
+from .test_core import Form_EmailUsername
+
+# ==============================================================================
+
+
+def _cache_info(memoized):
+    return getattr(memoized, "cache_info")()
+
+
+class TestMemoizeFormatter(unittest.TestCase):
+    def test_memoized(self):
+        for _formatter in (
+            formatters.formatter_comment,
+            formatters.formatter_empty_string,
+            formatters.formatter_help_inline,
+            formatters.formatter_hidden,
+            formatters.formatter_nobr,
+        ):
+            memoized = formatters.memoize_formatter(_formatter)
+            self.assertEqual(memoized.__name__, _formatter.__name__)
+            for error in ("Missing value", "<b>&</b>", "Missing value"):
+                self.assertEqual(memoized(error), _formatter(error))
+            info = _cache_info(memoized)
+            self.assertEqual(info.hits, 1)
+            self.assertEqual(info.misses, 2)
+            self.assertEqual(info.maxsize, _defaults.FORMATTER_CACHE_SIZE)
+            getattr(memoized, "cache_clear")()
+            self.assertEqual(_cache_info(memoized).currsize, 0)
+
+    def test_maxsize(self):
+        memoized = formatters.memoize_formatter(formatters.formatter_nobr, maxsize=2)
+        for error in ("a", "b", "c", "a"):
+            memoized(error)
+        info = _cache_info(memoized)
+        self.assertEqual(info.currsize, 2)
+        self.assertEqual(info.misses, 4)
+
+    def test_passthrough(self):
+        memoized = formatters.memoize_formatter(formatters.formatter_nobr)
+        error = htmlliteral("<b>bold</b>")
+        self.assertEqual(memoized(error), formatters.formatter_nobr(error))
+        self.assertIn("<b>bold</b>", memoized(error))
+        self.assertEqual(_cache_info(memoized).misses, 0)
+
+
+class TestMemoizeFormatterReprint(_TestHarness, unittest.TestCase):
+    template = "fixtures/form_a-html_error_placeholder-none.mako"
+
+    def test_reprint(self):
+        def _print_form():
+            return render_to_response(self.template, {"request": self.request})
+
+        self.request.POST["email"] = "not-an-email"
+        (result, formStash) = pyramid_formencode_classic.form_validate(
+            self.request,
+            schema=Form_EmailUsername,
+        )
+        self.assertFalse(result)
+        memoized = formatters.memoize_formatter(formatters.formatter_nobr)
+        rendered = pyramid_formencode_classic.form_reprint(self.request, _print_form)
+        for _ in range(2):
+            rendered_memoized = pyramid_formencode_classic.form_reprint(
+                self.request,
+                _print_form,
+                auto_error_formatter=memoized,
+            )
+            self.assertEqual(rendered.text, rendered_memoized.text)
+        self.assertTrue(_cache_info(memoized).hits)
@@ -0,0 +1,114 @@
+# stdlib
+from typing import Any
+from typing import List
+import unittest
+
+# pypi
+from pyramid.renderers import render_to_response
+
+# local
+import pyramid_formencode_classic
+from pyramid_formencode_classic import _defaults
+from pyramid_formencode_classic.instrumentation import PrometheusCollector
+from pyramid_formencode_classic.instrumentation import StatsdCollector
+from .test_core import _TestHarness
+from .test_core import Form_EmailUsername
+
+# ==============================================================================
+
+
+class _StatsdClient(object):
+    def __init__(self):
+        self.sent: List[Any] = []
+
+    def timing(self, stat, delta):
+        self.sent.append((stat, delta))
+
+
+class _Histogram(object):
+    def __init__(self):
+        self.observed: List[Any] = []
+
+    def labels(self, **labels):
+        self._labels = labels
+        return self
+
+    def observe(self, value):
+        self.observed.append((self._labels, value))
+
+
+class TestTimings(_TestHarness, unittest.TestCase):
+    template = "fixtures/form_a-html_error_placeholder-default.mako"
+
+    def _print_form(self):
+        return render_to_response(self.template, {"request": self.request})
+
+    def test_default(self):
+        self.request.POST["email"] = "a@example.com"
+        (result, formStash) = pyramid_formencode_classic.form_validate(
+            self.request, schema=Form_EmailUsername
+        )
+        pyramid_formencode_classic.form_reprint(self.request, self._print_form)
+        self.assertIsNone(formStash.timings)
+
+    def test_collect(self):
+        self.request.POST["email"] = "a@example.com"
+        (result, formStash) = pyramid_formencode_classic.form_validate(
+            self.request, schema=Form_EmailUsername, collect_timings=True
+        )
+        self.assertFalse(result)
+        assert formStash.timings is not None
+        self.assertEqual(
+            list(formStash.timings["validate"].keys()),
+            [
+                "params",
+                "variable_decode",
+                "to_python",
+                "unpack_errors",
+                "foreach_defense",
+                "total",
+            ],
+        )
+        pyramid_formencode_classic.form_reprint(
+            self.request, self._print_form, collect_timings=True
+        )
+        self.assertEqual(
+            list(formStash.timings["reprint"].keys()),
+            ["print_method", "charset", "htmlfill", "total"],
+        )
+        for event in ("validate", "reprint"):
+            timings = formStash.timings[event]
+            self.assertGreaterEqual(timings["total"], sum(timings.values()) / 2)
+        self.assertEqual(set(formStash.timings["validators"].keys()), {"email"})
+
+    def test_collectors(self):
+        self.request.POST["email"] = "a@example.com"
+        self.request.POST["username"] = "ab"
+        client = _StatsdClient()
+        histogram = _Histogram()
+        statsd = StatsdCollector(client)
+        _og_collector = _defaults.TIMINGS_COLLECTOR
+        try:
+            _defaults.TIMINGS_COLLECTOR = PrometheusCollector(histogram)
+            (result, formStash) = pyramid_formencode_classic.form_validate(
+                self.request,
+                schema=Form_EmailUsername,
+                timings_collector=statsd,
+                csrf_token="token",
+                form_stash="signup",
+            )
+            pyramid_formencode_classic.form_reprint(
+                self.request, self._print_form, form_stash="signup"
+            )
+        finally:
+            _defaults.TIMINGS_COLLECTOR = _og_collector
+        self.assertFalse(result)
+        self.assertTrue(formStash.is_error_csrf)
+        self.assertIn(
+            "pyramid_formencode_classic.signup.validate.csrf",
+            [stat for (stat, delta) in client.sent],
+        )
+        self.assertIn(
+            {"form": "signup", "event": "reprint", "phase": "htmlfill"},
+            [labels for (labels, value) in histogram.observed],
+        )
@@ -0,0 +1,123 @@
+# stdlib
+import unittest
+
+# pypi
+from pyramid.renderers import render_to_response
+
+# local
+import pyramid_formencode_classic
+from pyramid_formencode_classic import _defaults
+from pyramid_formencode_classic.objects import _EmptyFormStash
+from pyramid_formencode_classic.objects import FormStash
+from pyramid_formencode_classic.objects import FormStashList
+from pyramid_formencode_classic.objects import FormStashSlotted
+from .test_core import _TestHarness
+from .test_core import Form_EmailUsername
+
+# ==============================================================================
+
+
+class TestEmptyFormStash(unittest.TestCase):
+    def test_get_form(self):
+        forms = FormStashList()
+        self.assertIs(type(forms.get_form("a")), FormStash)
+        self.assertIs(
+            type(forms.get_form("b", use_lazy_formstash=True)), _EmptyFormStash
+        )
+        # the slotted stash takes precedence
+        self.assertIs(
+            type(
+                forms.get_form("c", use_lazy_formstash=True, use_slotted_formstash=True)
+            ),
+            FormStashSlotted,
+        )
+        _og = _defaults.USE_LAZY_FORMSTASH
+        try:
+            _defaults.USE_LAZY_FORMSTASH = True
+            self.assertIs(type(forms.get_form("d")), _EmptyFormStash)
+        finally:
+            _defaults.USE_LAZY_FORMSTASH = _og
+
+    def test_reads(self):
+        formStash = FormStashList().get_form("a", use_lazy_formstash=True)
+        self.assertIsInstance(formStash, FormStash)
+        self.assertEqual(formStash.name, "a")
+        self.assertEqual(formStash.error_main_key, _defaults.DEFAULT_ERROR_MAIN_KEY)
+        self.assertFalse(formStash.is_error)
+        self.assertEqual(formStash.html_error_placeholder(), "")
+        self.assertEqual(formStash.html_error("email"), "")
+        self.assertEqual(formStash.render_html_error_main(), "")
+        self.assertEqual(formStash.css_error("email"), "")
+        self.assertEqual(formStash.errors, {})
+        self.assertEqual(formStash.errors_special, {})
+        self.assertEqual(formStash.count_errors(include_special=False), 0)
+        self.assertIsNone(formStash.error_main)
+        self.assertIsNone(formStash.get_error("email"))
+        self.assertFalse(formStash.has_errors())
+        # the errors are shared and read-only
+        with self.assertRaises(TypeError):
+            formStash.errors["email"] = "Invalid"
+
+        # none of the containers were allocated
+        self.assertIs(type(formStash), _EmptyFormStash)
+        self.assertNotIn("parsed_form", vars(formStash))
+        self.assertNotIn("default_texts", vars(formStash))
+
+    def test_promote(self):
+        formStash = FormStashList().get_form(
+            "a", error_main_text="Oops", use_lazy_formstash=True
+        )
+        formStash.set_css_error("oops")
+        formStash.set_error(field="email", message="Invalid")
+        self.assertIs(type(formStash), FormStash)
+        self.assertNotIn("_lazy_init", vars(formStash))
+        self.assertTrue(formStash.is_error)
+        self.assertEqual(formStash.css_error("email"), "oops")
+        self.assertEqual(formStash.errors, {"email": "Invalid"})
+        self.assertEqual(formStash.default_texts["*error_main"], "Oops")
+
+    def test_promote_on_access(self):
+        for attr in ("parsed_form", "defaults", "errors_all", "assets", "_reprints"):
+            formStash = FormStashList().get_form("a", use_lazy_formstash=True)
+            getattr(formStash, attr)
+            self.assertIs(type(formStash), FormStash)
+
+        formStash = FormStashList().get_form("a", use_lazy_formstash=True)
+        formStash.assets = {"foo": "bar"}
+        self.assertIs(type(formStash), FormStash)
+        self.assertEqual(formStash.assets, {"foo": "bar"})
+        self.assertEqual(formStash.errors, {})
+
+        formStash = FormStashList().get_form("a", use_lazy_formstash=True)
+        with self.assertRaises(AttributeError):
+            formStash.not_an_attribute  # type: ignore[attr-defined]
+        self.assertIs(type(formStash), _EmptyFormStash)
+
+
+class TestEmptyFormStashReprint(_TestHarness, unittest.TestCase):
+    template = "fixtures/form_a-html_error_placeholder-default.mako"
+
+    def test_render(self):
+        request = self.request
+        request.pyramid_formencode_classic.get_form(use_lazy_formstash=True)
+        rendered = render_to_response(self.template, {"request": request})
+        self.assertNotIn("form:error", rendered.text)
+        formStash = request.pyramid_formencode_classic.get_form()
+        self.assertIs(type(formStash), _EmptyFormStash)
+
+    def test_validate(self):
+        self.request.pyramid_formencode_classic.get_form(use_lazy_formstash=True)
+        (result, formStash) = pyramid_formencode_classic.form_validate(
+            self.request,
+            schema=Form_EmailUsername,
+        )
+        self.assertFalse(result)
+        self.assertIs(self.request.pyramid_formencode_classic.get_form(), formStash)
+        self.assertIs(type(formStash), FormStash)
+
+    def test_cleanup(self):
+        request = self.request
+        request.pyramid_formencode_classic.get_form(use_lazy_formstash=True)
+        request._process_finished_callbacks()
+        formStash = request.pyramid_formencode_classic.get_form()
+        self.assertIs(type(formStash), _EmptyFormStash)
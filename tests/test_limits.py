@@ -0,0 +1,283 @@
+# stdlib
+from typing import Dict
+from typing import Optional
+import unittest
+from unittest import mock
+
+# pypi
+import formencode
+from pyramid.response import Response
+from webob.multidict import MultiDict
+
+# local
+import pyramid_formencode_classic
+from pyramid_formencode_classic import _defaults
+from pyramid_formencode_classic import SubmissionLimits
+from pyramid_formencode_classic.compiled import CompiledSchema
+from pyramid_formencode_classic.compiled import get_compiled_schema
+from pyramid_formencode_classic.limits import LimitExceeded
+from pyramid_formencode_classic.variabledecode import variable_decode
+from .test_core import _TestHarness
+from .test_core import Form_EmailUsername
+
+# ==============================================================================
+
+
+class _Form_Recording(Form_EmailUsername):
+    submitted: Optional[Dict] = None
+
+    def _convert_to_python(self, value_dict, state):
+        _Form_Recording.submitted = dict(value_dict)
+        return Form_EmailUsername._convert_to_python(self, value_dict, state)
+
+
+class _Form_Pre(Form_EmailUsername):
+    pre_validators = [formencode.validators.FieldsMatch("email", "email_confirm")]
+
+
+class _Form_Row(formencode.Schema):
+    qty = formencode.validators.Int()
+
+
+class _Form_Rows(formencode.Schema):
+    allow_extra_fields = True
+    filter_extra_fields = True
+    rows = formencode.ForEach(_Form_Row())
+
+
+class TestSubmissionLimits(unittest.TestCase):
+    def _check(self, limits, items, check_bytes=True):
+        limits.check_params(MultiDict(items), check_bytes)
+
+    def test_unlimited(self):
+        self._check(SubmissionLimits(), [("a", "x" * 1000)] * 100)
+
+    def test_max_fields(self):
+        limits = SubmissionLimits(max_fields=2)
+        self._check(limits, [("a", "1"), ("a", "2")])
+        with self.assertRaises(LimitExceeded) as cm:
+            self._check(limits, [("a", "1"), ("b", "2"), ("c", "3")])
+        self.assertEqual(cm.exception.limit, "max_fields")
+
+    def test_max_value_length(self):
+        limits = SubmissionLimits(max_value_length=3)
+        self._check(limits, [("a", "abc"), ("b", object())])
+        with self.assertRaises(LimitExceeded) as cm:
+            self._check(limits, [("a", "abcd")])
+        self.assertEqual(cm.exception.limit, "max_value_length")
+
+    def test_max_total_bytes(self):
+        limits = SubmissionLimits(max_total_bytes=4)
+        self._check(limits, [("a", "é")])  # 1 + 2 bytes
+        with self.assertRaises(LimitExceeded) as cm:
+            self._check(limits, [("a", "éé")])
+        self.assertEqual(cm.exception.limit, "max_total_bytes")
+        self._check(limits, [("a", "éé")], check_bytes=False)
+        with self.assertRaises(LimitExceeded):
+            limits.check_content_length(5)
+        limits.check_content_length(None)
+
+    def test_max_list_length(self):
+        limits = SubmissionLimits(max_list_length=2)
+        self._check(limits, [("a", "1"), ("a", "2"), ("b", "1")])
+        with self.assertRaises(LimitExceeded) as cm:
+            self._check(limits, [("a", "1"), ("a", "2"), ("a", "3")])
+        self.assertEqual(cm.exception.limit, "max_list_length")
+
+
+class TestVariableDecodeLimits(unittest.TestCase):
+    def test_members(self):
+        d = {"a-0.b": "1", "a-0.c": "2", "a-1.b": "3"}
+        self.assertEqual(variable_decode(d, max_list_length=2), variable_decode(d))
+        d["a-2.b"] = "4"
+        with self.assertRaises(LimitExceeded):
+            variable_decode(d, max_list_length=2)
+
+    def test_repetitions(self):
+        with self.assertRaises(LimitExceeded):
+            variable_decode({"a--repetitions": "1000000"}, max_list_length=10)
+
+
+class TestFormValidateLimits(_TestHarness, unittest.TestCase):
+    def setUp(self):
+        _TestHarness.setUp(self)
+        _Form_Recording.submitted = None
+        self.request.POST["email"] = "a@example.com"
+        self.request.POST["username"] = "a"
+
+    def test_rejected(self):
+        self.request.POST["junk"] = "x" * 100
+        (result, formStash) = pyramid_formencode_classic.form_validate(
+            self.request,
+            schema=_Form_Recording,
+            limits=SubmissionLimits(max_value_length=50),
+            use_compiled_schema=False,
+        )
+        self.assertFalse(result)
+        self.assertFalse(formStash.is_parsed)
+        self.assertIsNone(_Form_Recording.submitted)
+        self.assertIn(
+            _defaults.DEFAULT_ERROR_LIMITS_TEXT,
+            formStash.errors[formStash.error_main_key],
+        )
+        # the submission is not reprinted
+        self.assertEqual(formStash.defaults, {})
+
+    def test_content_length(self):
+        self.request.content_length = 1000
+        (result, formStash) = pyramid_formencode_classic.form_validate(
+            self.request,
+            schema=Form_EmailUsername,
+            limits=SubmissionLimits(max_total_bytes=500),
+        )
+        self.assertFalse(result)
+        self.assertIn(formStash.error_main_key, formStash.errors)
+
+    def test_variable_decode(self):
+        for i in range(5):
+            self.request.POST["list-%s" % i] = str(i)
+        (result, formStash) = pyramid_formencode_classic.form_validate(
+            self.request,
+            schema=Form_EmailUsername,
+            variable_decode=True,
+            limits=SubmissionLimits(max_list_length=4),
+        )
+        self.assertFalse(result)
+        self.assertIn(formStash.error_main_key, formStash.errors)
+
+    def test_default(self):
+        _og = _defaults.SUBMISSION_LIMITS
+        try:
+            _defaults.SUBMISSION_LIMITS = SubmissionLimits(max_fields=1)
+            (result, formStash) = pyramid_formencode_classic.form_validate(
+                self.request, schema=Form_EmailUsername
+            )
+            self.assertFalse(result)
+        finally:
+            _defaults.SUBMISSION_LIMITS = _og
+
+    def test_registered(self):
+        self.config.add_form_schema(
+            "limited", Form_EmailUsername, limits=SubmissionLimits(max_fields=1)
+        )
+        self.config.commit()
+        (result, formStash) = pyramid_formencode_classic.form_validate(
+            self.request, schema="limited"
+        )
+        self.assertFalse(result)
+        (result, formStash) = pyramid_formencode_classic.form_validate(
+            self.request, schema="limited", limits=SubmissionLimits()
+        )
+        self.assertTrue(result)
+
+
+class TestPrefilterFields(_TestHarness, unittest.TestCase):
+    def setUp(self):
+        _TestHarness.setUp(self)
+        _Form_Recording.submitted = None
+        self.request.POST["email"] = "a@example.com"
+        self.request.POST["username"] = "a"
+        self.request.POST["csrf_"] = "token"
+        self.request.POST["utm_source"] = "widget"
+
+    def test_prefiltered(self):
+        _to_python = CompiledSchema.to_python
+        with mock.patch.object(
+            CompiledSchema, "to_python", autospec=True, side_effect=_to_python
+        ) as patched:
+            (result, formStash) = pyramid_formencode_classic.form_validate(
+                self.request, schema=Form_EmailUsername, prefilter_fields=True
+            )
+            self.assertTrue(result)
+            self.assertEqual(
+                patched.call_args[0][1], {"email": "a@example.com", "username": "a"}
+            )
+            # the prefilter is opt-in
+            (result, formStash) = pyramid_formencode_classic.form_validate(
+                self.request, schema=Form_EmailUsername
+            )
+            self.assertTrue(result)
+            self.assertIn("utm_source", patched.call_args[0][1])
+
+    def test_not_compilable(self):
+        (result, formStash) = pyramid_formencode_classic.form_validate(
+            self.request, schema=_Form_Recording, prefilter_fields=True
+        )
+        self.assertTrue(result)
+        # `_Form_Recording` customizes the schema, so nothing is prefiltered
+        assert _Form_Recording.submitted is not None
+        self.assertIn("utm_source", _Form_Recording.submitted)
+
+    def test_compiled(self):
+        (result, formStash) = pyramid_formencode_classic.form_validate(
+            self.request, schema=Form_EmailUsername, prefilter_fields=True
+        )
+        self.assertTrue(result)
+        self.assertEqual(formStash.results, {"email": "a@example.com", "username": "a"})
+        # the defaults are the entire submission, even if it is valid
+        self.assertEqual(formStash.defaults, self.request.POST.mixed())
+
+        # e.g. the view rejects a valid submission, and reprints it
+        with self.assertRaises(pyramid_formencode_classic.FormInvalid):
+            formStash.fatal_field(field="email", error_field="Taken")
+
+        def _print_markup():
+            return Response('<form><input type="hidden" name="csrf_"/></form>')
+
+        rendered = pyramid_formencode_classic.form_reprint(self.request, _print_markup)
+        self.assertIn('value="token"', rendered.text)
+
+    def test_reprint_defaults(self):
+        self.request.POST["email"] = "not-an-email"
+        (result, formStash) = pyramid_formencode_classic.form_validate(
+            self.request, schema=Form_EmailUsername, prefilter_fields=True
+        )
+        self.assertFalse(result)
+        # the full submission is kept for the reprint
+        self.assertEqual(formStash.defaults["csrf_"], "token")
+        self.assertEqual(formStash.defaults["utm_source"], "widget")
+
+    def test_only_extra_fields(self):
+        self.request.POST = MultiDict(utm_source="widget")
+        (result, formStash) = pyramid_formencode_classic.form_validate(
+            self.request, schema=Form_EmailUsername, prefilter_fields=True
+        )
+        self.assertFalse(result)
+        # the schema still reports the missing fields
+        self.assertIn("email", formStash.errors)
+
+    def test_variable_decode(self):
+        self.request.POST = MultiDict(
+            [
+                ("rows-0.qty", "1"),
+                ("rows-1.qty", "2"),
+                ("tracking-0.id", "x"),
+            ]
+        )
+        (result, formStash) = pyramid_formencode_classic.form_validate(
+            self.request,
+            schema=_Form_Rows,
+            variable_decode=True,
+            prefilter_fields=True,
+        )
+        self.assertTrue(result)
+        self.assertEqual(formStash.results, {"rows": [{"qty": 1}, {"qty": 2}]})
+        self.assertEqual(
+            formStash.defaults,
+            {"rows": [{"qty": "1"}, {"qty": "2"}], "tracking": [{"id": "x"}]},
+        )
+
+    def test_prefilter(self):
+        params = {"junk": "x", "rows": [{"qty": "1"}]}
+        compiled = get_compiled_schema(_Form_Rows)
+        self.assertEqual(compiled.prefilter(params), {"rows": [{"qty": "1"}]})
+        self.assertEqual(compiled.prefilter({"junk": "x"}), {})
+        self.assertIsNone(get_compiled_schema(_Form_Pre).prefilter(params))
+
+    def test_pre_validators(self):
+        compiled = get_compiled_schema(_Form_Pre)
+        self.assertIsNone(compiled.prefilter_field_names)
+        compiled = get_compiled_schema(Form_EmailUsername)
+        self.assertEqual(
+            compiled.prefilter_field_names, frozenset(("email", "username"))
+        )
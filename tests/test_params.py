@@ -0,0 +1,126 @@
+# stdlib
+import unittest
+from unittest import mock
+
+# pypi
+import formencode
+from pyramid.response import Response
+from webob.multidict import MultiDict
+
+# local
+import pyramid_formencode_classic
+from pyramid_formencode_classic import _defaults
+from pyramid_formencode_classic.compiled import get_compiled_schema
+from pyramid_formencode_classic.params import MixedParamsView
+from .test_core import _TestHarness
+from .test_core import Form_EmailUsername
+
+# ==============================================================================
+
+
+ITEMS = [("a", "1"), ("b", "2"), ("a", "3"), ("c", "")]
+
+
+class _Form_Strict(formencode.Schema):
+    email = formencode.validators.Email(not_empty=True)
+
+
+class TestMixedParamsView(unittest.TestCase):
+    def test_mixed(self):
+        multidict = MultiDict(ITEMS)
+        view = MixedParamsView(multidict)
+        self.assertEqual(dict(view), multidict.mixed())
+        self.assertEqual(list(view), ["a", "b", "c"])
+        self.assertEqual(len(view), 3)
+        self.assertEqual(view["a"], ["1", "3"])
+        self.assertEqual(view.get("c"), "")
+        self.assertIsNone(view.get("d"))
+        self.assertIn("b", view)
+        self.assertNotIn("d", view)
+        with self.assertRaises(KeyError):
+            view["d"]
+        self.assertTrue(view)
+        self.assertFalse(MixedParamsView(MultiDict()))
+
+    def test_lazy(self):
+        multidict = MultiDict(ITEMS)
+        view = MixedParamsView(multidict)
+        with mock.patch.object(multidict, "mixed", wraps=multidict.mixed) as mixed:
+            # a batch of keys is resolved in one pass, without a copy
+            self.assertEqual(view.resolve({"a", "b", "d"}), {"a": ["1", "3"], "b": "2"})
+            self.assertEqual(view["b"], "2")
+            self.assertEqual(mixed.call_count, 0)
+            # any other read materializes the submission once
+            self.assertEqual(view["c"], "")
+            self.assertNotIn("d", view)
+            self.assertEqual(view["a"], ["1", "3"])
+            self.assertEqual(mixed.call_count, 1)
+        self.assertEqual(view.resolve({"c"}), {"c": ""})
+
+    def test_materialize(self):
+        multidict = MultiDict(ITEMS)
+        view = MixedParamsView(multidict)
+        self.assertEqual(dict(view.items()), multidict.mixed())
+        self.assertIs(view.materialize(), view.materialize())
+        copied = view.copy()
+        copied["d"] = "4"
+        self.assertNotIn("d", view)
+
+
+class TestFormValidateParamsView(_TestHarness, unittest.TestCase):
+    def setUp(self):
+        _TestHarness.setUp(self)
+        self.request.POST = MultiDict(
+            [
+                ("email", "a@example.com"),
+                ("username", "a"),
+                ("csrf_", "token"),
+                ("utm_source", "widget"),
+            ]
+        )
+
+    def test_prefiltered(self):
+        (result, formStash) = pyramid_formencode_classic.form_validate(
+            self.request, schema=Form_EmailUsername, use_params_view=True
+        )
+        self.assertTrue(result)
+        self.assertEqual(formStash.results, {"email": "a@example.com", "username": "a"})
+        # the defaults are the entire submission, without a copy
+        self.assertIsInstance(formStash.defaults, MixedParamsView)
+        self.assertEqual(formStash.defaults["utm_source"], "widget")
+
+    def test_compiled(self):
+        # the compiled plan only resolves the schema's fields
+        compiled = get_compiled_schema(Form_EmailUsername)
+        view = MixedParamsView(self.request.POST)
+        with mock.patch.object(MixedParamsView, "materialize") as materialize:
+            results = compiled.to_python(view)
+            self.assertEqual(materialize.call_count, 0)
+        self.assertEqual(results, {"email": "a@example.com", "username": "a"})
+
+    def test_not_filtered(self):
+        # a schema which rejects extra fields reads every key
+        self.request.POST = MultiDict([("email", "a@example.com"), ("extra", "1")])
+        (result, formStash) = pyramid_formencode_classic.form_validate(
+            self.request, schema=_Form_Strict, use_params_view=True
+        )
+        self.assertFalse(result)
+        self.assertIn("extra", formStash.errors["Error_String"])
+
+    def test_reprint(self):
+        self.request.POST["email"] = "not-an-email"
+        _og = _defaults.USE_PARAMS_VIEW
+        try:
+            _defaults.USE_PARAMS_VIEW = True
+            (result, formStash) = pyramid_formencode_classic.form_validate(
+                self.request, schema=Form_EmailUsername
+            )
+        finally:
+            _defaults.USE_PARAMS_VIEW = _og
+        self.assertFalse(result)
+
+        def _print_markup():
+            return Response('<form><input type="hidden" name="csrf_"/></form>')
+
+        rendered = pyramid_formencode_classic.form_reprint(self.request, _print_markup)
+        self.assertIn('value="token"', rendered.text)
@@ -0,0 +1,72 @@
+# stdlib
+import unittest
+
+# pypi
+import formencode
+from pyramid.exceptions import ConfigurationConflictError
+
+# local
+import pyramid_formencode_classic
+from pyramid_formencode_classic import compiled
+from pyramid_formencode_classic.registry import get_form_schema
+from .test_core import _TestHarness
+from .test_core import Form_EmailUsername
+
+# ==============================================================================
+
+
+class TestSchemaRegistry(_TestHarness, unittest.TestCase):
+    def test_register(self):
+        self.config.add_form_schema(
+            "email_username", "tests.test_core.Form_EmailUsername"
+        )
+        registered = get_form_schema(self.config.registry, "email_username")
+        self.assertIs(registered.schema, Form_EmailUsername)
+        self.assertIs(
+            registered.compiled, compiled.get_compiled_schema(Form_EmailUsername)
+        )
+
+        with self.assertRaises(ValueError):
+            get_form_schema(self.config.registry, "missing")
+
+    def test_form_validate(self):
+        self.config.add_form_schema("email_username", Form_EmailUsername)
+        self.request.POST["email"] = "a@example.com"
+        self.request.POST["username"] = "a"
+        (result, formStash) = pyramid_formencode_classic.form_validate(
+            self.request,
+            schema="email_username",
+        )
+        self.assertTrue(result)
+        self.assertIs(formStash.schema, Form_EmailUsername)
+        self.assertEqual(formStash.results["username"], "a")
+
+        with self.assertRaises(ValueError):
+            pyramid_formencode_classic.form_validate(
+                self.request, schema="missing", form_stash="other"
+            )
+
+    def test_altered(self):
+        schema = formencode.Schema()
+        schema.add_field("a", formencode.validators.Int(not_empty=True))
+        self.config.add_form_schema("altered", schema)
+        self.request.POST["a"] = "1"
+        (result, formStash) = pyramid_formencode_classic.form_validate(
+            self.request, schema="altered"
+        )
+        self.assertTrue(result)
+
+        # the registered plan is compiled again
+        schema.add_field("b", formencode.validators.Int(not_empty=True))
+        (result, formStash) = pyramid_formencode_classic.form_validate(
+            self.request, schema="altered", form_stash="altered"
+        )
+        self.assertFalse(result)
+        self.assertIn("b", formStash.errors)
+
+    def test_conflict(self):
+        self.config.autocommit = False
+        self.config.add_form_schema("a", Form_EmailUsername)
+        self.config.add_form_schema("a", Form_EmailUsername)
+        with self.assertRaises(ConfigurationConflictError):
+            self.config.commit()
@@ -0,0 +1,99 @@
+# stdlib
+import unittest
+
+# pypi
+from pyramid.renderers import render_to_response
+
+# local
+import pyramid_formencode_classic
+from pyramid_formencode_classic import formatters
+from pyramid_formencode_classic import ReprintProfile
+from .test_core import _TestHarness
+from .test_core import Form_EmailUsername
+
+# ==============================================================================
+
+
+class TestReprintProfile(_TestHarness, unittest.TestCase):
+    template = "fixtures/form_a-html_error_placeholder-none.mako"
+
+    def _print_form(self):
+        return render_to_response(self.template, {"request": self.request})
+
+    def test_profile(self):
+        profile = ReprintProfile(
+            auto_error_formatter=formatters.formatter_comment,
+            error_formatters={"default": formatters.formatter_comment},
+        )
+        self.assertIsNotNone(profile.error_formatters)
+        self.assertIs(
+            profile.htmlfill_kwargs["error_formatters"]["default"],
+            formatters.formatter_comment,
+        )
+        # the htmlfill defaults are merged in
+        self.assertIn("escape", profile.htmlfill_kwargs["error_formatters"])
+        with self.assertRaises(TypeError):
+            profile.htmlfill_kwargs["use_all_keys"] = True  # type: ignore[index]
+
+        self.request.POST["email"] = "not-an-email"
+        (result, formStash) = pyramid_formencode_classic.form_validate(
+            self.request,
+            schema=Form_EmailUsername,
+        )
+        self.assertFalse(result)
+        rendered = pyramid_formencode_classic.form_reprint(
+            self.request,
+            self._print_form,
+            auto_error_formatter=formatters.formatter_comment,
+            error_formatters={"default": formatters.formatter_comment},
+        )
+        rendered_profile = pyramid_formencode_classic.form_reprint(
+            self.request,
+            self._print_form,
+            reprint_profile=profile,
+        )
+        self.assertEqual(rendered.text, rendered_profile.text)
+        self.assertIn("<!-- formatter_comment (Missing value)-->", rendered.text)
+        self.assertIn('value="not-an-email"', rendered.text)
+
+    def test_profile_defaults(self):
+        profile = ReprintProfile()
+        self.assertIsNone(profile.error_formatters)
+        self.assertIsNone(profile.encoding)
+        self.assertEqual(
+            dict(profile.htmlfill_kwargs),
+            {"auto_error_formatter": formatters.formatter_nobr},
+        )
+
+        (result, formStash) = pyramid_formencode_classic.form_validate(
+            self.request,
+            schema=Form_EmailUsername,
+        )
+        rendered = pyramid_formencode_classic.form_reprint(
+            self.request, self._print_form
+        )
+        rendered_profile = pyramid_formencode_classic.form_reprint(
+            self.request, self._print_form, reprint_profile=profile
+        )
+        self.assertEqual(rendered.text, rendered_profile.text)
+
+    def test_profile_exclusive(self):
+        profile = ReprintProfile()
+        pyramid_formencode_classic.form_validate(
+            self.request,
+            schema=Form_EmailUsername,
+        )
+        with self.assertRaises(ValueError):
+            pyramid_formencode_classic.form_reprint(
+                self.request,
+                self._print_form,
+                reprint_profile=profile,
+                error_formatters={"default": formatters.formatter_comment},
+            )
+        with self.assertRaises(ValueError):
+            pyramid_formencode_classic.form_reprint(
+                self.request,
+                self._print_form,
+                reprint_profile=profile,
+                force_defaults=False,
+            )
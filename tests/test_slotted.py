@@ -0,0 +1,89 @@
+# stdlib
+import gc
+import tracemalloc
+import unittest
+
+# pypi
+from pyramid.renderers import render_to_response
+
+# local
+import pyramid_formencode_classic
+from pyramid_formencode_classic import _defaults
+from pyramid_formencode_classic.objects import FormStash
+from pyramid_formencode_classic.objects import FormStashList
+from pyramid_formencode_classic.objects import FormStashSlotted
+from .test_core import _TestHarness
+from .test_core import Form_EmailUsername
+
+# ==============================================================================
+
+
+class TestFormStashSlotted(unittest.TestCase):
+    def test_compact(self):
+        formStash = FormStashSlotted(schema=Form_EmailUsername, name="a")
+        self.assertIsInstance(formStash, FormStash)
+        self.assertFalse(formStash.is_error)
+        self.assertIsNone(formStash.is_submitted_vars)
+        self.assertEqual(formStash.error_main_key, _defaults.DEFAULT_ERROR_MAIN_KEY)
+
+        # the per-form state is stored in slots
+        for attr in ("schema", "name", "parsed_form", "is_error"):
+            self.assertIn(attr, FormStashSlotted.__slots__)
+
+        # containers are allocated when first accessed
+        self.assertIsNone(formStash._assets)
+        self.assertIsNone(formStash._reprints_)
+        formStash.assets["foo"] = "bar"
+        formStash._reprints.append({})
+        self.assertEqual(formStash.assets, {"foo": "bar"})
+        self.assertEqual(formStash._reprints, [{}])
+
+        # the api behaves identically
+        formStash.set_css_error("oops")
+        formStash.set_error(field="email", message="Invalid")
+        self.assertTrue(formStash.is_error)
+        self.assertEqual(formStash.css_error("email"), "oops")
+        self.assertEqual(formStash.errors, {"email": "Invalid"})
+
+    def test_allocations(self):
+        def _allocated(cls):
+            gc.collect()
+            tracemalloc.start()
+            try:
+                forms = [cls(schema=Form_EmailUsername, name="a") for i in range(100)]
+                (_current, _peak) = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+            self.assertEqual(len(forms), 100)
+            return _current
+
+        self.assertLess(_allocated(FormStashSlotted), _allocated(FormStash))
+
+    def test_get_form(self):
+        forms = FormStashList()
+        self.assertIs(type(forms.get_form("a")), FormStash)
+        self.assertIs(
+            type(forms.get_form("b", use_slotted_formstash=True)), FormStashSlotted
+        )
+
+
+class TestFormStashSlottedValidate(_TestHarness, unittest.TestCase):
+    template = "fixtures/form_a-html_error_placeholder-default.mako"
+
+    def test_validate(self):
+        self.request.POST["email"] = "a@example.com"
+
+        def _print_form():
+            return render_to_response(self.template, {"request": self.request})
+
+        (result, formStash) = pyramid_formencode_classic.form_validate(
+            self.request,
+            schema=Form_EmailUsername,
+            use_slotted_formstash=True,
+        )
+        self.assertFalse(result)
+        assert isinstance(formStash, FormStashSlotted)
+        self.assertIn("username", formStash.errors)
+        rendered = pyramid_formencode_classic.form_reprint(self.request, _print_form)
+        self.assertIn('value="a@example.com"', rendered.text)
+        self.assertIsNone(formStash._assets)
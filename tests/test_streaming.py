@@ -0,0 +1,201 @@
+# stdlib
+import io
+from typing import List
+from typing import Optional
+from typing import Tuple
+import unittest
+
+# pypi
+import formencode
+from pyramid import testing
+from pyramid.request import Request
+
+# local
+import pyramid_formencode_classic
+from pyramid_formencode_classic import streaming
+
+# ==============================================================================
+
+
+BOUNDARY = "----boundary1234"
+
+
+class Form_Upload(formencode.Schema):
+    allow_extra_fields = True
+    filter_extra_fields = True
+
+    email = formencode.validators.Email(not_empty=True)
+    upload = formencode.validators.FieldStorageUploadConverter(not_empty=True)
+
+
+class _State(object):
+    def __init__(self):
+        self.seen = []
+
+
+class StateEmail(formencode.validators.Email):
+    def _convert_to_python(self, value, state):
+        state.seen.append(value)
+        return formencode.validators.Email._convert_to_python(self, value, state)
+
+
+class Form_UploadState(Form_Upload):
+    email = StateEmail(not_empty=True)
+
+
+class _CountingFile(io.BytesIO):
+    bytes_read = 0
+
+    def read(self, size=-1):
+        data = io.BytesIO.read(self, size)
+        self.bytes_read += len(data)
+        return data
+
+
+def _multipart(parts: List[Tuple[str, Optional[str], bytes]]) -> bytes:
+    body = b""
+    for name, filename, value in parts:
+        body += b"--%s\r\n" % BOUNDARY.encode()
+        if filename:
+            body += (
+                b'Content-Disposition: form-data; name="%s"; filename="%s"\r\n'
+                b"Content-Type: application/octet-stream\r\n\r\n"
+                % (name.encode(), filename.encode())
+            )
+        else:
+            body += b'Content-Disposition: form-data; name="%s"\r\n\r\n' % name.encode()
+        body += value + b"\r\n"
+    body += b"--%s--\r\n" % BOUNDARY.encode()
+    return body
+
+
+def _request(body: bytes) -> Request:
+    request = Request.blank(
+        "/",
+        method="POST",
+        content_type="multipart/form-data; boundary=%s" % BOUNDARY,
+    )
+    request.body_file_raw = _CountingFile(body)
+    request.content_length = len(body)
+    request.is_body_seekable = False
+    request.pyramid_formencode_classic = (
+        pyramid_formencode_classic._new_request_FormStashList(request)
+    )
+    return request
+
+
+class TestMultipartScanner(unittest.TestCase):
+    def test_chunked(self):
+        body = _multipart(
+            [
+                ("a", None, b"1"),
+                ("upload", "a.bin", b"\r\n--" + b"x" * 100),
+                ("b", None, b""),
+            ]
+        )
+        for chunk_size in (1, 7, 64, len(body)):
+            scanner = streaming.MultipartScanner(BOUNDARY.encode())
+            parts: List[List] = []
+            chunks = [body[i:][:chunk_size] for i in range(0, len(body), chunk_size)]
+            for chunk in chunks:
+                for event, payload in scanner.feed(chunk):
+                    if event == streaming.PART_START:
+                        parts.append([payload, b""])
+                    elif event == streaming.PART_DATA:
+                        parts[-1][1] += payload
+            self.assertTrue(scanner.is_done)
+            self.assertEqual(
+                parts,
+                [
+                    [("a", None), b"1"],
+                    [("upload", "a.bin"), b"\r\n--" + b"x" * 100],
+                    [("b", None), b""],
+                ],
+            )
+
+
+class TestStreamingValidate(unittest.TestCase):
+    def setUp(self):
+        self.config = testing.setUp()
+        self.config.include("pyramid_formencode_classic")
+
+    def tearDown(self):
+        testing.tearDown()
+
+    def test_pass(self):
+        body = _multipart(
+            [
+                ("csrf_", None, b"token"),
+                ("email", None, b"a@example.com"),
+                ("upload", "a.bin", b"x" * 200000),
+            ]
+        )
+        request = _request(body)
+        (result, formStash) = pyramid_formencode_classic.form_validate(
+            request,
+            schema=Form_Upload,
+            csrf_token="token",
+            use_streaming_multipart=True,
+        )
+        self.assertTrue(result)
+        self.assertEqual(formStash.results["email"], "a@example.com")
+        self.assertEqual(formStash.results["upload"].value, b"x" * 200000)
+
+    def test_reject_field(self):
+        body = _multipart(
+            [
+                ("email", None, b"not-an-email"),
+                ("upload", "a.bin", b"x" * 200000),
+            ]
+        )
+        request = _request(body)
+        _raw = request.body_file_raw
+        (result, formStash) = pyramid_formencode_classic.form_validate(
+            request,
+            schema=Form_Upload,
+            use_streaming_multipart=True,
+        )
+        self.assertFalse(result)
+        self.assertIn("email", formStash.errors)
+        self.assertIn("Error_Main", formStash.errors)
+        self.assertEqual(formStash.defaults, {"email": "not-an-email"})
+        self.assertLess(_raw.bytes_read, len(body))
+        self.assertEqual(dict(request.POST), {"email": "not-an-email"})
+
+    def test_reject_csrf(self):
+        body = _multipart(
+            [
+                ("csrf_", None, b"wrong"),
+                ("upload", "a.bin", b"x" * 200000),
+                ("email", None, b"a@example.com"),
+            ]
+        )
+        request = _request(body)
+        _raw = request.body_file_raw
+        (result, formStash) = pyramid_formencode_classic.form_validate(
+            request,
+            schema=Form_Upload,
+            csrf_token="token",
+            use_streaming_multipart=True,
+        )
+        self.assertFalse(result)
+        self.assertTrue(formStash.is_error_csrf)
+        self.assertLess(_raw.bytes_read, len(body))
+
+    def test_state(self):
+        body = _multipart(
+            [
+                ("email", None, b"a@example.com"),
+                ("upload", "a.bin", b"x" * 100),
+            ]
+        )
+        state = _State()
+        (result, formStash) = pyramid_formencode_classic.form_validate(
+            _request(body),
+            schema=Form_UploadState,
+            state=state,
+            use_streaming_multipart=True,
+        )
+        self.assertTrue(result)
+        # streamed, then validated by the schema
+        self.assertEqual(state.seen, ["a@example.com", "a@example.com"])
@@ -1,10 +1,12 @@
 # stdlib
+import json
 from typing import Any
 from typing import Dict
 import unittest
 
 # pypi
 import formencode
+import formencode.foreach
 
 # local
 import pyramid_formencode_classic
@@ -106,3 +108,38 @@ class TestDocumentForm(unittest.TestCase):
         # import pprint
         # pprint.pprint(documented)
         self.assertEqual(documented, Form_Example__as_dict)
+
+    def test_nested(self):
+        class Form_Address(formencode.Schema):
+            street = formencode.validators.UnicodeString(not_empty=True)
+
+        class Form_Nested(formencode.Schema):
+            address = Form_Address()
+            addresses = formencode.foreach.ForEach(Form_Address())
+            tags = formencode.foreach.ForEach(
+                formencode.validators.UnicodeString(max=8)
+            )
+
+        documented = pyramid_formencode_classic.tools.document_form(Form_Nested)
+        _street = {"max": None, "min": None, "not_empty": True, "type": "UnicodeString"}
+        self.assertEqual(documented["address"]["type"], "Form_Address")
+        self.assertEqual(documented["address"]["fields"], {"street": _street})
+        self.assertEqual(documented["addresses"]["type"], "ForEach")
+        self.assertEqual(
+            documented["addresses"]["validators"][0]["fields"], {"street": _street}
+        )
+        self.assertEqual(
+            documented["tags"]["validators"],
+            [{"max": 8, "min": None, "not_empty": None, "type": "UnicodeString"}],
+        )
+
+    def test_json(self):
+        document_form_json = pyramid_formencode_classic.tools.document_form_json
+        document_form_json.cache_clear()
+        documented = document_form_json(Form_Example)
+        self.assertEqual(
+            json.loads(documented), json.loads(json.dumps(Form_Example__as_dict))
+        )
+        self.assertNotIn(" ", documented.replace("Missing value", ""))
+        self.assertIs(document_form_json(Form_Example), documented)
+        self.assertEqual(document_form_json.cache_info().hits, 1)
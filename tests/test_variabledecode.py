@@ -0,0 +1,47 @@
+# stdlib
+from typing import Dict
+from typing import List
+import unittest
+
+# pypi
+import formencode.variabledecode
+
+# local
+from pyramid_formencode_classic import variabledecode
+
+# ==============================================================================
+
+
+CASES: List[Dict] = [
+    {},
+    {"a": "1", "b": "2"},
+    {"a.b": "1", "a.c": "2", "d": "3"},
+    {"a-0": "x", "a-2": "z", "a-1": "y"},
+    {"a-1.b": "1", "a-0.b": "2", "a-0.c": "3"},
+    {"a-0": "x", "a--repetitions": "4"},
+    {"a.b-0": "x", "a.b-1": "y", "a.b--repetitions": "3"},
+    {"a": "x", "a.b": "y"},
+    {"a.b": "y", "a": "x"},
+    {"a-x": "not-an-index", "a-0": "1"},
+    {"a": ["1", "2"], "a.b": "3"},
+    {"a-0": ["1", "2"], "a-1": "3"},
+    {"a.b.c-0.d": "1", "a.b.c-1.d": "2", "a.b.c-1.e": ["3", "4"]},
+    {"row-%s.qty" % i: str(i) for i in range(250)},
+]
+
+
+class TestVariableDecode(unittest.TestCase):
+    def test_equivalence(self):
+        for case in CASES:
+            for dict_char, list_char in ((".", "-"), (":", "_")):
+                _case = {
+                    k.replace(".", dict_char).replace("-", list_char): v
+                    for k, v in case.items()
+                }
+                self.assertEqual(
+                    variabledecode.variable_decode(_case, dict_char, list_char),
+                    formencode.variabledecode.variable_decode(
+                        _case, dict_char, list_char
+                    ),
+                    _case,
+                )